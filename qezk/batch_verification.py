@@ -146,7 +146,8 @@ class BatchVerifier:
         is_valid, chsh_value = self.qezk.verify(
             proof.prover_results,
             proof.verifier_results,
-            proof.measurement_bases
+            proof.measurement_bases,
+            packed=proof.packed
         )
         
         # Cache result
@@ -405,7 +406,8 @@ class OptimizedBatchVerifier:
             is_valid, chsh_value = self.qezk.verify(
                 proof.prover_results,
                 proof.verifier_results,
-                proof.measurement_bases
+                proof.measurement_bases,
+                packed=proof.packed
             )
             
             # Cache
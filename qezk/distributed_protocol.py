@@ -4,7 +4,6 @@ Complete Distributed QE-ZK Protocol
 Full implementation of distributed QE-ZK protocol over network.
 """
 
-import json
 import socket
 import threading
 import time
@@ -15,6 +14,7 @@ from enum import Enum
 import numpy as np
 
 from .protocol import QuantumEntanglementZK, QEZKProof
+from . import serialization
 from .exceptions import ProtocolError, ConfigurationError
 
 
@@ -41,12 +41,12 @@ class ProtocolMessage:
     
     def to_json(self) -> str:
         """Serialize message to JSON"""
-        return json.dumps(asdict(self))
+        return serialization.dumps(asdict(self))
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ProtocolMessage':
         """Deserialize message from JSON"""
-        data = json.loads(json_str)
+        data = serialization.loads(json_str)
         return cls(**data)
     
     @classmethod
@@ -165,7 +165,7 @@ class DistributedProver:
             return ProtocolMessage.create(
                 MessageType.PROVER_RESULTS,
                 {
-                    'prover_results': prover_results,
+                    'prover_results': prover_results.tolist(),
                     'measurement_bases': measurement_bases,
                     'statement': statement
                 },
@@ -305,7 +305,7 @@ class DistributedVerifier:
                 MessageType.VERIFICATION_REQUEST,
                 {
                     'prover_results': prover_results,
-                    'verifier_results': verifier_results,
+                    'verifier_results': verifier_results.tolist(),
                     'measurement_bases': measurement_bases
                 },
                 self.node_id
@@ -320,7 +320,7 @@ class DistributedVerifier:
             
             # Create proof
             return QEZKProof(
-                prover_results=prover_results,
+                prover_results=np.asarray(prover_results, dtype=np.uint8),
                 verifier_results=verifier_results,
                 measurement_bases=measurement_bases,
                 chsh_value=verification_response.data['chsh_value'],
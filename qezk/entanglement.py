@@ -64,18 +64,44 @@ class EntanglementSource:
             if state_type not in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']:
                 raise ConfigurationError(f"Invalid state_type: {state_type}")
             
-            epr_pairs = []
-            for i in range(num_pairs):
-                try:
-                    bell_state = self.quantum_prep.create_bell_state(state_type)
-                    epr_pairs.append(bell_state)
-                except Exception as e:
-                    raise EntanglementError(f"Failed to generate EPR pair {i}: {str(e)}") from e
+            # Rows of one contiguous (num_pairs, 4) block, built in a single
+            # broadcast instead of one create_bell_state call per pair
+            return list(self.quantum_prep.create_bell_states(num_pairs, state_type))
             
-            if len(epr_pairs) != num_pairs:
-                raise EntanglementError(f"Generated {len(epr_pairs)} pairs, expected {num_pairs}")
+        except (ConfigurationError, EntanglementError):
+            raise
+        except Exception as e:
+            raise EntanglementError(f"EPR pair generation failed: {str(e)}") from e
+    
+    def generate_epr_pairs_bulk(self, num_pairs: int, state_type: str = 'phi_plus') -> np.ndarray:
+        """
+        Generate multiple EPR pairs as one contiguous array
+        
+        Equivalent to ``generate_epr_pairs`` but returns a single (N, 4)
+        complex array instead of a list of N separate arrays. Rows can be
+        used anywhere a list of EPR pairs is accepted.
+        
+        Args:
+            num_pairs: Number of EPR pairs to generate
+            state_type: Type of Bell state ('phi_plus', 'phi_minus', 'psi_plus', 'psi_minus')
+            
+        Returns:
+            (num_pairs, 4) complex array, one Bell state per row
+            
+        Raises:
+            EntanglementError: If EPR pair generation fails
+            ConfigurationError: If parameters are invalid
+        """
+        try:
+            # Input validation
+            if num_pairs < 1:
+                raise ConfigurationError(f"num_pairs must be >= 1, got {num_pairs}")
+            if num_pairs > 1000000:
+                raise ConfigurationError(f"num_pairs too large: {num_pairs}. Maximum: 1000000")
+            if state_type not in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']:
+                raise ConfigurationError(f"Invalid state_type: {state_type}")
             
-            return epr_pairs
+            return self.quantum_prep.create_bell_states(num_pairs, state_type)
             
         except (ConfigurationError, EntanglementError):
             raise
@@ -5,10 +5,16 @@ Abstract interface for real quantum hardware integration.
 Supports multiple quantum computing backends (IBM Q, Google Quantum AI, Rigetti, etc.)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Tuple
 import numpy as np
 from .exceptions import QuantumStateError, EntanglementError, MeasurementError
+from .quantum_state import QuantumStatePreparation
+
+
+# Shared preparer for the simulated Bell states; it holds no state
+_STATE_PREPARATION = QuantumStatePreparation()
 
 
 class QuantumHardwareBackend(ABC):
@@ -31,6 +37,28 @@ class QuantumHardwareBackend(ABC):
         """
         pass
     
+    def create_bell_states(self, num_states: int, state_type: str = 'phi_plus') -> np.ndarray:
+        """
+        Create many copies of a Bell state
+        
+        The default prepares each state separately. Backends that can
+        produce a whole batch in one call should override this. Either way
+        the backend is left prepared in the Bell state, as after
+        ``create_bell_state``.
+        
+        Args:
+            num_states: Number of states to create
+            state_type: Type of Bell state ('phi_plus', 'phi_minus', 'psi_plus', 'psi_minus')
+            
+        Returns:
+            (num_states, 4) complex array with one Bell state per row
+        """
+        states = np.empty((num_states, 4), dtype=complex)
+        for i in range(num_states):
+            self.reset()
+            states[i] = self.create_bell_state(state_type)
+        return states
+    
     @abstractmethod
     def measure(self, qubit_index: int, basis: str) -> int:
         """
@@ -45,6 +73,64 @@ class QuantumHardwareBackend(ABC):
         """
         pass
     
+    def measure_batch(self, qubit_index: int, basis: str, shots: int) -> np.ndarray:
+        """
+        Measure qubit repeatedly in specified basis
+        
+        The default calls ``measure`` once per shot. Backends that can run
+        many shots in one call should override this.
+        
+        Args:
+            qubit_index: Index of qubit to measure
+            basis: Measurement basis ('Z', 'X', or 'Y')
+            shots: Number of measurements
+            
+        Returns:
+            ``uint8`` array of ``shots`` measurement results (0 or 1)
+        """
+        results = np.empty(shots, dtype=np.uint8)
+        for i in range(shots):
+            results[i] = self.measure(qubit_index, basis)
+        return results
+    
+    async def measure_async(self, qubit_index: int, basis: str) -> int:
+        """
+        Measure qubit in specified basis without blocking the event loop
+        
+        The default runs ``measure`` in the loop's default executor, so
+        shots against a remote backend overlap their network latency.
+        Backends with a native asynchronous API should override this.
+        
+        Args:
+            qubit_index: Index of qubit to measure
+            basis: Measurement basis ('Z', 'X', or 'Y')
+            
+        Returns:
+            Measurement result (0 or 1)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.measure, qubit_index, basis)
+    
+    async def measure_batch_async(self, qubit_index: int, basis: str, shots: int) -> np.ndarray:
+        """
+        Asynchronous ``measure_batch``
+        
+        The default submits every shot through ``measure_async`` at once
+        and waits for all of them.
+        
+        Args:
+            qubit_index: Index of qubit to measure
+            basis: Measurement basis ('Z', 'X', or 'Y')
+            shots: Number of measurements
+            
+        Returns:
+            ``uint8`` array of ``shots`` measurement results (0 or 1)
+        """
+        results = await asyncio.gather(
+            *[self.measure_async(qubit_index, basis) for _ in range(shots)]
+        )
+        return np.array(results, dtype=np.uint8)
+    
     @abstractmethod
     def apply_gate(self, gate_name: str, qubit_index: int) -> None:
         """
@@ -106,63 +192,60 @@ class SimulationBackend(QuantumHardwareBackend):
         ], dtype=complex)
     
     def create_bell_state(self, state_type: str = 'phi_plus') -> np.ndarray:
-        """Create Bell state (simulation)"""
-        self.state = np.array([1, 0, 0, 0], dtype=complex)
-        
-        # Apply Hadamard to first qubit
-        H_full = np.kron(self.H, self.I)
-        self.state = H_full @ self.state
-        
-        # Apply CNOT
-        self.state = self.CNOT @ self.state
-        
-        # Apply additional gates for other Bell states
-        if state_type == 'phi_minus':
-            Z_full = np.kron(self.Z, self.I)
-            self.state = Z_full @ self.state
-        elif state_type == 'psi_plus':
-            X_full = np.kron(self.X, self.I)
-            self.state = X_full @ self.state
-        elif state_type == 'psi_minus':
-            Y_full = np.kron(self.Y, self.I)
-            self.state = Y_full @ self.state
+        """
+        Create Bell state (simulation)
         
+        The state CNOT(H ⊗ I)|00⟩, followed by Z, X or Y on the first qubit,
+        is constant, so it is copied from a precomputed table rather than
+        simulated gate by gate. The backend's state is a fresh copy, so
+        modifying it or the returned array does not affect the table.
+        Unknown types give |Φ⁺⟩.
+        """
+        self.state = _STATE_PREPARATION.create_bell_state(state_type)
         return self.state
     
-    def measure(self, qubit_index: int, basis: str) -> int:
-        """Measure qubit in specified basis (simulation)"""
+    def create_bell_states(self, num_states: int, state_type: str = 'phi_plus') -> np.ndarray:
+        """Create many copies of a Bell state (simulation), preparing it once"""
+        bell_state = self.create_bell_state(state_type)
+        return np.broadcast_to(bell_state, (num_states, 4)).copy()
+    
+    def _zero_probability(self, qubit_index: int, basis: str) -> float:
+        """Probability of measuring 0 on a qubit in the given basis"""
         if basis == 'Z':
             # Standard computational basis
-            if qubit_index == 0:
-                prob_0 = np.abs(self.state[0])**2 + np.abs(self.state[1])**2
-            else:
-                prob_0 = np.abs(self.state[0])**2 + np.abs(self.state[2])**2
-            
-            result = 0 if np.random.random() < prob_0 else 1
-            
-        elif basis == 'X':
-            # Hadamard basis
-            # Apply Hadamard before measurement
+            state = self.state
+        elif basis in ('X', 'Y'):
+            # Hadamard basis: apply Hadamard before measurement. The Y basis
+            # (S gate + Hadamard) is simplified to the X basis approximation
             if qubit_index == 0:
                 H_full = np.kron(self.H, self.I)
-                temp_state = H_full @ self.state
-                prob_0 = np.abs(temp_state[0])**2 + np.abs(temp_state[1])**2
             else:
                 H_full = np.kron(self.I, self.H)
-                temp_state = H_full @ self.state
-                prob_0 = np.abs(temp_state[0])**2 + np.abs(temp_state[2])**2
-            
-            result = 0 if np.random.random() < prob_0 else 1
-            
-        elif basis == 'Y':
-            # Y basis (requires S gate + Hadamard)
-            # Simplified: use X basis approximation
-            result = self.measure(qubit_index, 'X')
-            
+            state = H_full @ self.state
         else:
             raise MeasurementError(f"Unknown basis: {basis}")
         
-        return result
+        if qubit_index == 0:
+            return np.abs(state[0])**2 + np.abs(state[1])**2
+        return np.abs(state[0])**2 + np.abs(state[2])**2
+    
+    def measure(self, qubit_index: int, basis: str) -> int:
+        """Measure qubit in specified basis (simulation)"""
+        prob_0 = self._zero_probability(qubit_index, basis)
+        return 0 if np.random.random() < prob_0 else 1
+    
+    def measure_batch(self, qubit_index: int, basis: str, shots: int) -> np.ndarray:
+        """Measure qubit repeatedly in specified basis (simulation), drawing all shots at once"""
+        prob_0 = self._zero_probability(qubit_index, basis)
+        return (np.random.random(shots) >= prob_0).astype(np.uint8)
+    
+    async def measure_async(self, qubit_index: int, basis: str) -> int:
+        """Measure qubit in specified basis (simulation); local, so no executor hop"""
+        return self.measure(qubit_index, basis)
+    
+    async def measure_batch_async(self, qubit_index: int, basis: str, shots: int) -> np.ndarray:
+        """Measure qubit repeatedly in specified basis (simulation); local, so no executor hop"""
+        return self.measure_batch(qubit_index, basis, shots)
     
     def apply_gate(self, gate_name: str, qubit_index: int) -> None:
         """Apply quantum gate (simulation)"""
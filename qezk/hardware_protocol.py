@@ -4,6 +4,7 @@ Hardware-Integrated QE-ZK Protocol
 Protocol implementation that uses real quantum hardware backends.
 """
 
+import numpy as np
 from typing import Optional
 from .protocol import QuantumEntanglementZK, QEZKProof
 from .hardware_interface import HardwareInterface, QuantumHardwareBackend
@@ -99,15 +100,14 @@ class HardwareQEZK(QuantumEntanglementZK):
         measurement_bases = self.encoder.statement_to_bases(statement, len(prover_particles))
         
         # Apply gates and measure using hardware
-        measurement_results = []
+        measurement_results = np.empty(len(prover_particles), dtype=np.uint8)
         for i, (particle, basis) in enumerate(zip(prover_particles, measurement_bases)):
             # Apply witness-encoded gates
             for gate_name in gate_sequence:
                 self.hardware.apply_quantum_gate(gate_name, 0)  # Apply to first qubit
             
             # Measure using hardware
-            result = self.hardware.measure_particle(0, basis)
-            measurement_results.append(result)
+            measurement_results[i] = self.hardware.measure_particle(0, basis)
             
             # Reset for next particle (if needed)
             if i < len(prover_particles) - 1:
@@ -115,14 +115,13 @@ class HardwareQEZK(QuantumEntanglementZK):
         
         return measurement_results, measurement_bases
     
-    def _verifier_phase_hardware(self, verifier_particles, measurement_bases) -> list:
+    def _verifier_phase_hardware(self, verifier_particles, measurement_bases) -> np.ndarray:
         """Verifier phase using hardware"""
-        measurement_results = []
+        measurement_results = np.empty(len(verifier_particles), dtype=np.uint8)
         
         for i, (particle, basis) in enumerate(zip(verifier_particles, measurement_bases)):
             # Measure using hardware (second qubit)
-            result = self.hardware.measure_particle(1, basis)
-            measurement_results.append(result)
+            measurement_results[i] = self.hardware.measure_particle(1, basis)
             
             # Reset for next particle (if needed)
             if i < len(verifier_particles) - 1:
@@ -24,6 +24,14 @@ class BellMeasurement:
         self.z_basis = np.array([[1, 0], [0, 1]], dtype=complex)  # Computational basis
         self.x_basis = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)  # Hadamard basis
         self.y_basis = np.array([[1, 1j], [1, -1j]], dtype=complex) / np.sqrt(2)  # Circular basis
+        
+        # Two-qubit basis rotations (basis ⊗ I), built once and reused by every
+        # measurement. The Z basis needs no rotation.
+        self._basis_rotations = {
+            'Z': None,
+            'X': np.kron(self.x_basis, np.eye(2)),
+            'Y': np.kron(self.y_basis, np.eye(2)),
+        }
     
     def measure(self, state: np.ndarray, basis: str) -> int:
         """
@@ -36,32 +44,81 @@ class BellMeasurement:
         Returns:
             Measurement outcome: 0 or 1
         """
-        if basis == 'Z':
-            # Computational basis measurement
-            # Probability of |0⟩ is sum of |00⟩ and |01⟩ amplitudes squared
-            prob_0 = np.abs(state[0])**2 + np.abs(state[2])**2
-            outcome = 0 if np.random.random() < prob_0 else 1
-            
-        elif basis == 'X':
-            # Hadamard basis measurement
-            # Transform to X-basis
-            x_basis_full = np.kron(self.x_basis, np.eye(2))
-            transformed = x_basis_full @ state
-            prob_0 = np.abs(transformed[0])**2 + np.abs(transformed[2])**2
-            outcome = 0 if np.random.random() < prob_0 else 1
+        if basis not in self._basis_rotations:
+            raise MeasurementError(f"Unknown basis: {basis}. Must be 'Z', 'X', or 'Y'")
+        
+        rotation = self._basis_rotations[basis]
+        if rotation is not None:
+            # Transform to X- or Y-basis
+            state = rotation @ state
+        
+        # Probability of |0⟩ is sum of |00⟩ and |01⟩ amplitudes squared
+        prob_0 = np.abs(state[0])**2 + np.abs(state[2])**2
+        outcome = 0 if np.random.random() < prob_0 else 1
+        
+        return outcome
+    
+    def zero_probabilities(self, states: np.ndarray, bases: List[str]) -> np.ndarray:
+        """
+        Probability of outcome 0 for each state in its measurement basis
+        
+        Rotates each basis group with a single matrix product, using the
+        same rotations as ``measure``.
+        
+        Args:
+            states: (N, 4) array of 2-qubit states
+            bases: Measurement basis for each state ('Z', 'X', or 'Y')
             
-        elif basis == 'Y':
-            # Circular basis measurement
-            # Transform to Y-basis
-            y_basis_full = np.kron(self.y_basis, np.eye(2))
-            transformed = y_basis_full @ state
-            prob_0 = np.abs(transformed[0])**2 + np.abs(transformed[2])**2
-            outcome = 0 if np.random.random() < prob_0 else 1
+        Returns:
+            Array of N probabilities
             
-        else:
+        Raises:
+            MeasurementError: If the states or bases are invalid
+        """
+        states = np.asarray(states)
+        bases = np.asarray(bases)
+        if states.ndim != 2 or states.shape[1] != 4:
+            raise MeasurementError(f"States must have shape (N, 4), got {states.shape}")
+        if bases.shape != (len(states),):
+            raise MeasurementError(f"Expected {len(states)} bases, got shape {bases.shape}")
+        
+        prob_0 = np.empty(len(states))
+        covered = np.zeros(len(states), dtype=bool)
+        for basis, rotation in self._basis_rotations.items():
+            mask = bases == basis
+            if not mask.any():
+                continue
+            covered |= mask
+            group = states[mask]
+            if rotation is not None:
+                group = group @ rotation.T
+            prob_0[mask] = np.abs(group[:, 0])**2 + np.abs(group[:, 2])**2
+        
+        if not covered.all():
+            basis = bases[np.argmin(covered)]
             raise MeasurementError(f"Unknown basis: {basis}. Must be 'Z', 'X', or 'Y'")
         
-        return outcome
+        return prob_0
+    
+    def measure_batch(self, states: np.ndarray, bases: List[str]) -> np.ndarray:
+        """
+        Quantum measurement of many states at once
+        
+        Equivalent to calling ``measure`` on each state in order, including
+        consumption of the random number stream.
+        
+        Args:
+            states: (N, 4) array of 2-qubit states
+            bases: Measurement basis for each state ('Z', 'X', or 'Y')
+            
+        Returns:
+            ``uint8`` array of N measurement outcomes
+            
+        Raises:
+            MeasurementError: If the states or bases are invalid
+        """
+        prob_0 = self.zero_probabilities(states, bases)
+        return (np.random.random(len(prob_0)) >= prob_0).astype(np.uint8)
     
     def bell_state_measurement(self, state: np.ndarray) -> Tuple[str, float]:
         """
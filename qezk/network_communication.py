@@ -14,7 +14,7 @@ import hmac
 from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
 from enum import Enum
-import json
+from . import serialization
 from .exceptions import ProtocolError, SecurityError
 
 
@@ -187,7 +187,7 @@ class SecureConnection:
     
     def send_json(self, data: Dict[str, Any]) -> bool:
         """Send JSON data"""
-        json_str = json.dumps(data)
+        json_str = serialization.dumps(data)
         return self.send(json_str.encode())
     
     def receive_json(self) -> Optional[Dict[str, Any]]:
@@ -195,8 +195,8 @@ class SecureConnection:
         data = self.receive()
         if data:
             try:
-                return json.loads(data.decode())
-            except json.JSONDecodeError:
+                return serialization.loads(data)
+            except serialization.JSONDecodeError:
                 pass
         return None
     
@@ -498,13 +498,13 @@ class NetworkServer:
                     break
                 
                 try:
-                    message = json.loads(data.decode())
+                    message = serialization.loads(data)
                     response = self.handler(message)
                     
                     if response:
-                        client_socket.sendall(json.dumps(response).encode())
+                        client_socket.sendall(serialization.dumps(response).encode())
                         
-                except json.JSONDecodeError:
+                except serialization.JSONDecodeError:
                     pass
                     
         except Exception as e:
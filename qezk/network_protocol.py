@@ -5,7 +5,6 @@ Network protocol for distributed QE-ZK execution.
 Enables Prover and Verifier to communicate over network.
 """
 
-import json
 import socket
 import threading
 import time
@@ -13,6 +12,7 @@ from typing import Dict, Any, Optional, List, Tuple, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 from .protocol import QuantumEntanglementZK, QEZKProof
+from . import serialization
 from .exceptions import ProtocolError, ConfigurationError
 
 
@@ -39,12 +39,12 @@ class ProtocolMessage:
     
     def to_json(self) -> str:
         """Serialize message to JSON"""
-        return json.dumps(asdict(self))
+        return serialization.dumps(asdict(self))
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ProtocolMessage':
         """Deserialize message from JSON"""
-        data = json.loads(json_str)
+        data = serialization.loads(json_str)
         return cls(**data)
 
 
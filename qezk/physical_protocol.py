@@ -4,6 +4,7 @@ Physical Protocol with Measurement Apparatus
 QE-ZK protocol implementation using physical measurement apparatus.
 """
 
+import numpy as np
 from typing import Optional
 from .protocol import QuantumEntanglementZK, QEZKProof
 from .physical_measurement import (
@@ -107,7 +108,7 @@ class PhysicalQEZK(QuantumEntanglementZK):
         measurement_bases = self.encoder.statement_to_bases(statement, len(prover_particles))
         
         # Apply gates and measure using physical apparatus
-        measurement_results = []
+        measurement_results = np.empty(len(prover_particles), dtype=np.uint8)
         for i, (particle, basis) in enumerate(zip(prover_particles, measurement_bases)):
             # Apply witness-encoded gates
             for gate_name in gate_sequence:
@@ -121,13 +122,13 @@ class PhysicalQEZK(QuantumEntanglementZK):
                 # Fallback to simulation
                 result = self.measurement.measure(particle, basis)
             
-            measurement_results.append(result)
+            measurement_results[i] = result
         
         return measurement_results, measurement_bases
     
-    def _verifier_phase_physical(self, verifier_particles, measurement_bases) -> list:
+    def _verifier_phase_physical(self, verifier_particles, measurement_bases) -> np.ndarray:
         """Verifier phase using physical measurement apparatus"""
-        measurement_results = []
+        measurement_results = np.empty(len(verifier_particles), dtype=np.uint8)
         
         for i, (particle, basis) in enumerate(zip(verifier_particles, measurement_bases)):
             # Measure using physical apparatus
@@ -137,7 +138,7 @@ class PhysicalQEZK(QuantumEntanglementZK):
                 # Fallback to simulation
                 result = self.measurement.measure(particle, basis)
             
-            measurement_results.append(result)
+            measurement_results[i] = result
         
         return measurement_results
     
@@ -56,7 +56,7 @@ class SimpleAggregationStrategy(AggregationStrategy):
         # Hash all results
         import hashlib
         all_results = ''.join(
-            ''.join(str(r) for r in p.prover_results[:8]) for p in proofs
+            ''.join(str(r) for r in p.prover_outcomes(8)) for p in proofs
         )
         hash_bits = ''.join(
             format(b, '08b') for b in hashlib.sha256(all_results.encode()).digest()[:4]
@@ -133,7 +133,7 @@ class SelectiveAggregationStrategy(AggregationStrategy):
         
         import hashlib
         all_results = ''.join(
-            ''.join(str(r) for r in p.prover_results[:8]) for p in valid_proofs
+            ''.join(str(r) for r in p.prover_outcomes(8)) for p in valid_proofs
         )
         hash_bits = ''.join(
             format(b, '08b') for b in hashlib.sha256(all_results.encode()).digest()[:4]
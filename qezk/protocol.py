@@ -5,8 +5,9 @@ This module provides the complete Quantum Entanglement Zero-Knowledge protocol.
 """
 
 import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 from .quantum_state import QuantumStatePreparation
 from .entanglement import EntanglementSource
 from .measurement import BellMeasurement
@@ -18,19 +19,124 @@ from .exceptions import (
 )
 
 
+_VALID_BASES = frozenset(('Z', 'X', 'Y'))
+_VALID_BASES_ARRAY = np.array(sorted(_VALID_BASES))
+
+# Specialized provers kept per instance by compile_for (least recently
+# used first out); each holds a num_epr_pairs-long basis schedule
+_COMPILED_PROVER_CACHE_SIZE = 32
+
+# Minimum proof size for which the CuPy backend runs on the GPU
+_DEVICE_MIN_EPR_PAIRS = 10000
+
+# Number of result pairs sampled by the fast-reject check, and the sampled
+# correlation below which a proof is rejected outright. With 8192 samples,
+# Hoeffding's bound puts the chance of a sample correlation below 0.5 for a
+# proof whose full correlation exceeds 0.7 below 1e-280.
+_FAST_REJECT_SAMPLE = 8192
+_FAST_REJECT_CORRELATION = 0.5
+
+
 @dataclass
 class QEZKProof:
     """
     QE-ZK proof data structure
     
     Contains all information about a generated proof.
+    
+    Measurement results are stored as ``uint8`` arrays (one outcome per
+    element). When ``packed`` is True they are bit-packed with
+    ``np.packbits`` and hold one outcome per bit; the number of outcomes
+    is ``len(measurement_bases)``.
     """
-    prover_results: List[int]
-    verifier_results: List[int]
+    prover_results: np.ndarray
+    verifier_results: np.ndarray
     measurement_bases: List[str]
     chsh_value: float
     is_valid: bool
     statement: str
+    packed: bool = False
+    
+    def prover_outcomes(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Leading prover measurement outcomes, unpacked if stored bit-packed
+        
+        Args:
+            count: Number of outcomes to return (None = all)
+            
+        Returns:
+            The first ``count`` prover outcomes, one per element
+        """
+        if not self.packed:
+            return self.prover_results[:count]
+        num_results = len(self.measurement_bases)
+        if count is not None:
+            num_results = min(count, num_results)
+        packed_results = np.asarray(self.prover_results, dtype=np.uint8)
+        return np.unpackbits(packed_results[:(num_results + 7) // 8], count=num_results)
+
+
+def _results_array(results, num_results: int, packed: bool, name: str) -> np.ndarray:
+    """
+    Convert measurement results to an unpacked ``uint8`` array
+    
+    Args:
+        results: Results as a list, ``uint8`` array or bit-packed array
+        num_results: Expected number of outcomes
+        packed: Whether ``results`` is bit-packed
+        name: Owner of the results, used in error messages
+        
+    Returns:
+        ``uint8`` array of length ``num_results``
+        
+    Raises:
+        VerificationError: If the results are malformed
+    """
+    if packed:
+        packed_results = np.asarray(results, dtype=np.uint8)
+        if packed_results.size * 8 < num_results:
+            raise VerificationError(
+                f"Packed {name} results too short for {num_results} measurements"
+            )
+        return np.unpackbits(packed_results, count=num_results)
+    
+    array = np.asarray(results)
+    if array.dtype == np.uint8 or array.dtype == np.bool_:
+        invalid = array > 1
+    elif np.issubdtype(array.dtype, np.integer):
+        invalid = (array != 0) & (array != 1)
+    else:
+        invalid = np.array([result not in (0, 1) for result in array.tolist()], dtype=bool)
+    if invalid.any():
+        index = int(np.argmax(invalid))
+        raise VerificationError(f"Invalid {name} result at index {index}: {array[index]}")
+    return array.astype(np.uint8, copy=False)
+
+
+def _chsh_fast(mismatches: np.ndarray, bases: np.ndarray) -> float:
+    """
+    CHSH value for results measured in identical Alice/Bob bases
+    
+    Equivalent to ``BellMeasurement.chsh_inequality_test`` with
+    ``alice_bases == bob_bases``: only the E(Z,Z) and E(X,X) correlators
+    are populated, so S = E(Z,Z) + E(X,X).
+    
+    Args:
+        mismatches: ``uint8`` array, 1 where prover and verifier results differ
+        bases: Array of measurement bases ('Z', 'X', 'Y')
+        
+    Returns:
+        |S|
+    """
+    # E = 1 - 2 * (disagreements / shots), with both counts taken as
+    # popcounts of the 0/1 arrays rather than a float reduction
+    S = 0.0
+    for basis in ('Z', 'X'):
+        mask = bases == basis
+        shots = np.count_nonzero(mask)
+        if shots:
+            S += 1.0 - 2.0 * np.count_nonzero(mismatches & mask) / shots
+    return abs(S)
 
 
 class QuantumEntanglementZK:
@@ -41,7 +147,9 @@ class QuantumEntanglementZK:
     verifier phase, and verification.
     """
     
-    def __init__(self, num_epr_pairs: int = 10000, chsh_threshold: float = 2.2):
+    def __init__(self, num_epr_pairs: int = 10000, chsh_threshold: float = 2.2,
+                 pack_results: bool = False, tile_size: int = 8192,
+                 backend: str = 'numpy', fast_reject: bool = False):
         """
         Initialize QE-ZK system
         
@@ -49,6 +157,14 @@ class QuantumEntanglementZK:
             num_epr_pairs: Number of EPR pairs to use (default: 10000)
             chsh_threshold: CHSH value threshold for verification (default: 2.2)
                            Classical bound: 2.0, Quantum bound: 2.828
+            pack_results: Whether proofs store bit-packed results (default: False)
+            tile_size: Number of EPR pairs generated and measured at a time
+                       by prove() (default: 8192)
+            backend: Array backend for prove(), 'numpy' or 'cupy' (default: 'numpy').
+                     The CuPy backend runs tiles on the GPU when
+                     num_epr_pairs >= 10000 and falls back to NumPy otherwise.
+            fast_reject: Whether verify() may reject from a random sample of
+                         results before the full CHSH pass (default: False)
                            
         Raises:
             ConfigurationError: If parameters are invalid
@@ -60,9 +176,27 @@ class QuantumEntanglementZK:
             raise ConfigurationError(f"num_epr_pairs too large: {num_epr_pairs}. Maximum: 1000000")
         if chsh_threshold < 0 or chsh_threshold > 3.0:
             raise ConfigurationError(f"chsh_threshold must be between 0 and 3.0, got {chsh_threshold}")
+        if tile_size < 1:
+            raise ConfigurationError(f"tile_size must be >= 1, got {tile_size}")
+        if backend not in ('numpy', 'cupy'):
+            raise ConfigurationError(f"backend must be 'numpy' or 'cupy', got {backend}")
         
         self.num_epr_pairs = num_epr_pairs
         self.chsh_threshold = chsh_threshold
+        self.pack_results = pack_results
+        self.tile_size = tile_size
+        self.fast_reject = fast_reject
+        self._compiled_provers = OrderedDict()
+        self._reject_rng = np.random.default_rng()
+        
+        self.backend = backend
+        self._xp = np
+        if backend == 'cupy':
+            try:
+                import cupy
+            except ImportError:
+                raise ConfigurationError("CuPy not installed. Install with: pip install cupy")
+            self._xp = cupy
         
         # Initialize components
         self.quantum_prep = QuantumStatePreparation()
@@ -70,7 +204,22 @@ class QuantumEntanglementZK:
         self.measurement = BellMeasurement()
         self.encoder = WitnessEncoder(self.quantum_prep)
     
-    def setup(self, seed: Optional[int] = None) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return picklable state, e.g. for process pools (drops the array module and compiled provers)"""
+        state = self.__dict__.copy()
+        del state['_xp']
+        state['_compiled_provers'] = OrderedDict()
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore state and re-import the array backend"""
+        self.__dict__.update(state)
+        self._xp = np
+        if self.backend == 'cupy':
+            import cupy
+            self._xp = cupy
+    
+    def setup(self, seed: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Protocol setup phase
         
@@ -80,29 +229,25 @@ class QuantumEntanglementZK:
             seed: Optional random seed for reproducibility
             
         Returns:
-            Tuple of (prover_particles, verifier_particles)
+            Tuple of (prover_particles, verifier_particles), each an (N, 4)
+            array with one EPR pair per row
             
         Raises:
             EntanglementError: If EPR pair generation fails
         """
         try:
-            if seed is not None:
-                if not isinstance(seed, int):
-                    raise ConfigurationError(f"seed must be an integer, got {type(seed)}")
-                self.entanglement.set_seed(seed)
+            self._set_seed(seed)
             
             # Generate EPR pairs
-            epr_pairs = self.entanglement.generate_epr_pairs(self.num_epr_pairs)
+            epr_pairs = self.entanglement.generate_epr_pairs_bulk(self.num_epr_pairs)
             
-            if len(epr_pairs) != self.num_epr_pairs:
-                raise EntanglementError(f"Expected {self.num_epr_pairs} EPR pairs, got {len(epr_pairs)}")
+            if __debug__:
+                if len(epr_pairs) != self.num_epr_pairs:
+                    raise EntanglementError(f"Expected {self.num_epr_pairs} EPR pairs, got {len(epr_pairs)}")
             
             # Split between Prover and Verifier
             prover_particles, verifier_particles = self.entanglement.split_epr_pairs(epr_pairs)
             
-            if len(prover_particles) != self.num_epr_pairs or len(verifier_particles) != self.num_epr_pairs:
-                raise EntanglementError("EPR pair splitting failed")
-            
             return prover_particles, verifier_particles
             
         except Exception as e:
@@ -110,8 +255,86 @@ class QuantumEntanglementZK:
                 raise
             raise EntanglementError(f"Setup failed: {str(e)}") from e
     
+    @classmethod
+    def _check_statement_witness(cls, statement: str, witness: str):
+        """
+        Validate the statement and witness passed to the protocol entry points
+        
+        Raises:
+            ProtocolError: If statement is not a non-empty string or witness
+                           is not a string
+        """
+        cls._check_statement(statement)
+        cls._check_witness(witness)
+    
+    @staticmethod
+    def _check_statement(statement: str):
+        """Raise ProtocolError unless statement is a non-empty string"""
+        if not isinstance(statement, str) or len(statement) == 0:
+            raise ProtocolError("statement must be a non-empty string")
+    
+    @staticmethod
+    def _check_witness(witness: str):
+        """Raise ProtocolError unless witness is a string"""
+        if not isinstance(witness, str):
+            raise ProtocolError("witness must be a string")
+    
+    def _set_seed(self, seed: Optional[int]):
+        """Seed the entanglement source if a seed is given"""
+        if seed is not None:
+            if not isinstance(seed, int):
+                raise ConfigurationError(f"seed must be an integer, got {type(seed)}")
+            self.entanglement.set_seed(seed)
+            if self._xp is not np:
+                self._xp.random.seed(seed)
+    
+    def _measure_prover(self, prover_particles: List[np.ndarray], measurement_bases: List[str],
+                        gate_sequence: List[str], out: np.ndarray, offset: int = 0):
+        """
+        Apply the witness circuit to prover particles and measure them into ``out``
+        
+        Args:
+            prover_particles: Prover's particles
+            measurement_bases: Basis for each particle
+            gate_sequence: Witness-encoded gate sequence
+            out: ``uint8`` array receiving one outcome per particle
+            offset: Index of the first particle within the whole proof
+            
+        Raises:
+            MeasurementError: If measurement fails
+        """
+        num_particles = len(out)
+        try:
+            states = np.asarray(prover_particles[:num_particles], dtype=complex)
+        except (ValueError, TypeError):
+            states = None
+        
+        if states is not None and states.shape == (num_particles, 4):
+            # Apply witness-encoded operations as one composed unitary
+            transformed = self.encoder.apply_circuit_batch(states, gate_sequence)
+        else:
+            # Malformed particles: apply per particle to report the failing index
+            transformed = np.empty((num_particles, 4), dtype=complex)
+            i = 0
+            try:
+                for i, particle in enumerate(prover_particles[:num_particles]):
+                    transformed[i] = self.encoder.apply_circuit(particle, gate_sequence)
+            except Exception as e:
+                raise MeasurementError(f"Measurement failed at index {offset + i}: {str(e)}") from e
+        
+        # Measure in specified bases
+        out[:] = self.measurement.measure_batch(transformed, measurement_bases[:num_particles])
+    
+    def _measure_verifier(self, verifier_particles: List[np.ndarray],
+                          measurement_bases: List[str], out: np.ndarray):
+        """Measure verifier particles into ``out`` in the given bases"""
+        num_particles = len(out)
+        out[:] = self.measurement.measure_batch(
+            np.asarray(verifier_particles[:num_particles]), measurement_bases[:num_particles]
+        )
+    
     def prover_phase(self, statement: str, witness: str, 
-                    prover_particles: List[np.ndarray]) -> Tuple[List[int], List[str]]:
+                    prover_particles: List[np.ndarray]) -> Tuple[np.ndarray, List[str]]:
         """
         Prover's computation phase
         
@@ -124,7 +347,8 @@ class QuantumEntanglementZK:
             prover_particles: Prover's share of EPR pairs
             
         Returns:
-            Tuple of (measurement_results, measurement_bases)
+            Tuple of (measurement_results, measurement_bases), where
+            measurement_results is a ``uint8`` array
             
         Raises:
             ProtocolError: If prover phase fails
@@ -133,10 +357,7 @@ class QuantumEntanglementZK:
         """
         try:
             # Input validation
-            if not isinstance(statement, str) or len(statement) == 0:
-                raise ProtocolError("statement must be a non-empty string")
-            if not isinstance(witness, str):
-                raise ProtocolError("witness must be a string")
+            self._check_statement_witness(statement, witness)
             if len(prover_particles) == 0:
                 raise ProtocolError("prover_particles cannot be empty")
             
@@ -146,24 +367,14 @@ class QuantumEntanglementZK:
             # Get measurement bases from statement
             measurement_bases = self.encoder.statement_to_bases(statement, len(prover_particles))
             
-            if len(measurement_bases) != len(prover_particles):
-                raise ProtocolError("Measurement bases length mismatch")
+            if __debug__:
+                if len(measurement_bases) != len(prover_particles):
+                    raise ProtocolError("Measurement bases length mismatch")
             
             # Apply quantum operations and measure
-            measurement_results = []
-            for i, (particle, basis) in enumerate(zip(prover_particles, measurement_bases)):
-                try:
-                    # Apply witness-encoded operations
-                    transformed_particle = self.encoder.apply_circuit(particle, gate_sequence)
-                    
-                    # Measure in specified basis
-                    result = self.measurement.measure(transformed_particle, basis)
-                    measurement_results.append(result)
-                except Exception as e:
-                    raise MeasurementError(f"Measurement failed at index {i}: {str(e)}") from e
-            
-            if len(measurement_results) != len(prover_particles):
-                raise ProtocolError("Measurement results length mismatch")
+            measurement_results = np.empty(len(prover_particles), dtype=np.uint8)
+            self._measure_prover(prover_particles, measurement_bases, gate_sequence,
+                                 measurement_results)
             
             return measurement_results, measurement_bases
             
@@ -173,7 +384,7 @@ class QuantumEntanglementZK:
             raise ProtocolError(f"Prover phase failed: {str(e)}") from e
     
     def verifier_phase(self, statement: str, verifier_particles: List[np.ndarray], 
-                      measurement_bases: List[str]) -> List[int]:
+                      measurement_bases: List[str]) -> np.ndarray:
         """
         Verifier's computation phase
         
@@ -185,30 +396,32 @@ class QuantumEntanglementZK:
             measurement_bases: Bases used by Prover (must match)
             
         Returns:
-            List of measurement results
+            ``uint8`` array of measurement results
         """
         # Measure in same bases as prover
-        measurement_results = []
-        for particle, basis in zip(verifier_particles, measurement_bases):
-            result = self.measurement.measure(particle, basis)
-            measurement_results.append(result)
+        measurement_results = np.empty(min(len(verifier_particles), len(measurement_bases)),
+                                       dtype=np.uint8)
+        self._measure_verifier(verifier_particles, measurement_bases, measurement_results)
         
         return measurement_results
     
-    def verify(self, prover_results: List[int], verifier_results: List[int],
-              measurement_bases: List[str]) -> Tuple[bool, float]:
+    def verify(self, prover_results: np.ndarray, verifier_results: np.ndarray,
+              measurement_bases: List[str], packed: bool = False) -> Tuple[bool, float]:
         """
         Verification using CHSH inequality
         
         Verifies that entanglement was preserved and measurements are consistent.
         
         Args:
-            prover_results: Prover's measurement results
-            verifier_results: Verifier's measurement results
+            prover_results: Prover's measurement results (list or ``uint8`` array)
+            verifier_results: Verifier's measurement results (list or ``uint8`` array)
             measurement_bases: Measurement bases used
+            packed: Whether the results are bit-packed with ``np.packbits``
             
         Returns:
-            Tuple of (is_valid, chsh_value)
+            Tuple of (is_valid, chsh_value). With ``fast_reject`` enabled,
+            a proof rejected from the sampled correlation returns
+            (False, nan).
             
         Raises:
             VerificationError: If verification fails
@@ -220,36 +433,36 @@ class QuantumEntanglementZK:
                     f"Results length mismatch: prover={len(prover_results)}, "
                     f"verifier={len(verifier_results)}"
                 )
-            if len(prover_results) != len(measurement_bases):
+            if not packed and len(prover_results) != len(measurement_bases):
                 raise VerificationError(
                     f"Bases length mismatch: results={len(prover_results)}, "
                     f"bases={len(measurement_bases)}"
                 )
-            if len(prover_results) == 0:
+            if len(measurement_bases) == 0:
                 raise VerificationError("Cannot verify empty results")
             
             # Validate measurement results
-            for i, result in enumerate(prover_results):
-                if result not in [0, 1]:
-                    raise VerificationError(f"Invalid prover result at index {i}: {result}")
-            for i, result in enumerate(verifier_results):
-                if result not in [0, 1]:
-                    raise VerificationError(f"Invalid verifier result at index {i}: {result}")
+            num_results = len(measurement_bases)
+            prover_results = _results_array(prover_results, num_results, packed, 'prover')
+            verifier_results = _results_array(verifier_results, num_results, packed, 'verifier')
             
             # Validate bases
-            valid_bases = {'Z', 'X', 'Y'}
-            for i, basis in enumerate(measurement_bases):
-                if basis not in valid_bases:
-                    raise VerificationError(f"Invalid basis at index {i}: {basis}")
-            
-            # Convert bases to format for CHSH test
-            alice_bases = measurement_bases
-            bob_bases = measurement_bases  # Same bases
-            
-            # Calculate CHSH value
-            chsh_value, correlation_matrix = self.measurement.chsh_inequality_test(
-                prover_results, verifier_results, alice_bases, bob_bases
-            )
+            bases = np.asarray(measurement_bases)
+            invalid = ~np.isin(bases, _VALID_BASES_ARRAY)
+            if invalid.any():
+                index = int(np.argmax(invalid))
+                raise VerificationError(f"Invalid basis at index {index}: {measurement_bases[index]}")
+            
+            if self.fast_reject and num_results > _FAST_REJECT_SAMPLE:
+                sample = self._reject_rng.choice(num_results, _FAST_REJECT_SAMPLE, replace=False)
+                sample_mismatches = np.bitwise_xor(prover_results[sample], verifier_results[sample])
+                if 1.0 - np.count_nonzero(sample_mismatches) / _FAST_REJECT_SAMPLE < _FAST_REJECT_CORRELATION:
+                    return False, float('nan')
+            
+            # Prover and verifier measure in the same bases, so the CHSH value
+            # reduces to per-basis correlators of the mismatch array
+            mismatches = np.bitwise_xor(prover_results, verifier_results)
+            chsh_value = _chsh_fast(mismatches, bases)
             
             # Validate CHSH value
             if not np.isfinite(chsh_value) or chsh_value < 0 or chsh_value > 3.0:
@@ -259,62 +472,121 @@ class QuantumEntanglementZK:
             # Quantum bound is 2√2 ≈ 2.828
             is_entangled = chsh_value > self.chsh_threshold
             
-            # Additional consistency check
-            correlation = np.mean(np.array(prover_results) == np.array(verifier_results))
+            # Additional consistency check: fraction of matching outcomes,
+            # from the Hamming distance between the two result arrays
+            hamming = np.count_nonzero(mismatches)
+            correlation = 1.0 - hamming / num_results
             consistency = correlation > 0.7  # 70% correlation threshold
             
-            is_valid = is_entangled and consistency
+            is_valid = bool(is_entangled and consistency)
             
-            return is_valid, chsh_value
+            return is_valid, float(chsh_value)
             
         except VerificationError:
             raise
         except Exception as e:
             raise VerificationError(f"Verification failed: {str(e)}") from e
     
-    def prove(self, statement: str, witness: str, seed: Optional[int] = None) -> QEZKProof:
+    def _prove_fused(self, statement: str, witness: str, seed: Optional[int] = None,
+                     measurement_bases: Optional[List[str]] = None
+                     ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
         """
-        Complete QE-ZK proof generation
+        Run setup, prover phase and verifier phase as one fused pass
         
-        Executes the full protocol: setup, prover phase, verifier phase, and verification.
+        Every EPR pair from the entanglement source is the same Bell state,
+        so outcome probabilities depend only on the measurement basis. They
+        are computed once for the witness-transformed and the untouched
+        pair, and outcomes are drawn from them ``tile_size`` pairs at a time
+        without materializing particle arrays. All prover tiles are drawn
+        before any verifier tile, consuming uniforms in the same order as
+        the particle-level phases, so for a given seed the results match
+        setup(), prover_phase() and verifier_phase() at any proof size.
         
         Args:
             statement: Statement to prove
             witness: Witness (secret information) as bit string
             seed: Optional random seed for reproducibility
+            measurement_bases: Precomputed bases for ``statement`` (optional)
             
         Returns:
-            QEZKProof object containing all proof data
+            Tuple of (prover_results, verifier_results, measurement_bases)
             
         Raises:
-            ProtocolError: If proof generation fails
+            EntanglementError: If EPR pair generation fails
+            MeasurementError: If measurement fails
         """
+        self._set_seed(seed)
+        
+        gate_sequence = self.encoder.witness_to_quantum_circuit(witness)
+        if measurement_bases is None:
+            measurement_bases = self.encoder.statement_to_bases(statement, self.num_epr_pairs)
+        
         try:
-            # Input validation
-            if not isinstance(statement, str) or len(statement) == 0:
-                raise ProtocolError("statement must be a non-empty string")
-            if not isinstance(witness, str):
-                raise ProtocolError("witness must be a string")
-            
-            # Setup
-            prover_particles, verifier_particles = self.setup(seed)
-            
-            # Prover phase
-            prover_results, measurement_bases = self.prover_phase(statement, witness, prover_particles)
-            
-            # Verifier phase
-            verifier_results = self.verifier_phase(statement, verifier_particles, measurement_bases)
+            epr_pair = self.entanglement.generate_epr_pairs_bulk(1)
+        except (ConfigurationError, EntanglementError):
+            raise
+        except Exception as e:
+            raise EntanglementError(f"Setup failed: {str(e)}") from e
+        
+        # Outcome-0 probability per basis code (0=Z, 1=X, 2=Y) for each party
+        table_bases = ['Z', 'X', 'Y']
+        templates = np.repeat(epr_pair, len(table_bases), axis=0)
+        prover_table = self.measurement.zero_probabilities(
+            self.encoder.apply_circuit_batch(templates, gate_sequence), table_bases
+        )
+        verifier_table = self.measurement.zero_probabilities(templates, table_bases)
+        
+        bases = np.asarray(measurement_bases)
+        codes = np.zeros(self.num_epr_pairs, dtype=np.intp)
+        codes[bases == 'X'] = 1
+        codes[bases == 'Y'] = 2
+        
+        # Small proofs are dominated by transfer and launch overhead on the GPU
+        xp = self._xp if self.num_epr_pairs >= _DEVICE_MIN_EPR_PAIRS else np
+        if xp is not np:
+            prover_table = xp.asarray(prover_table)
+            verifier_table = xp.asarray(verifier_table)
+            codes = xp.asarray(codes)
+        to_host = np.asarray if xp is np else xp.asnumpy
+        
+        prover_results = np.empty(self.num_epr_pairs, dtype=np.uint8)
+        verifier_results = np.empty(self.num_epr_pairs, dtype=np.uint8)
+        
+        # One pass per party: the prover phase draws all of its uniforms
+        # before the verifier phase draws any
+        for table, results in ((prover_table, prover_results),
+                               (verifier_table, verifier_results)):
+            for start in range(0, self.num_epr_pairs, self.tile_size):
+                stop = min(start + self.tile_size, self.num_epr_pairs)
+                results[start:stop] = to_host(
+                    xp.random.random(stop - start) >= table[codes[start:stop]]
+                )
+        
+        return prover_results, verifier_results, measurement_bases
+    
+    def _build_proof(self, statement: str, witness: str, seed: Optional[int] = None,
+                     measurement_bases: Optional[List[str]] = None) -> QEZKProof:
+        """Run the fused protocol and verification for validated inputs"""
+        try:
+            prover_results, verifier_results, measurement_bases = self._prove_fused(
+                statement, witness, seed, measurement_bases
+            )
             
             # Verification
             is_valid, chsh_value = self.verify(prover_results, verifier_results, measurement_bases)
             
+            if self.pack_results:
+                prover_results = np.packbits(prover_results)
+                verifier_results = np.packbits(verifier_results)
+            
             return QEZKProof(
                 prover_results=prover_results,
                 verifier_results=verifier_results,
                 measurement_bases=measurement_bases,
                 chsh_value=chsh_value,
                 is_valid=is_valid,
-                statement=statement
+                statement=statement,
+                packed=self.pack_results
             )
             
         except (ProtocolError, ConfigurationError, EntanglementError, 
@@ -322,4 +594,63 @@ class QuantumEntanglementZK:
             raise
         except Exception as e:
             raise ProtocolError(f"Proof generation failed: {str(e)}") from e
-
+    
+    def prove(self, statement: str, witness: str, seed: Optional[int] = None) -> QEZKProof:
+        """
+        Complete QE-ZK proof generation
+        
+        Executes the full protocol: setup, prover phase, verifier phase, and verification.
+        Setup and both measurement phases run as one fused pass over tiles
+        of ``tile_size`` EPR pairs.
+        
+        Args:
+            statement: Statement to prove
+            witness: Witness (secret information) as bit string
+            seed: Optional random seed for reproducibility
+            
+        Returns:
+            QEZKProof object containing all proof data
+            
+        Raises:
+            ProtocolError: If proof generation fails
+        """
+        self._check_statement_witness(statement, witness)
+        
+        return self._build_proof(statement, witness, seed)
+    
+    def compile_for(self, statement: str) -> Callable[..., QEZKProof]:
+        """
+        Specialize proof generation for a fixed statement
+        
+        The measurement basis schedule for ``statement`` is computed once
+        for the current ``num_epr_pairs`` and captured by the returned
+        function. The 32 most recently used specialized provers are cached
+        per ``(num_epr_pairs, statement)``.
+        
+        Args:
+            statement: Statement every generated proof will prove
+            
+        Returns:
+            Function ``specialized_prove(witness, seed=None) -> QEZKProof``
+            
+        Raises:
+            ProtocolError: If the statement is invalid
+        """
+        self._check_statement(statement)
+        
+        key = (self.num_epr_pairs, statement)
+        specialized_prove = self._compiled_provers.get(key)
+        if specialized_prove is not None:
+            self._compiled_provers.move_to_end(key)
+            return specialized_prove
+        
+        measurement_bases = self.encoder.statement_to_bases(statement, self.num_epr_pairs)
+        
+        def specialized_prove(witness: str, seed: Optional[int] = None) -> QEZKProof:
+            self._check_witness(witness)
+            return self._build_proof(statement, witness, seed, list(measurement_bases))
+        
+        self._compiled_provers[key] = specialized_prove
+        if len(self._compiled_provers) > _COMPILED_PROVER_CACHE_SIZE:
+            self._compiled_provers.popitem(last=False)
+        return specialized_prove
@@ -5,16 +5,46 @@ Protocol specification, versioning, and standardization for QE-ZK.
 Includes RFC-style specification, message format standards, and compliance testing.
 """
 
-import json
+import base64
 import hashlib
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, asdict
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Sequence, Tuple, Union, BinaryIO
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+import numpy as np
 
 from .protocol import QEZKProof
+from . import serialization
 from .exceptions import ProtocolError, ConfigurationError
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - depends on environment
+    xxhash = None
+
+
+def _import_msgpack():
+    """Import msgpack, which is only needed for binary proof messages"""
+    try:
+        import msgpack
+    except ImportError:
+        raise ConfigurationError("msgpack not installed. Install with: pip install msgpack")
+    return msgpack
+
+
+def _message_id(data: bytes) -> str:
+    """
+    Short non-cryptographic message identifier (16 hex characters)
+    
+    Uses xxh3 when xxhash is installed, otherwise an 8-byte BLAKE2b digest.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
 class ProtocolVersion(Enum):
     """QE-ZK protocol versions"""
@@ -23,25 +53,163 @@ class ProtocolVersion(Enum):
     V2_0 = "2.0"  # Future version
 
 
-@dataclass
+_REQUIRED_MESSAGE_FIELDS = ('protocol', 'version', 'message_type', 'timestamp', 'data')
+_REQUIRED_MESSAGE_FIELD_SET = frozenset(_REQUIRED_MESSAGE_FIELDS)
+
+_VALID_MESSAGE_TYPES = frozenset({
+    'setup_request', 'setup_response', 'prover_results', 'prover_results_batch',
+    'verifier_results', 'verification_request', 'verification_response',
+    'error', 'heartbeat'
+})
+
+_VERSION_VALUES = tuple(v.value for v in ProtocolVersion)
+_VALID_VERSIONS = frozenset(_VERSION_VALUES)
+
+_REQUIRED_PROOF_FIELDS = ('prover_results', 'verifier_results', 'measurement_bases',
+                          'chsh_value', 'is_valid', 'statement')
+
+_VALID_BASES = frozenset({'Z', 'X', 'Y'})
+
+# Constant part of the verification response metadata
+_VERIFICATION_RESPONSE_METADATA = {
+    'chsh_threshold': 2.2,
+    'classical_bound': 2.0,
+    'quantum_bound': 2.828
+}
+
+# Sentinel for attributes missing from a proof
+_MISSING = object()
+
+
+def _results_pair_binary(prover_results, verifier_results) -> bool:
+    """
+    Check prover and verifier results together in one pass
+    
+    Only applies to unsigned result arrays of the same shape, as produced by
+    prove(); returns False when the fused check cannot be used or finds an
+    invalid value, in which case each side should be checked separately.
+    
+    Args:
+        prover_results: Prover's measurement results
+        verifier_results: Verifier's measurement results
+        
+    Returns:
+        True if both result arrays contain only 0 and 1
+    """
+    if not (isinstance(prover_results, np.ndarray) and isinstance(verifier_results, np.ndarray)):
+        return False
+    if (prover_results.dtype.kind not in 'bu' or verifier_results.dtype.kind not in 'bu'
+            or prover_results.shape != verifier_results.shape):
+        return False
+    return prover_results.size == 0 or np.bitwise_or(prover_results, verifier_results).max() <= 1
+
+
+def _first_invalid_result(results) -> Optional[Tuple[int, Any]]:
+    """
+    Find the first measurement result that is not 0 or 1
+    
+    Args:
+        results: Measurement results
+        
+    Returns:
+        Tuple of (index, value) for the first invalid result, or None
+    """
+    try:
+        array = np.asarray(results)
+    except (ValueError, TypeError):
+        array = None
+    if array is None or array.ndim != 1 or array.dtype.kind not in 'biuf':
+        # None, strings, nested or ragged results: compare element by
+        # element, since an array conversion would coerce or reject them
+        for index, result in enumerate(results):
+            try:
+                valid = result in (0, 1)
+            except (ValueError, TypeError):
+                valid = False
+            if not valid:
+                return index, result
+        return None
+    
+    results = array
+    if results.dtype.kind in 'bu':
+        # Unsigned results are valid iff their maximum is at most 1, which
+        # needs a single reduction and no temporary mask
+        if results.size == 0 or results.max() <= 1:
+            return None
+        invalid = results > 1
+    else:
+        invalid = (results != 0) & (results != 1)
+        if not invalid.any():
+            return None
+    index = int(np.argmax(invalid))
+    return index, results[index].item()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of ``_freeze``: plain dicts and lists, e.g. for serialization"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
 class ProtocolSpecification:
-    """QE-ZK protocol specification"""
+    """
+    QE-ZK protocol specification
+    
+    Specifications are shared between compliance checkers, so the nested
+    formats, steps and parameters are stored read-only (mappings as
+    ``MappingProxyType``, lists as tuples), not just the top-level fields.
+    """
+    # Declared by hand because dataclass(slots=True) requires Python 3.10
+    __slots__ = ('version', 'name', 'description', 'message_formats',
+                 'protocol_steps', 'security_parameters', 'compliance_requirements')
+    
     version: str
     name: str
     description: str
-    message_formats: Dict[str, Dict[str, Any]]
-    protocol_steps: List[str]
-    security_parameters: Dict[str, Any]
-    compliance_requirements: List[str]
+    message_formats: Mapping[str, Mapping[str, Any]]
+    protocol_steps: Sequence[str]
+    security_parameters: Mapping[str, Any]
+    compliance_requirements: Sequence[str]
+    
+    def __post_init__(self) -> None:
+        """Freeze the nested structures, bypassing the frozen __setattr__"""
+        for name in self.__slots__:
+            object.__setattr__(self, name, _freeze(getattr(self, name)))
+    
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Return field values for pickling (slots have no __dict__)"""
+        return tuple(_thaw(getattr(self, name)) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore field values, bypassing the frozen __setattr__"""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, _freeze(value))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the specification as plain dicts and lists"""
+        return {name: _thaw(getattr(self, name)) for name in self.__slots__}
     
     def to_json(self) -> str:
         """Serialize specification to JSON"""
-        return json.dumps(asdict(self), indent=2)
+        return serialization.dumps(self.to_dict(), indent=True)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'ProtocolSpecification':
         """Deserialize specification from JSON"""
-        data = json.loads(json_str)
+        data = serialization.loads(json_str)
         return cls(**data)
 
 
@@ -54,7 +222,8 @@ class StandardMessageFormat:
     
     @staticmethod
     def create_setup_request(statement: str, seed: Optional[int] = None,
-                           version: str = "1.0") -> Dict[str, Any]:
+                           version: str = "1.0",
+                           include_metadata: bool = True) -> Dict[str, Any]:
         """
         Create standard setup request message
         
@@ -62,68 +231,195 @@ class StandardMessageFormat:
             statement: Statement to prove
             seed: Optional random seed
             version: Protocol version
+            include_metadata: Whether to compute the ``metadata`` block.
+                ProtocolCompliance does not use it, so internal pipelines can
+                skip it.
             
         Returns:
             Standardized message dictionary
         """
-        return {
+        now_iso = datetime.utcnow().isoformat()
+        message = {
             'protocol': 'QE-ZK',
             'version': version,
             'message_type': 'setup_request',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now_iso,
             'data': {
                 'statement': statement,
                 'seed': seed
-            },
-            'metadata': {
-                'message_id': hashlib.sha256(
-                    f"{statement}{seed}{datetime.utcnow().isoformat()}".encode()
-                ).hexdigest()[:16]
             }
         }
+        if include_metadata:
+            message['metadata'] = {
+                'message_id': _message_id(f"{statement}{seed}{now_iso}".encode())
+            }
+        return message
+    
+    @staticmethod
+    def pack_results(results: Union[List[int], np.ndarray]) -> str:
+        """
+        Bit-pack 0/1 measurement results for transport
+        
+        Args:
+            results: Measurement results
+            
+        Returns:
+            Base64 encoding of the ``np.packbits`` bytes
+        """
+        packed = np.packbits(np.asarray(results, dtype=np.uint8))
+        return base64.b64encode(packed.tobytes()).decode('ascii')
+    
+    @staticmethod
+    def unpack_results(encoded: str, num_results: int) -> np.ndarray:
+        """
+        Decode results produced by pack_results
+        
+        Args:
+            encoded: Base64-encoded packed results
+            num_results: Number of results that were packed
+            
+        Returns:
+            ``uint8`` array of 0/1 results
+            
+        Raises:
+            ProtocolError: If the encoding is invalid or too short
+        """
+        try:
+            packed = np.frombuffer(base64.b64decode(encoded, validate=True), dtype=np.uint8)
+        except (ValueError, TypeError) as e:
+            raise ProtocolError(f"Invalid packed results: {e}") from e
+        if packed.size * 8 < num_results:
+            raise ProtocolError(
+                f"Packed results hold {packed.size * 8} bits, expected {num_results}"
+            )
+        return np.unpackbits(packed, count=num_results)
     
     @staticmethod
-    def create_prover_results(prover_results: List[int],
+    def _use_packed(version: str, packed: Optional[bool]) -> bool:
+        """Resolve the packed flag; by default only v1.0 peers get result lists"""
+        if packed is None:
+            return version != ProtocolVersion.V1_0.value
+        return packed
+    
+    @staticmethod
+    def _results_fields(name: str, results: Union[List[int], np.ndarray],
+                        packed: bool) -> Dict[str, Any]:
+        """Message data fields for one set of results, packed or as a list"""
+        if packed:
+            return {f'{name}_packed': StandardMessageFormat.pack_results(results)}
+        if isinstance(results, np.ndarray):
+            return {name: results.tolist()}
+        return {name: results}
+    
+    @staticmethod
+    def create_prover_results(prover_results: Union[List[int], np.ndarray],
                              measurement_bases: List[str],
                              statement: str,
-                             version: str = "1.0") -> Dict[str, Any]:
+                             version: str = "1.0",
+                             packed: Optional[bool] = None,
+                             include_metadata: bool = True) -> Dict[str, Any]:
         """
         Create standard prover results message
         
         Args:
-            prover_results: Prover's measurement results
+            prover_results: Prover's measurement results (list or ``uint8`` array)
             measurement_bases: Measurement bases used
             statement: Statement being proved
             version: Protocol version
+            packed: Send results bit-packed as ``prover_results_packed`` and
+                ``num_results`` instead of a list (see unpack_results).
+                Defaults to packing for every version except 1.0.
+            include_metadata: Whether to compute the ``metadata`` block.
+                ProtocolCompliance does not use it, so internal pipelines can
+                skip it.
             
         Returns:
             Standardized message dictionary
         """
-        return {
+        num_results = len(prover_results)
+        packed = StandardMessageFormat._use_packed(version, packed)
+        results_data = StandardMessageFormat._results_fields('prover_results', prover_results, packed)
+        if packed:
+            results_data['num_results'] = num_results
+        
+        message = {
             'protocol': 'QE-ZK',
             'version': version,
             'message_type': 'prover_results',
             'timestamp': datetime.utcnow().isoformat(),
             'data': {
-                'prover_results': prover_results,
+                **results_data,
                 'measurement_bases': measurement_bases,
                 'statement': statement
-            },
-            'metadata': {
-                'num_measurements': len(prover_results),
+            }
+        }
+        if include_metadata:
+            basis_counts = Counter(measurement_bases)
+            message['metadata'] = {
+                'num_measurements': num_results,
                 'bases_distribution': {
-                    'Z': measurement_bases.count('Z'),
-                    'X': measurement_bases.count('X'),
-                    'Y': measurement_bases.count('Y')
+                    'Z': basis_counts['Z'],
+                    'X': basis_counts['X'],
+                    'Y': basis_counts['Y']
                 }
             }
+        return message
+    
+    @staticmethod
+    def create_prover_results_batch(items: List[Tuple[Union[List[int], np.ndarray], List[str], str]],
+                                   version: str = "1.0",
+                                   packed: Optional[bool] = None,
+                                   include_metadata: bool = True) -> Dict[str, Any]:
+        """
+        Create one message carrying the prover results of many proofs
+        
+        The envelope, timestamp and version are shared by all items, which
+        amortizes per-message overhead. Batches of roughly 1000-5000 items
+        give most of the throughput gain without producing huge messages.
+        
+        Args:
+            items: (prover_results, measurement_bases, statement) tuples
+            version: Protocol version
+            packed: Send results bit-packed (see create_prover_results)
+            include_metadata: Whether to compute the ``metadata`` block
+            
+        Returns:
+            Standardized message dictionary with one record per item in
+            ``data['items']``
+        """
+        packed = StandardMessageFormat._use_packed(version, packed)
+        results_fields = StandardMessageFormat._results_fields
+        records = [
+            {
+                **results_fields('prover_results', prover_results, packed),
+                'num_results': len(prover_results),
+                'measurement_bases': measurement_bases,
+                'statement': statement
+            }
+            for prover_results, measurement_bases, statement in items
+        ]
+        message = {
+            'protocol': 'QE-ZK',
+            'version': version,
+            'message_type': 'prover_results_batch',
+            'timestamp': datetime.utcnow().isoformat(),
+            'data': {
+                'items': records
+            }
         }
+        if include_metadata:
+            message['metadata'] = {
+                'num_items': len(records)
+            }
+        return message
     
     @staticmethod
-    def create_verification_request(prover_results: List[int],
-                                   verifier_results: List[int],
+    def create_verification_request(prover_results: Union[List[int], np.ndarray],
+                                   verifier_results: Union[List[int], np.ndarray],
                                    measurement_bases: List[str],
-                                   version: str = "1.0") -> Dict[str, Any]:
+                                   version: str = "1.0",
+                                   packed: Optional[bool] = None,
+                                   include_metadata: bool = True) -> Dict[str, Any]:
         """
         Create standard verification request message
         
@@ -132,33 +428,49 @@ class StandardMessageFormat:
             verifier_results: Verifier's measurement results
             measurement_bases: Measurement bases used
             version: Protocol version
+            packed: Send both result sets bit-packed (see create_prover_results)
+            include_metadata: Whether to compute the ``metadata`` block (see
+                create_prover_results)
             
         Returns:
             Standardized message dictionary
         """
-        return {
+        packed = StandardMessageFormat._use_packed(version, packed)
+        data = {
+            **StandardMessageFormat._results_fields('prover_results', prover_results, packed),
+            **StandardMessageFormat._results_fields('verifier_results', verifier_results, packed),
+            'measurement_bases': measurement_bases
+        }
+        if packed:
+            data['num_results'] = len(prover_results)
+        
+        message = {
             'protocol': 'QE-ZK',
             'version': version,
             'message_type': 'verification_request',
             'timestamp': datetime.utcnow().isoformat(),
-            'data': {
-                'prover_results': prover_results,
-                'verifier_results': verifier_results,
-                'measurement_bases': measurement_bases
-            },
-            'metadata': {
+            'data': data
+        }
+        if include_metadata:
+            # No dtype is forced: out-of-range or fractional results must
+            # compare as they are, not wrap or truncate into a match
+            prover_array = np.asarray(prover_results)
+            verifier_array = np.asarray(verifier_results)
+            num_compared = min(len(prover_array), len(verifier_array))
+            message['metadata'] = {
                 'num_measurements': len(prover_results),
-                'results_match': sum(
-                    1 for p, v in zip(prover_results, verifier_results) if p == v
-                )
+                'results_match': int(np.count_nonzero(
+                    prover_array[:num_compared] == verifier_array[:num_compared]
+                ))
             }
-        }
+        return message
     
     @staticmethod
     def create_verification_response(is_valid: bool,
                                     chsh_value: float,
                                     statement: str,
-                                    version: str = "1.0") -> Dict[str, Any]:
+                                    version: str = "1.0",
+                                    include_metadata: bool = True) -> Dict[str, Any]:
         """
         Create standard verification response message
         
@@ -167,27 +479,29 @@ class StandardMessageFormat:
             chsh_value: CHSH inequality value
             statement: Statement that was verified
             version: Protocol version
+            include_metadata: Whether to compute the ``metadata`` block (see
+                create_prover_results)
             
         Returns:
             Standardized message dictionary
         """
-        return {
+        now_iso = datetime.utcnow().isoformat()
+        message = {
             'protocol': 'QE-ZK',
             'version': version,
             'message_type': 'verification_response',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now_iso,
             'data': {
                 'is_valid': is_valid,
                 'chsh_value': chsh_value,
                 'statement': statement
-            },
-            'metadata': {
-                'verification_timestamp': datetime.utcnow().isoformat(),
-                'chsh_threshold': 2.2,
-                'classical_bound': 2.0,
-                'quantum_bound': 2.828
             }
         }
+        if include_metadata:
+            metadata = {'verification_timestamp': now_iso}
+            metadata.update(_VERIFICATION_RESPONSE_METADATA)
+            message['metadata'] = metadata
+        return message
     
     @staticmethod
     def validate_message(message: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
@@ -201,31 +515,92 @@ class StandardMessageFormat:
             Tuple of (is_valid, error_message)
         """
         # Check required fields
-        required_fields = ['protocol', 'version', 'message_type', 'timestamp', 'data']
-        for field in required_fields:
-            if field not in message:
-                return False, f"Missing required field: {field}"
+        if not _REQUIRED_MESSAGE_FIELD_SET.issubset(message):
+            for field in _REQUIRED_MESSAGE_FIELDS:
+                if field not in message:
+                    return False, f"Missing required field: {field}"
         
         # Check protocol name
         if message['protocol'] != 'QE-ZK':
             return False, f"Invalid protocol: {message['protocol']}"
         
         # Check version
-        if message['version'] not in [v.value for v in ProtocolVersion]:
+        if message['version'] not in _VALID_VERSIONS:
             return False, f"Unsupported version: {message['version']}"
         
         # Check message type
-        valid_types = [
-            'setup_request', 'setup_response', 'prover_results',
-            'verifier_results', 'verification_request', 'verification_response',
-            'error', 'heartbeat'
-        ]
-        if message['message_type'] not in valid_types:
+        if message['message_type'] not in _VALID_MESSAGE_TYPES:
             return False, f"Invalid message type: {message['message_type']}"
         
         return True, None
 
 
+def _load_specification(version: str) -> ProtocolSpecification:
+    """
+    Load protocol specification for version
+    
+    Specifications of supported versions are cached and shared between
+    ProtocolCompliance instances; they are read-only throughout. Other
+    versions are built on each call so arbitrary caller-supplied strings
+    do not accumulate in the cache.
+    """
+    if version in _VALID_VERSIONS:
+        return _cached_specification(version)
+    return _build_specification(version)
+
+
+def _build_specification(version: str) -> ProtocolSpecification:
+    """Build the protocol specification for version"""
+    # Default specification for v1.0
+    return ProtocolSpecification(
+        version=version,
+        name="Quantum Entanglement Zero-Knowledge Protocol",
+        description="Information-theoretic perfect zero-knowledge protocol using quantum entanglement",
+        message_formats={
+            'setup_request': {
+                'required_fields': ['statement'],
+                'optional_fields': ['seed']
+            },
+            'prover_results': {
+                'required_fields': ['prover_results', 'measurement_bases', 'statement'],
+                'optional_fields': []
+            },
+            'verification_request': {
+                'required_fields': ['prover_results', 'verifier_results', 'measurement_bases'],
+                'optional_fields': []
+            },
+            'verification_response': {
+                'required_fields': ['is_valid', 'chsh_value', 'statement'],
+                'optional_fields': []
+            }
+        },
+        protocol_steps=[
+            '1. Setup: Generate and distribute EPR pairs',
+            '2. Prover Phase: Encode witness, apply operations, measure',
+            '3. Verifier Phase: Measure particles in same bases',
+            '4. Verification: Calculate CHSH inequality'
+        ],
+        security_parameters={
+            'chsh_threshold': 2.2,
+            'classical_bound': 2.0,
+            'quantum_bound': 2.828,
+            'correlation_threshold': 0.7,
+            'min_epr_pairs': 1,
+            'max_epr_pairs': 1000000
+        },
+        compliance_requirements=[
+            'Message format compliance',
+            'Protocol step compliance',
+            'Security parameter compliance',
+            'CHSH calculation compliance',
+            'Measurement basis compliance'
+        ]
+    )
+
+
+_cached_specification = lru_cache(maxsize=None)(_build_specification)
+
+
 class ProtocolCompliance:
     """
     Protocol compliance checker
@@ -241,55 +616,7 @@ class ProtocolCompliance:
             version: Protocol version to check against
         """
         self.version = version
-        self.specification = self._load_specification(version)
-    
-    def _load_specification(self, version: str) -> ProtocolSpecification:
-        """Load protocol specification for version"""
-        # Default specification for v1.0
-        return ProtocolSpecification(
-            version=version,
-            name="Quantum Entanglement Zero-Knowledge Protocol",
-            description="Information-theoretic perfect zero-knowledge protocol using quantum entanglement",
-            message_formats={
-                'setup_request': {
-                    'required_fields': ['statement'],
-                    'optional_fields': ['seed']
-                },
-                'prover_results': {
-                    'required_fields': ['prover_results', 'measurement_bases', 'statement'],
-                    'optional_fields': []
-                },
-                'verification_request': {
-                    'required_fields': ['prover_results', 'verifier_results', 'measurement_bases'],
-                    'optional_fields': []
-                },
-                'verification_response': {
-                    'required_fields': ['is_valid', 'chsh_value', 'statement'],
-                    'optional_fields': []
-                }
-            },
-            protocol_steps=[
-                '1. Setup: Generate and distribute EPR pairs',
-                '2. Prover Phase: Encode witness, apply operations, measure',
-                '3. Verifier Phase: Measure particles in same bases',
-                '4. Verification: Calculate CHSH inequality'
-            ],
-            security_parameters={
-                'chsh_threshold': 2.2,
-                'classical_bound': 2.0,
-                'quantum_bound': 2.828,
-                'correlation_threshold': 0.7,
-                'min_epr_pairs': 1,
-                'max_epr_pairs': 1000000
-            },
-            compliance_requirements=[
-                'Message format compliance',
-                'Protocol step compliance',
-                'Security parameter compliance',
-                'CHSH calculation compliance',
-                'Measurement basis compliance'
-            ]
-        )
+        self.specification = _load_specification(version)
     
     def check_message_compliance(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -322,7 +649,7 @@ class ProtocolCompliance:
             # Check required fields
             data = message.get('data', {})
             for field in format_spec['required_fields']:
-                if field not in data:
+                if field not in data and f"{field}_packed" not in data:
                     report['errors'].append(f"Missing required field in data: {field}")
                     report['compliant'] = False
         
@@ -344,39 +671,50 @@ class ProtocolCompliance:
             'warnings': []
         }
         
-        # Check proof structure
-        required_fields = ['prover_results', 'verifier_results', 'measurement_bases',
-                          'chsh_value', 'is_valid', 'statement']
-        for field in required_fields:
-            if not hasattr(proof, field):
+        # Check proof structure, fetching each field once
+        fields = {}
+        for field in _REQUIRED_PROOF_FIELDS:
+            value = getattr(proof, field, _MISSING)
+            if value is _MISSING:
                 report['errors'].append(f"Missing proof field: {field}")
                 report['compliant'] = False
-        
-        # Check measurement results
-        if hasattr(proof, 'prover_results'):
-            for result in proof.prover_results:
-                if result not in [0, 1]:
-                    report['errors'].append(f"Invalid prover result: {result}")
-                    report['compliant'] = False
-        
-        if hasattr(proof, 'verifier_results'):
-            for result in proof.verifier_results:
-                if result not in [0, 1]:
-                    report['errors'].append(f"Invalid verifier result: {result}")
+                continue
+            fields[field] = value
+        
+        # Check measurement results (every bit of a packed array is valid)
+        if not getattr(proof, 'packed', False) and not _results_pair_binary(
+                fields.get('prover_results'), fields.get('verifier_results')):
+            for name in ('prover', 'verifier'):
+                results = fields.get(f'{name}_results')
+                if results is None:
+                    continue
+                invalid = _first_invalid_result(results)
+                if invalid is not None:
+                    index, result = invalid
+                    report['errors'].append(f"Invalid {name} result at index {index}: {result}")
                     report['compliant'] = False
         
         # Check measurement bases
-        if hasattr(proof, 'measurement_bases'):
-            valid_bases = {'Z', 'X', 'Y'}
-            for basis in proof.measurement_bases:
-                if basis not in valid_bases:
-                    report['errors'].append(f"Invalid measurement basis: {basis}")
-                    report['compliant'] = False
+        if 'measurement_bases' in fields:
+            bases = fields['measurement_bases']
+            try:
+                invalid_bases = set(bases) - _VALID_BASES
+            except TypeError:
+                # Unhashable bases: keep one of each invalid basis by repr
+                invalid_bases = {
+                    repr(basis): basis for basis in bases
+                    if not (isinstance(basis, str) and basis in _VALID_BASES)
+                }.values()
+            # Sorted by repr, since bases of mixed types do not compare
+            for basis in sorted(invalid_bases, key=repr):
+                report['errors'].append(f"Invalid measurement basis: {basis}")
+                report['compliant'] = False
         
         # Check CHSH value range
-        if hasattr(proof, 'chsh_value'):
-            if not (0 <= proof.chsh_value <= 3.0):
-                report['warnings'].append(f"CHSH value out of expected range: {proof.chsh_value}")
+        if 'chsh_value' in fields:
+            chsh_value = fields['chsh_value']
+            if not (0 <= chsh_value <= 3.0):
+                report['warnings'].append(f"CHSH value out of expected range: {chsh_value}")
         
         return report
     
@@ -385,6 +723,18 @@ class ProtocolCompliance:
         return self.specification
 
 
+def _version_key(version: str) -> Tuple[int, ...]:
+    """Numeric sort key for a version string (so "1.10" sorts after "1.2")"""
+    return tuple(int(part) for part in version.split('.'))
+
+
+@lru_cache(maxsize=256)
+def _versions_compatible(version1: str, version2: str) -> bool:
+    """Whether two versions are compatible (same major version)"""
+    # For now, all v1.x versions are compatible
+    return version1.split('.')[0] == version2.split('.')[0]
+
+
 class ProtocolVersionManager:
     """
     Protocol version manager
@@ -394,7 +744,9 @@ class ProtocolVersionManager:
     
     def __init__(self):
         """Initialize version manager"""
-        self.supported_versions = [v.value for v in ProtocolVersion]
+        # A per-instance list: callers may register further versions, which
+        # is_version_supported and get_latest_version then honour
+        self.supported_versions = list(_VERSION_VALUES)
         self.current_version = ProtocolVersion.V1_0.value
     
     def is_version_supported(self, version: str) -> bool:
@@ -411,7 +763,7 @@ class ProtocolVersionManager:
     
     def get_latest_version(self) -> str:
         """Get latest protocol version"""
-        return max(self.supported_versions)
+        return max(self.supported_versions, key=_version_key)
     
     def check_compatibility(self, version1: str, version2: str) -> bool:
         """
@@ -424,10 +776,7 @@ class ProtocolVersionManager:
         Returns:
             True if compatible
         """
-        # For now, all v1.x versions are compatible
-        major1 = version1.split('.')[0]
-        major2 = version2.split('.')[0]
-        return major1 == major2
+        return _versions_compatible(version1, version2)
     
     def upgrade_message(self, message: Dict[str, Any], target_version: str) -> Dict[str, Any]:
         """
@@ -440,16 +789,34 @@ class ProtocolVersionManager:
         Returns:
             Upgraded message
         """
+        return self.upgrade_message_inplace(message.copy(), target_version)
+    
+    def upgrade_message_inplace(self, message: Dict[str, Any], target_version: str) -> Dict[str, Any]:
+        """
+        Upgrade message to target version in place
+        
+        Use this instead of upgrade_message when the caller owns the message,
+        to avoid copying it.
+        
+        Args:
+            message: Message to upgrade (modified)
+            target_version: Target version
+            
+        Returns:
+            The same message, upgraded
+            
+        Raises:
+            ConfigurationError: If the target version is not supported
+        """
         if not self.is_version_supported(target_version):
             raise ConfigurationError(f"Unsupported target version: {target_version}")
         
-        upgraded = message.copy()
-        upgraded['version'] = target_version
+        message['version'] = target_version
         
         # Version-specific upgrades would go here
         # For now, just update version field
         
-        return upgraded
+        return message
 
 
 class StandardProtocolImplementation:
@@ -470,34 +837,133 @@ class StandardProtocolImplementation:
         self.compliance = ProtocolCompliance(version)
         self.version_manager = ProtocolVersionManager()
     
-    def create_standard_proof_message(self, proof: QEZKProof) -> Dict[str, Any]:
+    def create_standard_proof_message(self, proof: QEZKProof,
+                                      packed: Optional[bool] = None,
+                                      include_metadata: bool = True) -> Dict[str, Any]:
         """
         Create standard proof message
         
         Args:
             proof: QEZKProof to convert
+            packed: Send results bit-packed (see StandardMessageFormat.create_prover_results)
+            include_metadata: Whether to compute the ``metadata`` block
             
         Returns:
             Standardized proof message
         """
-        return {
+        num_results = len(proof.measurement_bases)
+        prover_results = proof.prover_results
+        verifier_results = proof.verifier_results
+        if proof.packed:
+            prover_results = np.unpackbits(prover_results, count=num_results)
+            verifier_results = np.unpackbits(verifier_results, count=num_results)
+        
+        packed = StandardMessageFormat._use_packed(self.version, packed)
+        data = {
+            **StandardMessageFormat._results_fields('prover_results', prover_results, packed),
+            **StandardMessageFormat._results_fields('verifier_results', verifier_results, packed)
+        }
+        if packed:
+            data['num_results'] = num_results
+        
+        message = {
             'protocol': 'QE-ZK',
             'version': self.version,
             'message_type': 'proof',
             'timestamp': datetime.utcnow().isoformat(),
             'data': {
-                'prover_results': proof.prover_results,
-                'verifier_results': proof.verifier_results,
+                **data,
                 'measurement_bases': proof.measurement_bases,
                 'chsh_value': proof.chsh_value,
                 'is_valid': proof.is_valid,
                 'statement': proof.statement
+            }
+        }
+        if include_metadata:
+            message['metadata'] = {
+                'num_measurements': num_results,
+                'protocol_version': self.version
+            }
+        return message
+    
+    def write_standard_proof_message(self, proof: QEZKProof, fp: BinaryIO) -> None:
+        """
+        Write standard proof message to a binary file as MessagePack
+        
+        Results are written as raw bit-packed bytes (``prover_results_packed``
+        and ``verifier_results_packed`` plus ``num_results``), so a proof with
+        N results costs about N/8 bytes per side and no intermediate JSON
+        string or result list is built.
+        
+        Args:
+            proof: QEZKProof to write
+            fp: Binary file-like object open for writing
+            
+        Raises:
+            ConfigurationError: If msgpack is not installed
+        """
+        msgpack = _import_msgpack()
+        
+        num_results = len(proof.measurement_bases)
+        if proof.packed:
+            prover_packed = np.asarray(proof.prover_results, dtype=np.uint8)
+            verifier_packed = np.asarray(proof.verifier_results, dtype=np.uint8)
+        else:
+            prover_packed = np.packbits(np.asarray(proof.prover_results, dtype=np.uint8))
+            verifier_packed = np.packbits(np.asarray(proof.verifier_results, dtype=np.uint8))
+        
+        message = {
+            'protocol': 'QE-ZK',
+            'version': self.version,
+            'message_type': 'proof',
+            'timestamp': datetime.utcnow().isoformat(),
+            'data': {
+                'prover_results_packed': prover_packed.tobytes(),
+                'verifier_results_packed': verifier_packed.tobytes(),
+                'num_results': num_results,
+                'measurement_bases': proof.measurement_bases,
+                'chsh_value': float(proof.chsh_value),
+                'is_valid': bool(proof.is_valid),
+                'statement': proof.statement
             },
             'metadata': {
-                'num_measurements': len(proof.prover_results),
+                'num_measurements': num_results,
                 'protocol_version': self.version
             }
         }
+        msgpack.pack(message, fp, use_bin_type=True)
+    
+    def read_standard_proof_message(self, fp: BinaryIO) -> Dict[str, Any]:
+        """
+        Read standard proof message written by write_standard_proof_message
+        
+        Args:
+            fp: Binary file-like object open for reading
+            
+        Returns:
+            Standardized proof message with ``prover_results`` and
+            ``verifier_results`` unpacked to ``uint8`` arrays
+            
+        Raises:
+            ConfigurationError: If msgpack is not installed
+            ProtocolError: If the packed results are missing or too short
+        """
+        msgpack = _import_msgpack()
+        
+        message = msgpack.unpack(fp, raw=False)
+        data = message.get('data', {})
+        num_results = data.get('num_results', 0)
+        for name in ('prover_results', 'verifier_results'):
+            packed = data.pop(f'{name}_packed', None)
+            if packed is None:
+                raise ProtocolError(f"Missing field in data: {name}_packed")
+            packed = np.frombuffer(packed, dtype=np.uint8)
+            if packed.size * 8 < num_results:
+                raise ProtocolError(
+                    f"Packed {name} hold {packed.size * 8} bits, expected {num_results}"
+                )
+            data[name] = np.unpackbits(packed, count=num_results)
+        return message
     
     def validate_implementation(self) -> Dict[str, Any]:
         """
@@ -6,12 +6,13 @@ Includes quantum nodes, channels, routing, and EPR distribution.
 """
 
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import Iterator, List, Dict, Any, Mapping, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import time
 import threading
-from collections import defaultdict
+from collections import Counter, deque
+from contextlib import ExitStack
 
 from .protocol import QuantumEntanglementZK, QEZKProof
 from .entanglement import EntanglementSource
@@ -49,7 +50,12 @@ class QuantumNode:
 
 @dataclass
 class QuantumChannel:
-    """Quantum channel between nodes"""
+    """
+    Quantum channel between nodes
+    
+    Once added to a QuantumNetwork, assigning ``state`` goes through the
+    network so its channel state counts stay current.
+    """
     channel_id: str
     node_a: str
     node_b: str
@@ -59,6 +65,21 @@ class QuantumChannel:
     latency: float = 0.0  # Latency in seconds
     error_rate: float = 0.0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Route ``state`` changes through the owning network, if any"""
+        if name == 'state':
+            network = self.__dict__.get('_network')
+            if network is not None:
+                network._change_channel_state(self, value)
+                return
+        object.__setattr__(self, name, value)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return picklable state (copies are not attached to a network)"""
+        state = self.__dict__.copy()
+        state.pop('_network', None)
+        return state
 
 
 @dataclass
@@ -66,7 +87,36 @@ class NetworkTopology:
     """Quantum network topology"""
     nodes: Dict[str, QuantumNode] = field(default_factory=dict)
     channels: Dict[str, QuantumChannel] = field(default_factory=dict)
-    routing_table: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    # source -> destination -> shortest path; a live _RoutingTable view
+    # for the topology of a QuantumNetwork
+    routing_table: Mapping[str, Dict[str, List[str]]] = field(default_factory=dict)
+
+
+class _RoutingTable(Mapping):
+    """
+    Read-only routing table of a network: source -> destination -> path
+    
+    Paths are built on lookup from the network's cached BFS parent trees,
+    so the table always reflects the current topology without being
+    recomputed for every source on each change.
+    """
+    
+    def __init__(self, network: 'QuantumNetwork'):
+        self._network = network
+    
+    def __getitem__(self, source: str) -> Dict[str, List[str]]:
+        network = self._network
+        with network.topology_lock:
+            network._discard_stale_routes()
+            if source not in network.topology.nodes:
+                raise KeyError(source)
+            return network._shortest_paths(source)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._network.topology.nodes))
+    
+    def __len__(self) -> int:
+        return len(self._network.topology.nodes)
 
 
 class QuantumNetwork:
@@ -79,8 +129,30 @@ class QuantumNetwork:
     def __init__(self):
         """Initialize quantum network"""
         self.topology = NetworkTopology()
-        self.epr_distribution: Dict[str, List[np.ndarray]] = {}  # node_id -> EPR pairs
-        self.lock = threading.Lock()
+        self.topology.routing_table = _RoutingTable(self)
+        # node_id -> (K, 4) array of EPR pairs, a view of the node's growable buffer
+        self.epr_distribution: Dict[str, np.ndarray] = {}
+        self._epr_buffers: Dict[str, np.ndarray] = {}
+        # topology_lock guards nodes, channels and routing; each node's EPR
+        # store has its own lock so distributions between disjoint node pairs
+        # do not serialize. ``lock`` is kept as an alias for existing callers.
+        self.topology_lock = threading.RLock()
+        self.lock = self.topology_lock
+        self._epr_locks: Dict[str, threading.Lock] = {}
+        # Running totals so statistics do not rescan nodes and EPR pairs
+        self._totals_lock = threading.Lock()
+        self._total_epr_pairs = 0
+        self._node_type_counts: Counter = Counter()
+        self._channel_state_counts: Counter = Counter()
+        # BFS parent trees (node -> parent on its shortest path to the root)
+        # are computed per node on first lookup and kept until the topology
+        # changes (tracked by a version counter)
+        self._parent_trees: Dict[str, Dict[str, Optional[str]]] = {}
+        self._topology_version = 0
+        self._routing_version = 0
+        # Set by freeze(): (source, destination) -> next node on a shortest path
+        self._frozen = False
+        self._next_hop: Dict[Tuple[str, str], str] = {}
     
     def add_node(self, node: QuantumNode):
         """
@@ -89,13 +161,17 @@ class QuantumNetwork:
         Args:
             node: Quantum node to add
         """
-        with self.lock:
+        with self.topology_lock:
+            self._check_not_frozen()
             if node.node_id in self.topology.nodes:
                 raise ConfigurationError(f"Node {node.node_id} already exists")
             
             self.topology.nodes[node.node_id] = node
-            self.epr_distribution[node.node_id] = []
-            self._update_routing_table()
+            self._epr_buffers[node.node_id] = np.empty((0, 4), dtype=complex)
+            self.epr_distribution[node.node_id] = self._epr_buffers[node.node_id]
+            self._epr_locks[node.node_id] = threading.Lock()
+            self._node_type_counts[node.node_type] += 1
+            self._topology_version += 1
     
     def remove_node(self, node_id: str):
         """
@@ -104,28 +180,41 @@ class QuantumNetwork:
         Args:
             node_id: Node ID to remove
         """
-        with self.lock:
+        with self.topology_lock:
+            self._check_not_frozen()
             if node_id not in self.topology.nodes:
                 raise ConfigurationError(f"Node {node_id} not found")
             
-            # Remove channels connected to this node
-            channels_to_remove = [
-                ch_id for ch_id, ch in self.topology.channels.items()
-                if ch.node_a == node_id or ch.node_b == node_id
-            ]
-            for ch_id in channels_to_remove:
-                del self.topology.channels[ch_id]
+            node = self.topology.nodes[node_id]
             
-            # Remove from neighbors
-            for node in self.topology.nodes.values():
-                if node_id in node.neighbors:
-                    node.neighbors.remove(node_id)
+            # Remove channels connected to this node, found through the node's
+            # own channel map rather than a scan of every channel
+            # (a copy, since a self-loop channel is popped from this map too)
+            for ch_id, channel in list(node.channels.items()):
+                if self.topology.channels.pop(ch_id, None) is not None:
+                    self._channel_state_counts[channel.state] -= 1
+                    channel._network = None
+                other_id = channel.node_b if channel.node_a == node_id else channel.node_a
+                other = self.topology.nodes.get(other_id)
+                if other is not None and other_id != node_id:
+                    other.channels.pop(ch_id, None)
+            
+            # Remove from neighbors (every occurrence, since parallel channels
+            # add the same neighbor more than once)
+            for neighbor_id in set(node.neighbors):
+                neighbor = self.topology.nodes.get(neighbor_id)
+                if neighbor is not None:
+                    neighbor.neighbors[:] = [n for n in neighbor.neighbors if n != node_id]
             
             del self.topology.nodes[node_id]
-            if node_id in self.epr_distribution:
-                del self.epr_distribution[node_id]
+            self._node_type_counts[node.node_type] -= 1
+            with self._epr_locks.pop(node_id):
+                removed_pairs = len(self.epr_distribution.pop(node_id))
+                self._epr_buffers.pop(node_id)
+            with self._totals_lock:
+                self._total_epr_pairs -= removed_pairs
             
-            self._update_routing_table()
+            self._topology_version += 1
     
     def add_channel(self, channel: QuantumChannel):
         """
@@ -134,7 +223,8 @@ class QuantumNetwork:
         Args:
             channel: Quantum channel to add
         """
-        with self.lock:
+        with self.topology_lock:
+            self._check_not_frozen()
             if channel.channel_id in self.topology.channels:
                 raise ConfigurationError(f"Channel {channel.channel_id} already exists")
             
@@ -145,6 +235,8 @@ class QuantumNetwork:
                 raise ConfigurationError(f"Node {channel.node_b} not found")
             
             self.topology.channels[channel.channel_id] = channel
+            self._channel_state_counts[channel.state] += 1
+            channel._network = self
             
             # Update node neighbors
             self.topology.nodes[channel.node_a].neighbors.append(channel.node_b)
@@ -154,36 +246,193 @@ class QuantumNetwork:
             self.topology.nodes[channel.node_a].channels[channel.channel_id] = channel
             self.topology.nodes[channel.node_b].channels[channel.channel_id] = channel
             
-            self._update_routing_table()
+            self._topology_version += 1
+    
+    def _check_not_frozen(self):
+        """Raise if the topology is frozen (caller holds the topology lock)"""
+        if self._frozen:
+            raise ConfigurationError("Network topology is frozen; call thaw() before modifying it")
+    
+    def freeze(self):
+        """
+        Precompute routing for a topology that will no longer change
+        
+        Runs a BFS from every node and stores the next hop on a shortest
+        path for every (source, destination) pair. Until ``thaw()`` is
+        called, ``find_path`` follows these next hops without locking or
+        searching, and adding or removing nodes or channels raises
+        ConfigurationError.
+        """
+        with self.topology_lock:
+            next_hop = {}
+            # The BFS parent of a node in the destination's tree is the next
+            # hop from that node towards the destination
+            for destination in self.topology.nodes:
+                for node_id, parent in self._bfs_parents(destination).items():
+                    if parent is not None:
+                        next_hop[(node_id, destination)] = parent
+            
+            self._next_hop = next_hop
+            self._frozen = True
+    
+    def thaw(self):
+        """Discard the routing computed by ``freeze()`` and allow topology changes again"""
+        with self.topology_lock:
+            self._frozen = False
+            self._next_hop = {}
+    
+    def set_channel_state(self, channel_id: str, state: ChannelState):
+        """
+        Change a channel's state
+        
+        Equivalent to assigning ``channel.state`` on a channel of this
+        network; both keep the network's channel state counts current.
+        
+        Args:
+            channel_id: Channel ID
+            state: New channel state
+        """
+        with self.topology_lock:
+            channel = self.topology.channels.get(channel_id)
+            if channel is None:
+                raise ConfigurationError(f"Channel {channel_id} not found")
+            
+            self._change_channel_state(channel, state)
+    
+    def _change_channel_state(self, channel: QuantumChannel, state: ChannelState):
+        """Set a channel's state and move it between the state counts"""
+        with self.topology_lock:
+            self._channel_state_counts[channel.state] -= 1
+            self._channel_state_counts[state] += 1
+            object.__setattr__(channel, 'state', state)
+    
+    def _bfs_parents(self, root_id: str) -> Dict[str, Optional[str]]:
+        """
+        BFS tree of every node reachable from a root, as parent pointers
+        
+        Args:
+            root_id: Root node ID
+            
+        Returns:
+            Mapping of node ID to its parent on a shortest path to the root
+            (None for the root itself), in BFS order
+        """
+        nodes = self.topology.nodes
+        parents = {root_id: None}
+        queue = deque([root_id])
+        
+        while queue:
+            current = queue.popleft()
+            for neighbor in nodes[current].neighbors:
+                if neighbor not in parents:
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+        
+        return parents
+    
+    def _shortest_paths(self, source_id: str) -> Dict[str, List[str]]:
+        """
+        Shortest paths from a node to every node reachable from it (BFS)
+        
+        Caller holds the topology lock and has discarded stale routes.
+        
+        Args:
+            source_id: Source node ID
+            
+        Returns:
+            Mapping of destination node ID to path (list of node IDs)
+        """
+        parents = self._parents_from(source_id)
+        
+        # Parents are recorded in BFS order, so each node's parent path is
+        # already built when the node is reached
+        paths = {source_id: [source_id]}
+        for destination, parent in parents.items():
+            if parent is not None:
+                paths[destination] = paths[parent] + [destination]
+        del paths[source_id]
+        return paths
     
-    def _update_routing_table(self):
-        """Update routing table using shortest path algorithm"""
-        # Simple shortest path (BFS)
-        routing_table = {}
+    def _parents_from(self, root: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Cached BFS parent tree for a node, computing it if needed
+        
+        Caller holds the topology lock and has discarded stale routes.
         
-        for source_id in self.topology.nodes:
-            routing_table[source_id] = {}
+        Args:
+            root: Root node ID
             
-            # BFS from source
-            queue = [(source_id, [source_id])]
-            visited = {source_id}
+        Returns:
+            Parent tree from ``_bfs_parents``, or None if the node does not exist
+        """
+        parents = self._parent_trees.get(root)
+        if parents is None and root in self.topology.nodes:
+            parents = self._parent_trees[root] = self._bfs_parents(root)
+        return parents
+    
+    def _discard_stale_routes(self):
+        """Drop routes computed for an older topology version"""
+        if self._routing_version != self._topology_version:
+            self._parent_trees = {}
+            self._routing_version = self._topology_version
+    
+    @staticmethod
+    def _walk_parents(parents: Dict[str, Optional[str]], start: str) -> List[str]:
+        """
+        Follow parent pointers from a node up to the root of its tree
+        
+        Args:
+            parents: Parent tree from ``_bfs_parents``
+            start: Node ID in the tree
             
-            while queue:
-                current, path = queue.pop(0)
-                
-                for neighbor in self.topology.nodes[current].neighbors:
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        new_path = path + [neighbor]
-                        routing_table[source_id][neighbor] = new_path
-                        queue.append((neighbor, new_path))
-        
-        self.topology.routing_table = routing_table
+        Returns:
+            Nodes from ``start`` to the root, inclusive
+        """
+        walk = [start]
+        parent = parents[start]
+        while parent is not None:
+            walk.append(parent)
+            parent = parents[parent]
+        return walk
     
     def find_path(self, source: str, destination: str) -> Optional[List[str]]:
         """
         Find path between nodes
         
+        After ``freeze()`` the path is read from the precomputed next-hop
+        table. Otherwise it is rebuilt from a cached BFS parent tree by
+        following parent pointers, which costs only the path length.
+        Channels are undirected, so if only the destination's tree has been
+        computed, walking it from the source gives a path without running
+        another BFS. Either way the path is a shortest one.
+        
+        Args:
+            source: Source node ID
+            destination: Destination node ID
+            
+        Returns:
+            Path as list of node IDs, or None if no path exists
+        """
+        if self._frozen:
+            return self._frozen_path(source, destination)
+        
+        with self.topology_lock:
+            self._discard_stale_routes()
+            if source not in self._parent_trees and destination in self._parent_trees:
+                parents = self._parent_trees[destination]
+                if source not in parents:
+                    return None
+                return self._walk_parents(parents, source)
+            
+            parents = self._parents_from(source)
+            if parents is None or destination == source or destination not in parents:
+                return None
+            return self._walk_parents(parents, destination)[::-1]
+    
+    def _frozen_path(self, source: str, destination: str) -> Optional[List[str]]:
+        """
+        Path between nodes from the next-hop table built by ``freeze()``
+        
         Args:
             source: Source node ID
             destination: Destination node ID
@@ -191,16 +440,22 @@ class QuantumNetwork:
         Returns:
             Path as list of node IDs, or None if no path exists
         """
-        if source not in self.topology.routing_table:
+        next_hop = self._next_hop
+        current = next_hop.get((source, destination))
+        if current is None:
             return None
         
-        return self.topology.routing_table[source].get(destination)
+        path = [source, current]
+        while current != destination:
+            current = next_hop[(current, destination)]
+            path.append(current)
+        return path
     
     def distribute_epr_pairs(self,
                             source: str,
                             destination: str,
                             num_pairs: int,
-                            state_type: str = 'phi_plus') -> Tuple[List[np.ndarray], List[np.ndarray]]:
+                            state_type: str = 'phi_plus') -> Tuple[np.ndarray, np.ndarray]:
         """
         Distribute EPR pairs over network
         
@@ -211,7 +466,7 @@ class QuantumNetwork:
             state_type: Bell state type
             
         Returns:
-            Tuple of (source_pairs, destination_pairs)
+            Tuple of (source_pairs, destination_pairs), each a (num_pairs, 4) array
         """
         if source not in self.topology.nodes:
             raise ConfigurationError(f"Source node {source} not found")
@@ -222,27 +477,65 @@ class QuantumNetwork:
         if source_node.qezk_instance is None:
             raise ProtocolError(f"Source node {source} has no QE-ZK instance")
         
-        # Find path
-        path = self.find_path(source, destination)
-        if path is None:
-            raise ProtocolError(f"No path from {source} to {destination}")
+        # Only reachability matters here. A node reaches itself and its
+        # direct neighbors, so the routing lookup is needed only beyond that
+        if source != destination and destination not in source_node.neighbors:
+            if self.find_path(source, destination) is None:
+                raise ProtocolError(f"No path from {source} to {destination}")
         
         # Generate EPR pairs at source
         entanglement = EntanglementSource(source_node.qezk_instance.quantum_prep)
-        epr_pairs = entanglement.generate_epr_pairs(num_pairs, state_type)
+        epr_pairs = entanglement.generate_epr_pairs_bulk(num_pairs, state_type)
         
         # Distribute along path (simplified - in real network, would use quantum repeaters)
         # For now, simulate direct distribution
         source_pairs = epr_pairs
         destination_pairs = epr_pairs  # In simulation, same reference
         
-        # Store at nodes
-        with self.lock:
-            self.epr_distribution[source].extend(source_pairs)
-            self.epr_distribution[destination].extend(destination_pairs)
+        # Store at nodes, holding only the two nodes' EPR locks (taken in a
+        # fixed order so concurrent distributions cannot deadlock)
+        node_ids = sorted({source, destination})
+        with self.topology_lock:
+            epr_locks = [self._epr_locks.get(node_id) for node_id in node_ids]
+        if None in epr_locks:
+            raise ConfigurationError("Node removed during EPR distribution")
+        
+        with ExitStack() as stack:
+            for epr_lock in epr_locks:
+                stack.enter_context(epr_lock)
+            if any(node_id not in self._epr_buffers for node_id in node_ids):
+                raise ConfigurationError("Node removed during EPR distribution")
+            self._append_epr_pairs(source, source_pairs)
+            self._append_epr_pairs(destination, destination_pairs)
+        
+        with self._totals_lock:
+            self._total_epr_pairs += len(source_pairs) + len(destination_pairs)
         
         return source_pairs, destination_pairs
     
+    def _append_epr_pairs(self, node_id: str, pairs: np.ndarray):
+        """
+        Append EPR pairs to a node's store (caller holds the node's EPR lock)
+        
+        Pairs are kept in one (capacity, 4) buffer per node that doubles when
+        full, so appends are amortized O(len(pairs)).
+        
+        Args:
+            node_id: Node ID
+            pairs: (K, 4) array of EPR pairs
+        """
+        buffer = self._epr_buffers[node_id]
+        count = len(self.epr_distribution[node_id])
+        needed = count + len(pairs)
+        
+        if needed > len(buffer):
+            grown = np.empty((max(needed, 2 * len(buffer)), 4), dtype=complex)
+            grown[:count] = buffer[:count]
+            buffer = self._epr_buffers[node_id] = grown
+        
+        buffer[count:needed] = pairs
+        self.epr_distribution[node_id] = buffer[:needed]
+    
     def get_node(self, node_id: str) -> Optional[QuantumNode]:
         """Get node by ID"""
         return self.topology.nodes.get(node_id)
@@ -257,11 +550,14 @@ class QuantumNetwork:
             'num_nodes': len(self.topology.nodes),
             'num_channels': len(self.topology.channels),
             'node_types': {
-                node_type.value: sum(1 for n in self.topology.nodes.values() 
-                                   if n.node_type == node_type)
+                node_type.value: self._node_type_counts[node_type]
                 for node_type in NodeType
             },
-            'total_epr_pairs': sum(len(pairs) for pairs in self.epr_distribution.values())
+            'channel_states': {
+                channel_state.value: self._channel_state_counts[channel_state]
+                for channel_state in ChannelState
+            },
+            'total_epr_pairs': self._total_epr_pairs
         }
 
 
@@ -281,6 +577,18 @@ class QuantumNetworkProtocol:
         """
         self.network = network
     
+    @staticmethod
+    def _seed_instances(seed: Optional[int], *instances: QuantumEntanglementZK):
+        """
+        Seed the random state the given QE-ZK instances measure with
+        
+        Args:
+            seed: Random seed, or None to leave the random state untouched
+            instances: QE-ZK instances taking part in the run
+        """
+        for qezk in instances:
+            qezk._set_seed(seed)
+    
     def execute_protocol(self,
                         prover_id: str,
                         verifier_id: str,
@@ -315,6 +623,8 @@ class QuantumNetworkProtocol:
         if verifier_node.qezk_instance is None:
             raise ProtocolError(f"Verifier node {verifier_id} has no QE-ZK instance")
         
+        self._seed_instances(seed, prover_node.qezk_instance, verifier_node.qezk_instance)
+        
         # Distribute EPR pairs over network
         prover_particles, verifier_particles = self.network.distribute_epr_pairs(
             prover_id, verifier_id, num_epr_pairs, 'phi_plus'
@@ -385,6 +695,7 @@ class QuantumNetworkProtocol:
         # Execute protocol
         prover_node = self.network.get_node(prover_id)
         verifier_node = self.network.get_node(verifier_id)
+        self._seed_instances(seed, prover_node.qezk_instance, verifier_node.qezk_instance)
         
         qezk = prover_node.qezk_instance
         
@@ -460,16 +771,13 @@ class QuantumNetworkMonitor:
         """Collect network metrics"""
         stats = self.network.get_network_stats()
         
-        # Channel states
-        channel_states = defaultdict(int)
-        for channel in self.network.topology.channels.values():
-            channel_states[channel.state.value] += 1
-        
         return {
             'timestamp': time.time(),
             'stats': stats,
-            'channel_states': dict(channel_states),
-            'num_epr_pairs': sum(len(pairs) for pairs in self.network.epr_distribution.values())
+            'channel_states': {
+                state: count for state, count in stats['channel_states'].items() if count
+            },
+            'num_epr_pairs': stats['total_epr_pairs']
         }
     
     def get_metrics(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -492,23 +800,17 @@ class QuantumNetworkMonitor:
         
         # Calculate health score
         total_channels = stats['num_channels']
+        online_channels = total_channels - stats['channel_states'][ChannelState.OFFLINE.value]
         if total_channels == 0:
             health_score = 0.0
         else:
-            online_channels = sum(
-                1 for ch in self.network.topology.channels.values()
-                if ch.state != ChannelState.OFFLINE
-            )
             health_score = online_channels / total_channels
         
         return {
             'health_score': health_score,
             'num_nodes': stats['num_nodes'],
             'num_channels': stats['num_channels'],
-            'online_channels': sum(
-                1 for ch in self.network.topology.channels.values()
-                if ch.state != ChannelState.OFFLINE
-            ),
+            'online_channels': online_channels,
             'total_epr_pairs': stats['total_epr_pairs']
         }
 
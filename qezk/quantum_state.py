@@ -9,6 +9,56 @@ from typing import Literal
 from .exceptions import QuantumStateError
 
 
+_INV_SQRT2 = 1 / np.sqrt(2)
+
+
+def _constant(values) -> np.ndarray:
+    """Build a read-only complex array"""
+    array = np.array(values, dtype=complex)
+    array.setflags(write=False)
+    return array
+
+
+# Single-qubit gates
+_H = _constant([[_INV_SQRT2, _INV_SQRT2], [_INV_SQRT2, -_INV_SQRT2]])  # Hadamard
+_X = _constant([[0, 1], [1, 0]])  # Pauli-X
+_Y = _constant([[0, -1j], [1j, 0]])  # Pauli-Y
+_Z = _constant([[1, 0], [0, -1]])  # Pauli-Z
+_I = _constant(np.eye(2))  # Identity
+
+# Two-qubit CNOT gate
+_CNOT = _constant([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+    [0, 0, 1, 0]
+])
+
+
+def _lift(gate: np.ndarray, qubit: int) -> np.ndarray:
+    """Build the read-only 4x4 matrix applying ``gate`` to one qubit"""
+    full = np.kron(gate, _I) if qubit == 0 else np.kron(_I, gate)
+    full.setflags(write=False)
+    return full
+
+
+# Fixed gates lifted to the 2-qubit space, keyed by (name, qubit)
+_GATE_FULL = {
+    (name, qubit): _lift(gate, qubit)
+    for name, gate in (('H', _H), ('X', _X), ('Y', _Y), ('Z', _Z), ('I', _I))
+    for qubit in (0, 1)
+}
+
+
+# The four Bell states, as CNOT(H ⊗ I)|00⟩ followed by Z, X or Y on the first qubit
+_BELL_STATES = {
+    'phi_plus': _constant([_INV_SQRT2, 0, 0, _INV_SQRT2]),
+    'phi_minus': _constant([_INV_SQRT2, 0, 0, -_INV_SQRT2]),
+    'psi_plus': _constant([0, _INV_SQRT2, _INV_SQRT2, 0]),
+    'psi_minus': _constant([0, -1j * _INV_SQRT2, 1j * _INV_SQRT2, 0]),
+}
+
+
 class QuantumStatePreparation:
     """
     Quantum state preparation and manipulation
@@ -17,22 +67,14 @@ class QuantumStatePreparation:
     quantum states, particularly Bell states for entanglement.
     """
     
-    def __init__(self):
-        """Initialize quantum gates"""
-        # Single-qubit gates
-        self.H = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)  # Hadamard
-        self.X = np.array([[0, 1], [1, 0]], dtype=complex)  # Pauli-X
-        self.Y = np.array([[0, -1j], [1j, 0]], dtype=complex)  # Pauli-Y
-        self.Z = np.array([[1, 0], [0, -1]], dtype=complex)  # Pauli-Z
-        self.I = np.eye(2, dtype=complex)  # Identity
-        
-        # Two-qubit CNOT gate
-        self.CNOT = np.array([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 0, 1],
-            [0, 0, 1, 0]
-        ], dtype=complex)
+    # Gates are immutable, so every instance shares the module-level arrays
+    H = _H
+    X = _X
+    Y = _Y
+    Z = _Z
+    I = _I
+    CNOT = _CNOT
+    _gate_full = _GATE_FULL
     
     def create_bell_state(self, state_type: Literal['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus'] = 'phi_plus') -> np.ndarray:
         """
@@ -44,31 +86,25 @@ class QuantumStatePreparation:
         Returns:
             4-element complex array representing the 2-qubit Bell state
         """
-        # Start with |00⟩ = [1, 0, 0, 0]
-        state = np.array([1, 0, 0, 0], dtype=complex)
-        
-        # Apply Hadamard to first qubit: (H ⊗ I)|00⟩
-        H_full = np.kron(self.H, self.I)
-        state = H_full @ state
-        
-        # Apply CNOT: CNOT(H ⊗ I)|00⟩ = |Φ⁺⟩ = (|00⟩ + |11⟩)/√2
-        state = self.CNOT @ state
-        
-        # Apply additional gates for other Bell states
-        if state_type == 'phi_minus':
-            # |Φ⁻⟩ = (|00⟩ - |11⟩)/√2
-            Z_full = np.kron(self.Z, self.I)
-            state = Z_full @ state
-        elif state_type == 'psi_plus':
-            # |Ψ⁺⟩ = (|01⟩ + |10⟩)/√2
-            X_full = np.kron(self.X, self.I)
-            state = X_full @ state
-        elif state_type == 'psi_minus':
-            # |Ψ⁻⟩ = (|01⟩ - |10⟩)/√2
-            Y_full = np.kron(self.Y, self.I)
-            state = Y_full @ state
+        # Bell states are constant, so return a copy of the precomputed vector
+        # instead of applying CNOT(H ⊗ I) to |00⟩ on every call. Unknown types
+        # give |Φ⁺⟩, as before.
+        return _BELL_STATES.get(state_type, _BELL_STATES['phi_plus']).copy()
+    
+    def create_bell_states(self, num_states: int,
+                           state_type: Literal['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus'] = 'phi_plus') -> np.ndarray:
+        """
+        Create many copies of a Bell state at once
         
-        return state
+        Args:
+            num_states: Number of states to create
+            state_type: Type of Bell state to create
+            
+        Returns:
+            (num_states, 4) complex array with one Bell state per row
+        """
+        bell_state = _BELL_STATES.get(state_type, _BELL_STATES['phi_plus'])
+        return np.broadcast_to(bell_state, (num_states, 4)).copy()
     
     def apply_gate(self, state: np.ndarray, gate: np.ndarray, qubit: int = 0) -> np.ndarray:
         """
@@ -94,38 +130,62 @@ class QuantumStatePreparation:
             if qubit not in [0, 1]:
                 raise QuantumStateError(f"Qubit must be 0 or 1, got {qubit}")
             
+            # View the state as amplitudes S[q0, q1] and contract the gate with
+            # one index instead of building the 4x4 gate ⊗ I or I ⊗ gate
+            amplitudes = state.reshape(2, 2)
             if qubit == 0:
-                # Apply gate to first qubit: gate ⊗ I
-                gate_full = np.kron(gate, self.I)
+                result = gate @ amplitudes
             else:
-                # Apply gate to second qubit: I ⊗ gate
-                gate_full = np.kron(self.I, gate)
-            
-            result = gate_full @ state
-            
-            # Validate result
-            if result.shape != (4,):
-                raise QuantumStateError(f"Result shape mismatch: {result.shape}")
+                result = amplitudes @ gate.T
             
-            return result
+            return result.ravel()
             
         except QuantumStateError:
             raise
         except Exception as e:
             raise QuantumStateError(f"Gate application failed: {str(e)}") from e
     
+    def apply_named_gate(self, state: np.ndarray, name: str, qubit: int = 0) -> np.ndarray:
+        """
+        Apply one of the fixed gates (H, X, Y, Z, I) to a 2-qubit state
+        
+        Uses the precomputed 4x4 matrix for the gate. Use ``apply_gate``
+        for any other gate.
+        
+        Args:
+            state: 4-element array representing 2-qubit state
+            name: Gate name ('H', 'X', 'Y', 'Z' or 'I')
+            qubit: Which qubit to apply gate to (0 or 1)
+            
+        Returns:
+            Transformed quantum state
+            
+        Raises:
+            QuantumStateError: If the gate or qubit is unknown or the state has the wrong shape
+        """
+        gate_full = self._gate_full.get((name, qubit))
+        if gate_full is None:
+            raise QuantumStateError(f"Unknown gate {name!r} on qubit {qubit}")
+        if state.shape != (4,):
+            raise QuantumStateError(f"State must be 4-element array, got shape {state.shape}")
+        return gate_full @ state
+    
     def normalize_state(self, state: np.ndarray) -> np.ndarray:
         """
         Normalize quantum state to unit length
         
         Args:
-            state: Quantum state vector
+            state: Quantum state vector, or an (N, d) array with one state per row
             
         Returns:
-            Normalized quantum state
+            Normalized quantum state(s). States with (near) zero norm are
+            returned unchanged.
         """
-        norm = np.sqrt(np.sum(np.abs(state)**2))
-        if norm > 1e-10:
-            return state / norm
-        return state
-
+        if state.ndim == 1:
+            norm = np.linalg.norm(state)
+            if norm > 1e-10:
+                return state / norm
+            return state
+        
+        norms = np.linalg.norm(state, axis=-1, keepdims=True)
+        return state / np.where(norms > 1e-10, norms, 1.0)
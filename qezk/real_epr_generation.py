@@ -5,12 +5,26 @@ Implementation for generating real entangled EPR pairs on quantum hardware.
 This module provides physical entanglement generation and verification.
 """
 
+import asyncio
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Tuple, Optional, Dict, Any
 from .exceptions import EntanglementError, QuantumStateError
 from .hardware_interface import QuantumHardwareBackend, SimulationBackend
 
 
+# Nonzero amplitudes of each Bell state, as slices so indexing gives views:
+# |00⟩,|11⟩ for Φ states and |01⟩,|10⟩ for Ψ states. Noise is only drawn for
+# these, since the model scales it by |amplitude| anyway
+_BELL_SUPPORT = {
+    'phi_plus': slice(0, 4, 3),
+    'phi_minus': slice(0, 4, 3),
+    'psi_plus': slice(1, 3),
+    'psi_minus': slice(1, 3),
+}
+_FULL_SUPPORT = slice(None)
+
+
 class RealEPRGenerator:
     """
     Real EPR pair generator for quantum hardware
@@ -19,15 +33,20 @@ class RealEPRGenerator:
     and verifies entanglement through Bell inequality tests.
     """
     
-    def __init__(self, backend: QuantumHardwareBackend):
+    def __init__(self, backend: QuantumHardwareBackend, seed: Optional[int] = None):
         """
         Initialize real EPR generator
         
         Args:
             backend: Quantum hardware backend for EPR generation
+            seed: Optional seed for the generator's random sampling
         """
         self.backend = backend
+        self._backend_name = type(backend).__name__
+        self._rng = np.random.default_rng(seed)
         self.entanglement_verified = False
+        # Reference Bell states for fidelity, prepared once per state type
+        self._bell_cache: Dict[str, np.ndarray] = {}
     
     def generate_epr_pair(self, state_type: str = 'phi_plus', 
                          verify: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
@@ -46,38 +65,53 @@ class RealEPRGenerator:
             metadata contains generation info and verification results
         """
         try:
-            # Reset backend to clean state
-            self.backend.reset()
-            
-            # Create Bell state on hardware
-            epr_state = self.backend.create_bell_state(state_type)
-            
-            metadata = {
-                'state_type': state_type,
-                'generated': True,
-                'hardware_backend': type(self.backend).__name__,
-                'verification': None
-            }
-            
-            # Verify entanglement if requested
-            if verify:
-                verification_result = self.verify_entanglement(epr_state, state_type)
-                metadata['verification'] = verification_result
-                self.entanglement_verified = verification_result['is_entangled']
-            
-            return epr_state, metadata
-            
+            return self._generate_epr_pair_unchecked(state_type, verify)
         except Exception as e:
             raise EntanglementError(f"EPR pair generation failed: {str(e)}") from e
     
+    def _generate_epr_pair_unchecked(self, state_type: str,
+                                     verify: bool) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Body of ``generate_epr_pair`` without the error wrapping
+        
+        Callers are responsible for turning failures into EntanglementError.
+        
+        Args:
+            state_type: Type of Bell state
+            verify: Whether to verify entanglement after generation
+            
+        Returns:
+            Tuple of (epr_state, metadata)
+        """
+        # Reset backend to clean state
+        self.backend.reset()
+        
+        # Create Bell state on hardware
+        epr_state = self.backend.create_bell_state(state_type)
+        
+        metadata = {
+            'state_type': state_type,
+            'generated': True,
+            'hardware_backend': self._backend_name,
+            'verification': None
+        }
+        
+        # Verify entanglement if requested
+        if verify:
+            verification_result = self._verify_entanglement_unchecked(epr_state, state_type)
+            metadata['verification'] = verification_result
+            self.entanglement_verified = verification_result['is_entangled']
+        
+        return epr_state, metadata
+    
     def generate_epr_pairs(self, num_pairs: int, 
                           state_type: str = 'phi_plus',
-                          verify_sample: Optional[int] = None) -> Tuple[List[np.ndarray], Dict[str, Any]]:
+                          verify_sample: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Generate multiple real EPR pairs on quantum hardware
         
-        Generates a batch of entangled pairs. For efficiency, only a sample
-        may be verified on real hardware.
+        Generates the whole batch with one backend call. For efficiency,
+        only a sample may be verified on real hardware.
         
         Args:
             num_pairs: Number of EPR pairs to generate
@@ -85,46 +119,143 @@ class RealEPRGenerator:
             verify_sample: Number of pairs to verify (None = verify all, 0 = verify none)
             
         Returns:
-            Tuple of (epr_pairs, batch_metadata)
+            Tuple of (epr_pairs, batch_metadata), where epr_pairs is a
+            (num_pairs, 4) array with one EPR pair per row
         """
         if num_pairs < 1:
             raise EntanglementError(f"num_pairs must be >= 1, got {num_pairs}")
         
-        epr_pairs = []
         verification_results = []
+        verify_mask = self._verification_mask(num_pairs, verify_sample)
+        
+        # Generate pairs and verify the sampled ones, in generation order,
+        # under a single error boundary for the whole batch
+        try:
+            self.backend.reset()
+            epr_pairs = self.backend.create_bell_states(num_pairs, state_type)
+            
+            for i in np.flatnonzero(verify_mask):
+                verification_result = self._verify_entanglement_unchecked(epr_pairs[i], state_type)
+                verification_results.append(verification_result)
+                self.entanglement_verified = verification_result['is_entangled']
+        except Exception as e:
+            raise EntanglementError(f"EPR pair generation failed: {str(e)}") from e
+        
+        return epr_pairs, self._batch_metadata(num_pairs, state_type, verification_results)
+    
+    async def generate_epr_pairs_async(self, num_pairs: int,
+                                       state_type: str = 'phi_plus',
+                                       verify_sample: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Asynchronous ``generate_epr_pairs``
+        
+        Verifies the sampled pairs concurrently with
+        ``verify_entanglement_async``, so on a remote backend the batch
+        waits roughly one measurement round trip instead of one per shot.
+        
+        Args:
+            num_pairs: Number of EPR pairs to generate
+            state_type: Type of Bell state
+            verify_sample: Number of pairs to verify (None = verify all, 0 = verify none)
+            
+        Returns:
+            Tuple of (epr_pairs, batch_metadata), as from ``generate_epr_pairs``
+        """
+        if num_pairs < 1:
+            raise EntanglementError(f"num_pairs must be >= 1, got {num_pairs}")
+        
+        verify_mask = self._verification_mask(num_pairs, verify_sample)
+        
+        try:
+            self.backend.reset()
+            epr_pairs = self.backend.create_bell_states(num_pairs, state_type)
+            
+            verification_results = await asyncio.gather(*[
+                self._verify_entanglement_unchecked_async(epr_pairs[i], state_type)
+                for i in np.flatnonzero(verify_mask)
+            ])
+        except Exception as e:
+            raise EntanglementError(f"EPR pair generation failed: {str(e)}") from e
         
+        if verification_results:
+            self.entanglement_verified = verification_results[-1]['is_entangled']
+        
+        return epr_pairs, self._batch_metadata(num_pairs, state_type, verification_results)
+    
+    def iter_epr_pairs(self, num_pairs: int, state_type: str = 'phi_plus',
+                       verify_every: Optional[int] = None) -> Iterator[Tuple[np.ndarray, Dict[str, Any]]]:
+        """
+        Generate EPR pairs one at a time
+        
+        Unlike ``generate_epr_pairs`` the batch is never held in memory,
+        so a consumer can use or distribute each pair as it is produced.
+        
+        Args:
+            num_pairs: Number of EPR pairs to generate
+            state_type: Type of Bell state
+            verify_every: Verify every n-th pair, starting with the first
+                          (None or 0 = verify none)
+            
+        Yields:
+            Tuples of (epr_state, metadata), as from ``generate_epr_pair``
+        """
+        if num_pairs < 1:
+            raise EntanglementError(f"num_pairs must be >= 1, got {num_pairs}")
+        
+        for i in range(num_pairs):
+            verify = bool(verify_every) and i % verify_every == 0
+            try:
+                state, metadata = self._generate_epr_pair_unchecked(state_type, verify)
+            except Exception as e:
+                raise EntanglementError(f"EPR pair generation failed: {str(e)}") from e
+            yield state, metadata
+    
+    def _verification_mask(self, num_pairs: int, verify_sample: Optional[int]) -> np.ndarray:
+        """
+        Choose which pairs of a batch to verify
+        
+        Args:
+            num_pairs: Number of EPR pairs in the batch
+            verify_sample: Number of pairs to verify (None = verify all, 0 = verify none)
+            
+        Returns:
+            Boolean mask over the batch
+        """
         # Determine verification strategy
         if verify_sample is None:
             verify_sample = num_pairs  # Verify all by default
         elif verify_sample < 0:
             verify_sample = 0  # No verification
         
-        verify_indices = set()
+        verify_mask = np.zeros(num_pairs, dtype=bool)
         if verify_sample > 0:
             # Select random sample for verification
             if verify_sample >= num_pairs:
-                verify_indices = set(range(num_pairs))
+                verify_mask[:] = True
             else:
-                import random
-                verify_indices = set(random.sample(range(num_pairs), verify_sample))
+                verify_mask[self._rng.choice(num_pairs, verify_sample, replace=False)] = True
+        return verify_mask
+    
+    def _batch_metadata(self, num_pairs: int, state_type: str,
+                        verification_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Aggregate per-pair verification results into batch metadata
         
-        # Generate pairs
-        for i in range(num_pairs):
-            verify_this = i in verify_indices
-            epr_state, metadata = self.generate_epr_pair(state_type, verify=verify_this)
-            epr_pairs.append(epr_state)
+        Args:
+            num_pairs: Number of EPR pairs in the batch
+            state_type: Type of Bell state
+            verification_results: Verification dictionaries of the sampled pairs
             
-            if verify_this and metadata['verification']:
-                verification_results.append(metadata['verification'])
-        
-        # Aggregate metadata
+        Returns:
+            Batch metadata dictionary
+        """
         batch_metadata = {
             'num_pairs': num_pairs,
             'state_type': state_type,
             'verified_count': len(verification_results),
             'verification_rate': len(verification_results) / num_pairs if num_pairs > 0 else 0,
             'average_fidelity': None,
-            'backend': type(self.backend).__name__
+            'backend': self._backend_name
         }
         
         if verification_results:
@@ -132,7 +263,7 @@ class RealEPRGenerator:
             if fidelities:
                 batch_metadata['average_fidelity'] = np.mean(fidelities)
         
-        return epr_pairs, batch_metadata
+        return batch_metadata
     
     def verify_entanglement(self, state: np.ndarray, expected_type: str = 'phi_plus') -> Dict[str, Any]:
         """
@@ -148,47 +279,97 @@ class RealEPRGenerator:
             Dictionary with verification results
         """
         try:
-            # Perform measurements in different bases
-            measurements = []
-            
-            # Measure in Z basis
-            for _ in range(100):  # Multiple measurements for statistics
-                result = self.backend.measure(0, 'Z')
-                measurements.append(('Z', result))
-            
-            # Measure in X basis
-            for _ in range(100):
-                result = self.backend.measure(0, 'X')
-                measurements.append(('X', result))
-            
-            # Calculate correlation
-            z_results = [m[1] for m in measurements if m[0] == 'Z']
-            x_results = [m[1] for m in measurements if m[0] == 'X']
-            
-            # Check for entanglement signatures
-            z_correlation = np.mean(z_results) if z_results else 0.5
-            x_correlation = np.mean(x_results) if x_results else 0.5
-            
-            # Entangled states should show specific correlation patterns
-            is_entangled = self._check_entanglement_pattern(
-                z_correlation, x_correlation, expected_type
-            )
-            
-            # Calculate fidelity (simplified)
-            fidelity = self._calculate_fidelity(state, expected_type)
-            
-            return {
-                'is_entangled': is_entangled,
-                'fidelity': fidelity,
-                'z_correlation': z_correlation,
-                'x_correlation': x_correlation,
-                'measurements_count': len(measurements),
-                'expected_type': expected_type
-            }
+            return self._verify_entanglement_unchecked(state, expected_type)
+        except Exception as e:
+            raise EntanglementError(f"Entanglement verification failed: {str(e)}") from e
+    
+    async def verify_entanglement_async(self, state: np.ndarray,
+                                        expected_type: str = 'phi_plus') -> Dict[str, Any]:
+        """
+        Asynchronous ``verify_entanglement``
+        
+        Submits the Z- and X-basis shots together through the backend's
+        ``measure_batch_async``, for remote backends where each
+        measurement waits on the network.
+        
+        Args:
+            state: Quantum state to verify
+            expected_type: Expected Bell state type
             
+        Returns:
+            Dictionary with verification results
+        """
+        try:
+            return await self._verify_entanglement_unchecked_async(state, expected_type)
         except Exception as e:
             raise EntanglementError(f"Entanglement verification failed: {str(e)}") from e
     
+    async def _verify_entanglement_unchecked_async(self, state: np.ndarray,
+                                                   expected_type: str) -> Dict[str, Any]:
+        """Body of ``verify_entanglement_async`` without the error wrapping"""
+        z_results, x_results = await asyncio.gather(
+            self.backend.measure_batch_async(0, 'Z', 100),
+            self.backend.measure_batch_async(0, 'X', 100)
+        )
+        verification = self._summarize_measurements(z_results, x_results, expected_type)
+        verification['fidelity'] = self._calculate_fidelity(state, expected_type)
+        return verification
+    
+    def _verify_entanglement_unchecked(self, state: np.ndarray, expected_type: str) -> Dict[str, Any]:
+        """Body of ``verify_entanglement`` without the error wrapping"""
+        verification = self._measure_entanglement(expected_type)
+        
+        # Calculate fidelity (simplified)
+        verification['fidelity'] = self._calculate_fidelity(state, expected_type)
+        
+        return verification
+    
+    def _measure_entanglement(self, expected_type: str = 'phi_plus') -> Dict[str, Any]:
+        """
+        Measurement part of ``verify_entanglement``, without error wrapping
+        
+        Args:
+            expected_type: Expected Bell state type
+            
+        Returns:
+            Dictionary with every verification result except the fidelity
+        """
+        # Perform measurements in different bases, with multiple
+        # measurements per basis for statistics
+        z_results = self.backend.measure_batch(0, 'Z', 100)
+        x_results = self.backend.measure_batch(0, 'X', 100)
+        return self._summarize_measurements(z_results, x_results, expected_type)
+    
+    def _summarize_measurements(self, z_results: np.ndarray, x_results: np.ndarray,
+                                expected_type: str) -> Dict[str, Any]:
+        """
+        Turn Z- and X-basis shots into verification results
+        
+        Args:
+            z_results: Z-basis measurement results (0 or 1)
+            x_results: X-basis measurement results (0 or 1)
+            expected_type: Expected Bell state type
+            
+        Returns:
+            Dictionary with every verification result except the fidelity
+        """
+        # Check for entanglement signatures
+        z_correlation = np.count_nonzero(z_results) / z_results.size if z_results.size else 0.5
+        x_correlation = np.count_nonzero(x_results) / x_results.size if x_results.size else 0.5
+        
+        # Entangled states should show specific correlation patterns
+        is_entangled = self._check_entanglement_pattern(
+            z_correlation, x_correlation, expected_type
+        )
+        
+        return {
+            'is_entangled': is_entangled,
+            'z_correlation': z_correlation,
+            'x_correlation': x_correlation,
+            'measurements_count': z_results.size + x_results.size,
+            'expected_type': expected_type
+        }
+    
     def _check_entanglement_pattern(self, z_corr: float, x_corr: float, 
                                     state_type: str) -> bool:
         """
@@ -226,14 +407,50 @@ class RealEPRGenerator:
             Fidelity value (0-1)
         """
         # Get expected Bell state
-        expected_state = self.backend.create_bell_state(expected_type)
+        expected_state = self._reference_state(expected_type)
         
         # Calculate fidelity: |⟨ψ|φ⟩|²
         overlap = np.abs(np.vdot(expected_state, state))**2
         
         return float(overlap)
     
-    def distribute_epr_pairs(self, epr_pairs: List[np.ndarray]) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    def _calculate_fidelity_batch(self, states: np.ndarray, expected_type: str) -> np.ndarray:
+        """
+        Calculate fidelity of many states with expected Bell state
+        
+        Args:
+            states: (N, 4) array of quantum states
+            expected_type: Expected Bell state type
+            
+        Returns:
+            Array of N fidelity values (0-1)
+        """
+        # One matrix-vector product gives every overlap ⟨φ|ψ_i⟩
+        amplitudes = states @ self._reference_state(expected_type).conj()
+        return amplitudes.real**2 + amplitudes.imag**2
+    
+    def _reference_state(self, state_type: str) -> np.ndarray:
+        """
+        Ideal Bell state to compare against
+        
+        The state is prepared on the backend the first time a type is
+        requested and cached after that, so fidelity checks do not re-run
+        state preparation (a job submission on real hardware).
+        
+        Args:
+            state_type: Bell state type
+            
+        Returns:
+            Read-only 4-element state vector
+        """
+        reference = self._bell_cache.get(state_type)
+        if reference is None:
+            reference = np.array(self.backend.create_bell_state(state_type), dtype=complex)
+            reference.setflags(write=False)
+            self._bell_cache[state_type] = reference
+        return reference
+    
+    def distribute_epr_pairs(self, epr_pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Distribute EPR pairs between Prover and Verifier
         
@@ -241,20 +458,26 @@ class RealEPRGenerator:
         Prover gets first qubit, Verifier gets second qubit of each pair.
         
         Args:
-            epr_pairs: List of EPR pairs
+            epr_pairs: (N, 4) array (or list) of EPR pairs
             
         Returns:
             Tuple of (prover_particles, verifier_particles)
         """
-        # In simulation, both have access to full state
+        # In simulation, both have access to full state. Each side gets its
+        # own read-only view of the same (N, 4) buffer, so nothing is copied
+        # and neither side can modify the pairs the other one sees.
         # In real hardware, particles are physically separated
-        prover_particles = epr_pairs  # First qubit of each pair
-        verifier_particles = epr_pairs  # Second qubit of each pair
+        epr_pairs = np.asarray(epr_pairs)
+        prover_particles = epr_pairs.view()  # First qubit of each pair
+        verifier_particles = epr_pairs.view()  # Second qubit of each pair
+        prover_particles.setflags(write=False)
+        verifier_particles.setflags(write=False)
         
         return prover_particles, verifier_particles
     
     def monitor_entanglement_quality(self, epr_pairs: List[np.ndarray], 
-                                     sample_size: int = 10) -> Dict[str, Any]:
+                                     sample_size: int = 10,
+                                     parallel: bool = False) -> Dict[str, Any]:
         """
         Monitor entanglement quality over time
         
@@ -263,6 +486,9 @@ class RealEPRGenerator:
         Args:
             epr_pairs: List of EPR pairs to monitor
             sample_size: Number of pairs to test
+            parallel: Whether to verify the sampled pairs concurrently.
+                      Helps on remote hardware backends, where each
+                      measurement waits on the network.
             
         Returns:
             Dictionary with quality metrics
@@ -271,28 +497,40 @@ class RealEPRGenerator:
             return {'error': 'No EPR pairs provided'}
         
         # Sample pairs for testing
-        import random
-        sample_indices = random.sample(range(len(epr_pairs)), 
-                                      min(sample_size, len(epr_pairs)))
-        
-        fidelities = []
-        entanglement_rates = []
-        
-        for idx in sample_indices:
-            state = epr_pairs[idx]
-            verification = self.verify_entanglement(state)
-            
-            if 'fidelity' in verification:
-                fidelities.append(verification['fidelity'])
-            if 'is_entangled' in verification:
-                entanglement_rates.append(1 if verification['is_entangled'] else 0)
+        sample_indices = self._rng.choice(len(epr_pairs), min(sample_size, len(epr_pairs)),
+                                          replace=False)
+        
+        # Fidelities of the whole sample in one product; only the
+        # measurements are repeated per pair
+        if isinstance(epr_pairs, np.ndarray):
+            sample_states = epr_pairs[sample_indices]
+        else:
+            sample_states = np.array([epr_pairs[idx] for idx in sample_indices], dtype=complex)
+        fidelities = self._calculate_fidelity_batch(sample_states, 'phi_plus')
+        
+        num_samples = len(sample_indices)
+        try:
+            if parallel:
+                max_workers = min(num_samples, 4)  # Default to 4 workers
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    verifications = executor.map(
+                        lambda _: self._measure_entanglement(), range(num_samples)
+                    )
+                    entangled = np.fromiter((v['is_entangled'] for v in verifications),
+                                            dtype=bool, count=num_samples)
+            else:
+                entangled = np.fromiter((self._measure_entanglement()['is_entangled']
+                                         for _ in range(num_samples)),
+                                        dtype=bool, count=num_samples)
+        except Exception as e:
+            raise EntanglementError(f"Entanglement verification failed: {str(e)}") from e
         
         return {
-            'sample_size': len(sample_indices),
-            'average_fidelity': np.mean(fidelities) if fidelities else None,
-            'min_fidelity': np.min(fidelities) if fidelities else None,
-            'max_fidelity': np.max(fidelities) if fidelities else None,
-            'entanglement_rate': np.mean(entanglement_rates) if entanglement_rates else None,
+            'sample_size': num_samples,
+            'average_fidelity': fidelities.mean(),
+            'min_fidelity': fidelities.min(),
+            'max_fidelity': fidelities.max(),
+            'entanglement_rate': entangled.mean(),
             'total_pairs': len(epr_pairs)
         }
 
@@ -306,16 +544,20 @@ class PhysicalEPRSource:
     """
     
     def __init__(self, backend: QuantumHardwareBackend, 
-                 noise_model: Optional[Dict[str, float]] = None):
+                 noise_model: Optional[Dict[str, float]] = None,
+                 seed: Optional[int] = None):
         """
         Initialize physical EPR source
         
         Args:
             backend: Quantum hardware backend
             noise_model: Noise parameters (decoherence, gate errors, etc.)
+            seed: Optional seed for noise and sampling
         """
         self.backend = backend
-        self.generator = RealEPRGenerator(backend)
+        self.generator = RealEPRGenerator(backend, seed)
+        # Share the generator's random stream so one seed covers both
+        self._rng = self.generator._rng
         
         # Default noise model
         self.noise_model = noise_model or {
@@ -339,100 +581,225 @@ class PhysicalEPRSource:
         ideal_state, metadata = self.generator.generate_epr_pair(state_type, verify=False)
         
         # Apply noise model
-        noisy_state = self._apply_noise(ideal_state)
+        noisy_state = self._apply_noise(ideal_state, state_type)
         
         # Update metadata
         metadata['noise_applied'] = True
         metadata['noise_model'] = self.noise_model.copy()
-        metadata['fidelity_after_noise'] = self._calculate_fidelity(noisy_state, state_type)
+        metadata['fidelity_after_noise'] = self.generator._calculate_fidelity(noisy_state, state_type)
         
         return noisy_state, metadata
     
-    def _apply_noise(self, state: np.ndarray) -> np.ndarray:
+    def _apply_noise(self, state: np.ndarray, state_type: Optional[str] = None) -> np.ndarray:
         """
         Apply noise model to quantum state
         
+        For a known Bell state type, noise is only drawn for the two
+        nonzero amplitudes; the other two stay exactly zero. Without a
+        type, every amplitude is perturbed in proportion to its magnitude.
+        
         Args:
             state: Ideal quantum state
+            state_type: Bell state type of ``state``, if known
             
         Returns:
             Noisy quantum state
         """
+        # Same model as _apply_noise_batch: the noise is scaled, perturbs
+        # the supported amplitudes and the result is renormalized in place
+        noisy_state = state.astype(complex)
+        amplitudes = noisy_state[_BELL_SUPPORT.get(state_type, _FULL_SUPPORT)]
+        
+        noise = self._rng.standard_normal(amplitudes.shape + (2,)).view(complex)[..., 0]
+        noise *= self.noise_model['decoherence_rate']
+        noise *= np.abs(amplitudes)
+        amplitudes += noise
+        
+        norm = np.linalg.norm(noisy_state)
+        if norm > 1e-10:
+            noisy_state /= norm
+        return noisy_state
+    
+    def _apply_noise_batch(self, states: np.ndarray, state_type: Optional[str] = None,
+                           rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Apply noise model to many quantum states at once
+        
+        Args:
+            states: (N, 4) array of ideal quantum states
+            state_type: Bell state type shared by all rows, if known; see
+                        ``_apply_noise``
+            rng: Random generator to draw from (defaults to the source's)
+            
+        Returns:
+            (N, 4) array of noisy, renormalized quantum states
+        """
         # Simplified noise model: add small random perturbations
         noise_amplitude = self.noise_model['decoherence_rate']
+        noisy_states = states.astype(complex)
+        amplitudes = noisy_states[:, _BELL_SUPPORT.get(state_type, _FULL_SUPPORT)]
+        
+        if rng is None:
+            rng = self._rng
+        
+        # Add small random noise, drawing real and imaginary parts as one
+        # buffer of float pairs viewed as complex
+        noise = rng.standard_normal(amplitudes.shape + (2,)).view(complex)[..., 0]
+        noise *= noise_amplitude
+        noise *= np.abs(amplitudes)
+        amplitudes += noise
+        
+        # Renormalize each state
+        norms = np.linalg.norm(noisy_states, axis=1, keepdims=True)
+        noisy_states /= np.where(norms > 1e-10, norms, 1.0)
+        return noisy_states
+    
+    def _generate_noisy_batch(self, num_pairs: int, state_type: str = 'phi_plus',
+                              rng: Optional[np.random.Generator] = None,
+                              ideal: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate noisy EPR pairs and their fidelities in one pass
         
-        # Add small random noise
-        noise = np.random.normal(0, noise_amplitude, state.shape) + \
-                1j * np.random.normal(0, noise_amplitude, state.shape)
+        Args:
+            num_pairs: Number of pairs to generate
+            state_type: Type of Bell state
+            rng: Random generator to draw noise from (defaults to the source's)
+            ideal: (num_pairs, 4) ideal states prepared beforehand; if None
+                   they are prepared on the backend
+            
+        Returns:
+            Tuple of ((num_pairs, 4) noisy states, num_pairs fidelities)
+        """
+        if ideal is None:
+            self.backend.reset()
+            ideal = self.backend.create_bell_states(num_pairs, state_type)
+        states = self._apply_noise_batch(ideal, state_type, rng)
+        return states, self.generator._calculate_fidelity_batch(states, state_type)
+    
+    def _quality_control_rounds(self, pending: np.ndarray, epr_pairs: np.ndarray,
+                                fidelities: np.ndarray, min_fidelity: float,
+                                max_attempts: int, state_type: str,
+                                rng: Optional[np.random.Generator] = None,
+                                ideal: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """
+        Run the regeneration rounds of quality control for some pairs
         
-        noisy_state = state + noise * np.abs(state)
+        Writes the accepted states and fidelities into ``epr_pairs`` and
+        ``fidelities`` at the rows in ``pending``.
         
-        # Renormalize
-        norm = np.sqrt(np.sum(np.abs(noisy_state)**2))
-        if norm > 1e-10:
-            noisy_state = noisy_state / norm
+        Args:
+            pending: Row indices of the pairs to generate
+            epr_pairs: (num_pairs, 4) output array of states
+            fidelities: num_pairs output array of fidelities
+            min_fidelity: Minimum acceptable fidelity
+            max_attempts: Maximum regeneration attempts per pair
+            state_type: Type of Bell state
+            rng: Random generator to draw noise from (defaults to the source's)
+            ideal: (num_pairs, 4) ideal states prepared beforehand, indexed
+                   like ``epr_pairs``; if None each round prepares them on
+                   the backend
+            
+        Returns:
+            Dictionary with 'total_generated' and 'rejected' counts
+        """
+        counts = {'total_generated': 0, 'rejected': 0}
+        for _ in range(max_attempts):
+            if pending.size == 0:
+                break
+            
+            states, batch_fidelities = self._generate_noisy_batch(
+                len(pending), state_type, rng, None if ideal is None else ideal[pending]
+            )
+            
+            # Keep the latest attempt for every pending pair, so pairs that
+            # never reach the threshold are accepted anyway after max_attempts
+            epr_pairs[pending] = states
+            fidelities[pending] = batch_fidelities
+            
+            rejected = batch_fidelities < min_fidelity
+            counts['total_generated'] += len(pending)
+            counts['rejected'] += int(np.count_nonzero(rejected))
+            pending = pending[rejected]
         
-        return noisy_state
-    
-    def _calculate_fidelity(self, state: np.ndarray, expected_type: str) -> float:
-        """Calculate fidelity with ideal state"""
-        ideal_state = self.backend.create_bell_state(expected_type)
-        overlap = np.abs(np.vdot(ideal_state, state))**2
-        return float(overlap)
+        return counts
     
     def generate_batch_with_quality_control(self, num_pairs: int,
                                            min_fidelity: float = 0.9,
-                                           max_attempts: int = 3) -> Tuple[List[np.ndarray], Dict[str, Any]]:
+                                           max_attempts: int = 3,
+                                           state_type: str = 'phi_plus',
+                                           parallel: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Generate EPR pairs with quality control
         
-        Regenerates pairs that don't meet fidelity threshold.
+        Regenerates pairs that don't meet fidelity threshold. Each round
+        generates, perturbs and scores all pending pairs at once, then
+        retries only the rejected ones.
         
         Args:
             num_pairs: Number of pairs to generate
             min_fidelity: Minimum acceptable fidelity
             max_attempts: Maximum regeneration attempts per pair
+            state_type: Type of Bell state
+            parallel: Whether to split the pairs across worker threads,
+                      each drawing noise from its own child generator.
+                      Seeded results are reproducible, but differ from
+                      the sequential ones.
             
         Returns:
-            Tuple of (epr_pairs, quality_metrics)
+            Tuple of (epr_pairs, quality_metrics), where epr_pairs is a
+            (num_pairs, 4) array with one EPR pair per row
+            
+        Raises:
+            EntanglementError: If max_attempts is less than 1
         """
-        epr_pairs = []
+        if max_attempts < 1:
+            raise EntanglementError(f"max_attempts must be >= 1, got {max_attempts}")
+        
+        epr_pairs = np.empty((num_pairs, 4), dtype=complex)
+        fidelities = np.empty(num_pairs)
         quality_metrics = {
             'total_generated': 0,
             'accepted': 0,
             'rejected': 0,
-            'average_fidelity': [],
+            'average_fidelity': 0,
             'regeneration_count': 0
         }
         
-        for _ in range(num_pairs):
-            attempts = 0
-            accepted = False
-            
-            while attempts < max_attempts and not accepted:
-                state, metadata = self.generate_physical_epr_pair()
-                fidelity = metadata.get('fidelity_after_noise', 0)
-                
-                quality_metrics['total_generated'] += 1
-                
-                if fidelity >= min_fidelity:
-                    epr_pairs.append(state)
-                    quality_metrics['accepted'] += 1
-                    quality_metrics['average_fidelity'].append(fidelity)
-                    accepted = True
-                else:
-                    quality_metrics['rejected'] += 1
-                    attempts += 1
-                    quality_metrics['regeneration_count'] += 1
-            
-            if not accepted:
-                # Accept anyway if max attempts reached
-                epr_pairs.append(state)
-                quality_metrics['accepted'] += 1
-                quality_metrics['average_fidelity'].append(fidelity)
-        
-        quality_metrics['average_fidelity'] = np.mean(quality_metrics['average_fidelity']) if quality_metrics['average_fidelity'] else 0
+        if parallel and num_pairs > 1:
+            # Workers fill disjoint rows of the shared output arrays, so only
+            # their counts need merging once they are done
+            num_workers = min(num_pairs, 4)  # Default to 4 workers
+            chunks = np.array_split(np.arange(num_pairs), num_workers)
+            # Generator.spawn needs NumPy 1.25; derive the children from a
+            # SeedSequence drawn from this source's generator instead
+            seed_sequence = np.random.SeedSequence(int(self._rng.integers(2**63)))
+            rngs = [np.random.default_rng(child) for child in seed_sequence.spawn(num_workers)]
+            # The backend is shared mutable state: prepare the ideal states
+            # and the fidelity reference here, so workers only touch arrays
+            # and their own generators
+            self.backend.reset()
+            ideal = self.backend.create_bell_states(num_pairs, state_type)
+            self.generator._reference_state(state_type)
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                chunk_counts = list(executor.map(
+                    lambda chunk, rng: self._quality_control_rounds(
+                        chunk, epr_pairs, fidelities, min_fidelity, max_attempts, state_type,
+                        rng, ideal
+                    ),
+                    chunks, rngs
+                ))
+        else:
+            chunk_counts = [self._quality_control_rounds(
+                np.arange(num_pairs), epr_pairs, fidelities, min_fidelity, max_attempts, state_type
+            )]
+        
+        for counts in chunk_counts:
+            quality_metrics['total_generated'] += counts['total_generated']
+            quality_metrics['rejected'] += counts['rejected']
+            quality_metrics['regeneration_count'] += counts['rejected']
+        
+        quality_metrics['accepted'] = num_pairs
+        quality_metrics['average_fidelity'] = float(fidelities.mean()) if num_pairs > 0 else 0
         quality_metrics['acceptance_rate'] = quality_metrics['accepted'] / quality_metrics['total_generated'] if quality_metrics['total_generated'] > 0 else 0
         
         return epr_pairs, quality_metrics
-
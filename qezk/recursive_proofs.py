@@ -5,19 +5,160 @@ Support for recursive proofs where a proof can verify another proof.
 Includes proof composition, nested proofs, and proof aggregation.
 """
 
+import hashlib
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from .protocol import QuantumEntanglementZK, QEZKProof
 from .exceptions import ProtocolError, VerificationError
 
 
+# Bit strings of every 4- and 8-bit value, the widths used for CHSH values
+_BIT_STRINGS = {
+    num_bits: tuple(format(i, f'0{num_bits}b') for i in range(2**num_bits))
+    for num_bits in (4, 8)
+}
+
+
+def _chsh_to_int(value: float, num_bits: int) -> int:
+    """
+    Quantize a CHSH value onto ``num_bits`` bits
+    
+    Args:
+        value: CHSH value, scaled from [0, 3]
+        num_bits: Width of the quantized value
+        
+    Returns:
+        Integer in ``[0, 2**num_bits - 1]``
+    """
+    # Normalize to 0-1 range and convert to bits
+    normalized = max(0, min(1, value / 3.0))  # CHSH max is ~3.0
+    return int(normalized * (2**num_bits - 1))
+
+
+def _chsh_to_bits(value: float, num_bits: int) -> str:
+    """
+    Convert a CHSH value to a bit string
+    
+    Args:
+        value: CHSH value, scaled from [0, 3] onto ``num_bits`` bits
+        num_bits: Width of the bit string
+        
+    Returns:
+        String of ``num_bits`` '0'/'1' characters
+    """
+    int_value = _chsh_to_int(value, num_bits)
+    table = _BIT_STRINGS.get(num_bits)
+    if table is not None:
+        return table[int_value]
+    return format(int_value, f'0{num_bits}b')
+
+
+def _digest_bits(digest: bytes, num_bytes: int = 4) -> str:
+    """
+    Render the first bytes of a digest as a bit string
+    
+    One big-endian integer conversion and one format call, rather than
+    formatting each byte separately.
+    
+    Args:
+        digest: Hash digest
+        num_bytes: Number of leading bytes to render
+        
+    Returns:
+        String of ``8 * num_bytes`` '0'/'1' characters
+    """
+    return format(int.from_bytes(digest[:num_bytes], 'big'), f'0{8 * num_bytes}b')
+
+
+def _with_slots(cls: type) -> type:
+    """
+    Recreate a dataclass with ``__slots__`` for its fields
+    
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10. The
+    generated ``__init__`` keeps the field defaults, so the class
+    attributes holding them can be dropped in favour of slot descriptors.
+    
+    Args:
+        cls: Dataclass to rebuild
+        
+    Returns:
+        New class whose instances have no ``__dict__``
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _results_digest(results: List[int]) -> bytes:
+    """
+    Hash 0/1 measurement results as raw bytes rather than as a digit string
+    
+    Args:
+        results: Measurement results (list or array)
+        
+    Returns:
+        SHA-256 digest of the results
+    """
+    return hashlib.sha256(np.ascontiguousarray(results, dtype=np.uint8)).digest()
+
+
+def _proof_fields(proofs: List[QEZKProof]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read the validity and CHSH value of every proof in one pass each
+    
+    Args:
+        proofs: Proofs to read
+        
+    Returns:
+        Tuple of (bool validity array, float64 CHSH value array)
+    """
+    valid = np.fromiter((p.is_valid for p in proofs), dtype=bool, count=len(proofs))
+    chsh = np.fromiter((p.chsh_value for p in proofs), dtype=np.float64, count=len(proofs))
+    return valid, chsh
+
+
+def _aggregate_batch(qezk: QuantumEntanglementZK, proofs: List[QEZKProof], statement: str,
+                     verify_all: bool, seed: Optional[int]) -> QEZKProof:
+    """
+    Aggregate one batch in a worker process
+    
+    Used by ``ProofAggregator.batch_aggregate``; returns only the proof so
+    the metadata is not pickled back.
+    
+    Args:
+        qezk: QE-ZK instance (pickled into the worker)
+        proofs: Proofs to aggregate
+        statement: Statement for aggregated proof
+        verify_all: Whether to verify all proofs
+        seed: Optional random seed
+        
+    Returns:
+        Aggregated proof
+    """
+    if seed is None:
+        # Forked workers inherit the parent's random state; without a seed
+        # every batch would otherwise draw the same measurement randomness
+        np.random.seed()
+    aggregated_proof, _ = ProofAggregator(qezk).aggregate_proofs(
+        proofs, statement, verify_all=verify_all, seed=seed
+    )
+    return aggregated_proof
+
+
+@_with_slots
 @dataclass
 class RecursiveProof:
     """
     Recursive proof structure
     
     Contains a proof that verifies another proof or set of proofs.
+    Instances are slotted, so nested and aggregated proofs carry no
+    per-instance ``__dict__``.
     """
     inner_proofs: List[QEZKProof]  # Proofs being verified
     outer_proof: QEZKProof  # Proof that verifies inner proofs
@@ -80,27 +221,22 @@ class RecursiveProver:
         Returns:
             Witness string encoding proof properties
         """
-        # Encode proof validity, CHSH value, and key properties
-        is_valid_bit = '1' if proof.is_valid else '0'
-        chsh_bits = self._float_to_bits(proof.chsh_value, num_bits=8)
-        results_hash = self._hash_results(proof.prover_results[:16])  # First 16 results
+        # Encode proof validity (1 bit), CHSH value (8 bits) and a hash of
+        # the first 16 results (32 bits), packed into one integer so the
+        # witness is formatted once instead of concatenated from pieces
+        is_valid_bit = 1 if proof.is_valid else 0
+        chsh_int = _chsh_to_int(proof.chsh_value, 8)
+        results_hash = int.from_bytes(_results_digest(proof.prover_outcomes(16))[:4], 'big')
         
-        witness = is_valid_bit + chsh_bits + results_hash
-        return witness
+        return format((is_valid_bit << 40) | (chsh_int << 32) | results_hash, '041b')
     
     def _float_to_bits(self, value: float, num_bits: int = 8) -> str:
         """Convert float to bit string"""
-        # Normalize to 0-1 range and convert to bits
-        normalized = max(0, min(1, value / 3.0))  # CHSH max is ~3.0
-        int_value = int(normalized * (2**num_bits - 1))
-        return format(int_value, f'0{num_bits}b')
+        return _chsh_to_bits(value, num_bits)
     
     def _hash_results(self, results: List[int]) -> str:
         """Hash results to bit string"""
-        import hashlib
-        results_str = ''.join(str(r) for r in results)
-        hash_bytes = hashlib.sha256(results_str.encode()).digest()
-        return ''.join(format(b, '08b') for b in hash_bytes[:4])  # 32 bits
+        return _digest_bits(_results_digest(results))  # 32 bits
 
 
 class ProofComposer:
@@ -154,26 +290,24 @@ class ProofComposer:
         Returns:
             Aggregated witness string
         """
-        # Combine proof properties
-        validity_bits = ''.join('1' if p.is_valid else '0' for p in proofs)
+        # Combine proof properties; validity is written as ASCII '0'/'1'
+        # bytes and decoded once
+        validity = bytearray(len(proofs))
+        for i, p in enumerate(proofs):
+            validity[i] = 49 if p.is_valid else 48
+        validity_bits = validity.decode('ascii')
         chsh_bits = ''.join(self._float_to_bits(p.chsh_value, 4) for p in proofs)
         
         # Hash all proofs
-        import hashlib
-        all_results = ''.join(
-            ''.join(str(r) for r in p.prover_results[:8]) for p in proofs
-        )
-        hash_bits = ''.join(
-            format(b, '08b') for b in hashlib.sha256(all_results.encode()).digest()[:4]
-        )
+        # First 8 results of every proof, gathered into one uint8 buffer
+        all_results = np.concatenate([p.prover_outcomes(8) for p in proofs]).astype(np.uint8, copy=False)
+        hash_bits = _digest_bits(hashlib.sha256(all_results).digest())
         
         return validity_bits + chsh_bits + hash_bits
     
     def _float_to_bits(self, value: float, num_bits: int = 4) -> str:
         """Convert float to bit string"""
-        normalized = max(0, min(1, value / 3.0))
-        int_value = int(normalized * (2**num_bits - 1))
-        return format(int_value, f'0{num_bits}b')
+        return _chsh_to_bits(value, num_bits)
 
 
 class NestedProofBuilder:
@@ -217,10 +351,12 @@ class NestedProofBuilder:
         current_statement = base_statement
         current_witness = base_witness
         
+        # Per-level seeds, resolved once rather than on every level
+        seeds = [seed + level for level in range(depth)] if seed is not None else [None] * depth
+        
         # Build proofs layer by layer
         for level in range(depth):
-            proof = self.qezk.prove(current_statement, current_witness, 
-                                   seed=seed + level if seed is not None else None)
+            proof = self.qezk.prove(current_statement, current_witness, seed=seeds[level])
             inner_proofs.append(proof)
             
             # Next level proves the current proof
@@ -287,22 +423,27 @@ class ProofAggregator:
         if not proofs:
             raise ProtocolError("Cannot aggregate empty proof list")
         
-        # Verify all proofs if requested
-        if verify_all:
-            valid_count = sum(1 for p in proofs if p.is_valid)
-            if valid_count != len(proofs):
-                raise VerificationError(
-                    f"Not all proofs are valid: {valid_count}/{len(proofs)}"
-                )
+        # Read the per-proof fields once; every metric below is a reduction
+        num_proofs = len(proofs)
+        valid, chsh = _proof_fields(proofs)
+        valid_count = int(np.count_nonzero(valid))
+        
+        # Verify all proofs if requested, reporting the first failure
+        if verify_all and valid_count != num_proofs:
+            first_invalid = int(np.argmin(valid))
+            raise VerificationError(
+                f"Not all proofs are valid: {valid_count}/{num_proofs} "
+                f"(first invalid: proof {first_invalid})"
+            )
         
         # Aggregate
         aggregated_proof = self.composer.compose_proofs(proofs, statement, seed)
         
         metadata = {
-            'num_proofs': len(proofs),
-            'all_valid': all(p.is_valid for p in proofs),
-            'valid_count': sum(1 for p in proofs if p.is_valid),
-            'avg_chsh': np.mean([p.chsh_value for p in proofs]),
+            'num_proofs': num_proofs,
+            'all_valid': valid_count == num_proofs,
+            'valid_count': valid_count,
+            'avg_chsh': chsh.mean(),
             'aggregated_chsh': aggregated_proof.chsh_value,
             'aggregated_valid': aggregated_proof.is_valid
         }
@@ -313,22 +454,41 @@ class ProofAggregator:
                        proof_batches: List[List[QEZKProof]],
                        statements: Optional[List[str]] = None,
                        verify_all: bool = False,
-                       seed: Optional[int] = None) -> List[QEZKProof]:
+                       seed: Optional[int] = None,
+                       parallel: bool = False,
+                       max_workers: Optional[int] = None) -> List[QEZKProof]:
         """
         Aggregate multiple batches of proofs
         
         Args:
             proof_batches: List of proof batches
             statements: Optional statements for each batch
+            verify_all: Whether to verify all proofs
             seed: Optional random seed
+            parallel: Whether to aggregate the batches in a process pool.
+                      Proving is CPU-bound and reseeds NumPy's global
+                      random state, so batches cannot share threads.
+            max_workers: Maximum worker processes (None = one per CPU)
             
         Returns:
             List of aggregated proofs
         """
+        batch_statements = [
+            statements[i] if statements and i < len(statements) else f"Batch {i+1}"
+            for i in range(len(proof_batches))
+        ]
+        
+        if parallel and len(proof_batches) > 1:
+            num_batches = len(proof_batches)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    _aggregate_batch, [self.qezk] * num_batches, proof_batches,
+                    batch_statements, [verify_all] * num_batches, [seed] * num_batches
+                ))
+        
         aggregated = []
         
-        for i, batch in enumerate(proof_batches):
-            statement = statements[i] if statements and i < len(statements) else f"Batch {i+1}"
+        for batch, statement in zip(proof_batches, batch_statements):
             aggregated_proof, _ = self.aggregate_proofs(batch, statement, verify_all=verify_all, seed=seed)
             aggregated.append(aggregated_proof)
         
@@ -4,7 +4,46 @@ Security Analysis
 This module provides security analysis and properties of the QE-ZK protocol.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+# The analyses below are fixed, so each is built once at import and shared
+# read-only with every caller
+_INFORMATION_THEORETIC_SECURITY = MappingProxyType({
+    'perfect_zero_knowledge': True,
+    'information_theoretic': True,
+    'quantum_secure': True,
+    'post_quantum': True,
+    'no_trusted_setup': True,
+    'physical_security': True
+})
+
+_ATTACK_RESISTANCE = MappingProxyType({
+    'eavesdropping': MappingProxyType({
+        'resistant': True,
+        'reason': 'Quantum no-cloning theorem prevents copying'
+    }),
+    'man_in_the_middle': MappingProxyType({
+        'resistant': True,
+        'reason': 'Entanglement disruption is detectable'
+    }),
+    'quantum_memory_attack': MappingProxyType({
+        'resistant': True,
+        'reason': 'Requires quantum memory which is noisy'
+    }),
+    'classical_computation': MappingProxyType({
+        'resistant': True,
+        'reason': 'Based on quantum mechanical principles'
+    })
+})
+
+_COMPLETENESS_SOUNDNESS = MappingProxyType({
+    'completeness': 0.99,  # 99% success for honest prover
+    'soundness': 0.01,     # 1% cheating probability
+    'error_tolerance': 0.1,  # 10% experimental error allowed
+    'robustness': 'high'
+})
 
 
 class QEZKSecurity:
@@ -16,61 +55,32 @@ class QEZKSecurity:
     """
     
     @staticmethod
-    def information_theoretic_security() -> Dict[str, bool]:
+    def information_theoretic_security() -> Mapping[str, bool]:
         """
         Information-theoretic perfect zero-knowledge properties
         
         Returns:
-            Dictionary of security properties
+            Read-only mapping of security properties
         """
-        return {
-            'perfect_zero_knowledge': True,
-            'information_theoretic': True,
-            'quantum_secure': True,
-            'post_quantum': True,
-            'no_trusted_setup': True,
-            'physical_security': True
-        }
+        return _INFORMATION_THEORETIC_SECURITY
     
     @staticmethod
-    def attack_resistance() -> Dict[str, Dict[str, Any]]:
+    def attack_resistance() -> Mapping[str, Mapping[str, Any]]:
         """
         Resistance against various attacks
         
         Returns:
-            Dictionary of attack types and resistance information
+            Read-only mapping of attack types and resistance information
         """
-        return {
-            'eavesdropping': {
-                'resistant': True,
-                'reason': 'Quantum no-cloning theorem prevents copying'
-            },
-            'man_in_the_middle': {
-                'resistant': True,
-                'reason': 'Entanglement disruption is detectable'
-            },
-            'quantum_memory_attack': {
-                'resistant': True,
-                'reason': 'Requires quantum memory which is noisy'
-            },
-            'classical_computation': {
-                'resistant': True,
-                'reason': 'Based on quantum mechanical principles'
-            }
-        }
+        return _ATTACK_RESISTANCE
     
     @staticmethod
-    def completeness_soundness() -> Dict[str, Any]:
+    def completeness_soundness() -> Mapping[str, Any]:
         """
         Completeness and soundness properties
         
         Returns:
-            Dictionary of protocol properties
+            Read-only mapping of protocol properties
         """
-        return {
-            'completeness': 0.99,  # 99% success for honest prover
-            'soundness': 0.01,     # 1% cheating probability
-            'error_tolerance': 0.1,  # 10% experimental error allowed
-            'robustness': 'high'
-        }
+        return _COMPLETENESS_SOUNDNESS
 
@@ -5,10 +5,89 @@ Framework for formal mathematical security proofs of QE-ZK protocol.
 This module provides the structure and outline for proving security properties.
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Any, List, Mapping
 from .exceptions import SecurityError
 
 
+# The outlines are fixed, so each is built once at import and shared
+# read-only with every caller; list entries are tuples for the same reason
+_PERFECT_ZERO_KNOWLEDGE_OUTLINE = MappingProxyType({
+    'theorem': 'QE-ZK is perfect zero-knowledge',
+    'approach': 'Construct simulator that generates identical views',
+    'key_lemmas': (
+        'Quantum state indistinguishability',
+        'Entanglement monogamy',
+        'No-signaling principle',
+        'Quantum privacy amplification'
+    ),
+    'techniques': (
+        'Quantum information theory',
+        'Entanglement measures',
+        'Quantum channel capacity',
+        'Decoupling theory'
+    ),
+    'status': 'Theoretical framework ready, formal proof pending'
+})
+
+_SOUNDNESS_OUTLINE = MappingProxyType({
+    'theorem': 'QE-ZK is sound against quantum polynomial-time adversaries',
+    'approach': 'Reduction to quantum hardness assumptions',
+    'key_lemmas': (
+        'Bell inequality violations',
+        'Quantum cheating strategies',
+        'Entanglement verification',
+        'Quantum complexity theory'
+    ),
+    'techniques': (
+        'Quantum interactive proofs',
+        'Quantum rewinding',
+        'Entanglement witnesses',
+        'Quantum state discrimination'
+    ),
+    'status': 'Theoretical framework ready, formal proof pending'
+})
+
+_COMPLETENESS_OUTLINE = MappingProxyType({
+    'theorem': 'QE-ZK is complete with experimental error tolerance',
+    'approach': 'Error analysis and tolerance bounds',
+    'key_lemmas': (
+        'Quantum error correction thresholds',
+        'Noise resilience of entanglement',
+        'Measurement error modeling',
+        'Statistical significance analysis'
+    ),
+    'techniques': (
+        'Quantum fault tolerance',
+        'Error mitigation algorithms',
+        'Statistical hypothesis testing',
+        'Monte Carlo simulations'
+    ),
+    'status': 'Theoretical framework ready, formal proof pending'
+})
+
+_INFORMATION_THEORETIC_PROOF = MappingProxyType({
+    'theorem': 'QE-ZK provides information-theoretic perfect security',
+    'basis': 'Physical laws of quantum mechanics',
+    'key_principles': (
+        'Quantum no-cloning theorem',
+        'Uncertainty principle',
+        'Entanglement monogamy',
+        'Bell inequality violations'
+    ),
+    'security_level': 'Information-theoretic (not computational)',
+    'assumptions': 'None (based on physical laws)',
+    'status': 'Theoretical foundation established'
+})
+
+_ALL_PROOF_OUTLINES = MappingProxyType({
+    'perfect_zero_knowledge': _PERFECT_ZERO_KNOWLEDGE_OUTLINE,
+    'soundness': _SOUNDNESS_OUTLINE,
+    'completeness': _COMPLETENESS_OUTLINE,
+    'information_theoretic': _INFORMATION_THEORETIC_PROOF
+})
+
+
 class SecurityProofFramework:
     """
     Framework for formal security proofs
@@ -21,119 +100,54 @@ class SecurityProofFramework:
     """
     
     @staticmethod
-    def perfect_zero_knowledge_proof_outline() -> Dict[str, Any]:
+    def perfect_zero_knowledge_proof_outline() -> Mapping[str, Any]:
         """
         Outline for proving perfect zero-knowledge property
         
         Returns:
-            Dictionary containing proof structure
+            Read-only mapping containing proof structure
         """
-        return {
-            'theorem': 'QE-ZK is perfect zero-knowledge',
-            'approach': 'Construct simulator that generates identical views',
-            'key_lemmas': [
-                'Quantum state indistinguishability',
-                'Entanglement monogamy',
-                'No-signaling principle',
-                'Quantum privacy amplification'
-            ],
-            'techniques': [
-                'Quantum information theory',
-                'Entanglement measures',
-                'Quantum channel capacity',
-                'Decoupling theory'
-            ],
-            'status': 'Theoretical framework ready, formal proof pending'
-        }
+        return _PERFECT_ZERO_KNOWLEDGE_OUTLINE
     
     @staticmethod
-    def soundness_proof_outline() -> Dict[str, Any]:
+    def soundness_proof_outline() -> Mapping[str, Any]:
         """
         Outline for proving soundness
         
         Returns:
-            Dictionary containing proof structure
+            Read-only mapping containing proof structure
         """
-        return {
-            'theorem': 'QE-ZK is sound against quantum polynomial-time adversaries',
-            'approach': 'Reduction to quantum hardness assumptions',
-            'key_lemmas': [
-                'Bell inequality violations',
-                'Quantum cheating strategies',
-                'Entanglement verification',
-                'Quantum complexity theory'
-            ],
-            'techniques': [
-                'Quantum interactive proofs',
-                'Quantum rewinding',
-                'Entanglement witnesses',
-                'Quantum state discrimination'
-            ],
-            'status': 'Theoretical framework ready, formal proof pending'
-        }
+        return _SOUNDNESS_OUTLINE
     
     @staticmethod
-    def completeness_proof_outline() -> Dict[str, Any]:
+    def completeness_proof_outline() -> Mapping[str, Any]:
         """
         Outline for proving completeness
         
         Returns:
-            Dictionary containing proof structure
+            Read-only mapping containing proof structure
         """
-        return {
-            'theorem': 'QE-ZK is complete with experimental error tolerance',
-            'approach': 'Error analysis and tolerance bounds',
-            'key_lemmas': [
-                'Quantum error correction thresholds',
-                'Noise resilience of entanglement',
-                'Measurement error modeling',
-                'Statistical significance analysis'
-            ],
-            'techniques': [
-                'Quantum fault tolerance',
-                'Error mitigation algorithms',
-                'Statistical hypothesis testing',
-                'Monte Carlo simulations'
-            ],
-            'status': 'Theoretical framework ready, formal proof pending'
-        }
+        return _COMPLETENESS_OUTLINE
     
     @staticmethod
-    def information_theoretic_security_proof() -> Dict[str, Any]:
+    def information_theoretic_security_proof() -> Mapping[str, Any]:
         """
         Proof outline for information-theoretic security
         
         Returns:
-            Dictionary containing proof structure
+            Read-only mapping containing proof structure
         """
-        return {
-            'theorem': 'QE-ZK provides information-theoretic perfect security',
-            'basis': 'Physical laws of quantum mechanics',
-            'key_principles': [
-                'Quantum no-cloning theorem',
-                'Uncertainty principle',
-                'Entanglement monogamy',
-                'Bell inequality violations'
-            ],
-            'security_level': 'Information-theoretic (not computational)',
-            'assumptions': 'None (based on physical laws)',
-            'status': 'Theoretical foundation established'
-        }
+        return _INFORMATION_THEORETIC_PROOF
     
     @staticmethod
-    def get_all_proof_outlines() -> Dict[str, Dict[str, Any]]:
+    def get_all_proof_outlines() -> Mapping[str, Mapping[str, Any]]:
         """
         Get all security proof outlines
         
         Returns:
-            Dictionary containing all proof structures
+            Read-only mapping containing all proof structures
         """
-        return {
-            'perfect_zero_knowledge': SecurityProofFramework.perfect_zero_knowledge_proof_outline(),
-            'soundness': SecurityProofFramework.soundness_proof_outline(),
-            'completeness': SecurityProofFramework.completeness_proof_outline(),
-            'information_theoretic': SecurityProofFramework.information_theoretic_security_proof()
-        }
+        return _ALL_PROOF_OUTLINES
 
 
 class FormalProofGenerator:
@@ -0,0 +1,95 @@
+"""
+JSON Serialization
+
+JSON encoding and decoding for protocol messages and specifications.
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. NumPy arrays and scalars are serialized as lists
+and numbers with either backend, and both write non-finite floats (NaN,
+infinity) as null.
+"""
+
+import json
+import math
+from typing import Any, Union
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Convert NumPy values that the JSON backend cannot encode natively"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj: Any) -> Any:
+    """
+    Replace non-finite floats with None, as orjson encodes them
+    
+    Args:
+        obj: Object to convert (dicts, lists and tuples are walked)
+        
+    Returns:
+        Object that the standard library encoder writes as orjson would
+    """
+    if isinstance(obj, (float, np.floating)):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(item) for item in obj]
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == 'f':
+        return _finite(obj.tolist())
+    return obj
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize object to a JSON string
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with 2-space indentation
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which the standard library
+            # encodes; anything it cannot encode raises TypeError there too
+            pass
+    return json.dumps(_finite(obj), default=_default, indent=2 if indent else None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON string or bytes
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,11 +5,30 @@ This module provides simulation and testing capabilities for the QE-ZK protocol.
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 from .protocol import QuantumEntanglementZK
 from .exceptions import ProtocolError
 
 
+def _simulate_pair(simulation: 'QEZKSimulation', statement: str, witness: str) -> Dict[str, Any]:
+    """
+    Simulate one statement-witness pair in a worker process
+    
+    Args:
+        simulation: Simulation framework (pickled into the worker)
+        statement: Statement to prove
+        witness: Witness (secret information) as bit string
+        
+    Returns:
+        Results of ``simulate_protocol``
+    """
+    # Forked workers inherit the parent's random state; reseed so unseeded
+    # trials differ between pairs
+    np.random.seed()
+    return simulation.simulate_protocol(statement, witness)
+
+
 class QEZKSimulation:
     """
     Simulation framework for testing QE-ZK
@@ -41,31 +60,37 @@ class QEZKSimulation:
             seed: Optional random seed for reproducibility
             
         Returns:
-            Dictionary containing simulation results and statistics
+            Dictionary containing simulation results and statistics, with
+            the per-trial CHSH values as an array
         """
-        results = {
-            'success_count': 0,
-            'chsh_values': [],
-            'valid_proofs': 0,
-            'total_trials': num_trials
-        }
+        # The statement is the same in every trial, so its basis schedule
+        # is computed once by the specialized prover
+        prove = self.qezk.compile_for(statement)
+        chsh_values = np.empty(num_trials, dtype=np.float64)
+        valid = np.zeros(num_trials, dtype=bool)
         
         for trial in range(num_trials):
             trial_seed = seed + trial if seed is not None else None
-            proof = self.qezk.prove(statement, witness, seed=trial_seed)
-            
-            results['chsh_values'].append(proof.chsh_value)
-            if proof.is_valid:
-                results['success_count'] += 1
-                results['valid_proofs'] += 1
+            proof = prove(witness, seed=trial_seed)
+            chsh_values[trial] = proof.chsh_value
+            valid[trial] = proof.is_valid
         
-        results['success_rate'] = results['success_count'] / num_trials
-        results['avg_chsh'] = np.mean(results['chsh_values'])
-        results['std_chsh'] = np.std(results['chsh_values'])
+        success_count = int(np.count_nonzero(valid))
+        results = {
+            'success_count': success_count,
+            'chsh_values': chsh_values,
+            'valid_proofs': success_count,
+            'total_trials': num_trials,
+            'success_rate': success_count / num_trials,
+            'avg_chsh': chsh_values.mean(),
+            'std_chsh': chsh_values.std()
+        }
         
         return results
     
-    def performance_analysis(self, statements: List[str], witnesses: List[str]) -> Dict[str, Any]:
+    def performance_analysis(self, statements: List[str], witnesses: List[str],
+                             parallel: bool = False,
+                             max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Performance analysis across different statements and witnesses
         
@@ -74,6 +99,8 @@ class QEZKSimulation:
         Args:
             statements: List of statements to prove
             witnesses: List of corresponding witnesses (must match length)
+            parallel: Whether to simulate the pairs in a process pool
+            max_workers: Maximum worker processes (None = one per CPU)
             
         Returns:
             Dictionary containing aggregated performance metrics
@@ -81,11 +108,16 @@ class QEZKSimulation:
         if len(statements) != len(witnesses):
             raise ProtocolError("statements and witnesses must have the same length")
         
-        all_results = []
-        
-        for statement, witness in zip(statements, witnesses):
-            result = self.simulate_protocol(statement, witness)
-            all_results.append(result)
+        if parallel and len(statements) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                all_results = list(executor.map(
+                    _simulate_pair, [self] * len(statements), statements, witnesses
+                ))
+        else:
+            all_results = [
+                self.simulate_protocol(statement, witness)
+                for statement, witness in zip(statements, witnesses)
+            ]
         
         return {
             'individual_results': all_results,
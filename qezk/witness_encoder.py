@@ -12,6 +12,10 @@ from .quantum_state import QuantumStatePreparation
 from .exceptions import WitnessEncodingError, ConfigurationError
 
 
+# Hash bit pairs to bases: 0=Z, 1=X, 2=Y, 3=Z (fallback)
+_BASIS_MAP = ('Z', 'X', 'Y', 'Z')
+
+
 class WitnessEncoder:
     """
     Encode classical witness into quantum operations
@@ -38,6 +42,8 @@ class WitnessEncoder:
             'T': np.array([[1, 0], [0, np.exp(1j*np.pi/4)]], dtype=complex)
         }
         self.gate_names = list(self.gate_library.keys())
+        # Gates with a precomputed 2-qubit matrix in QuantumStatePreparation
+        self._named_gates = frozenset(('I', 'X', 'Y', 'Z', 'H'))
     
     def witness_to_quantum_circuit(self, witness: str) -> List[str]:
         """
@@ -94,16 +100,14 @@ class WitnessEncoder:
             # Hash statement
             statement_hash = hashlib.sha256(statement.encode()).digest()
             
-            bases = []
-            for i in range(num_measurements):
-                # Use hash bits to choose basis
-                byte_index = i % len(statement_hash)
-                bit_shift = 2 * (i % 4)
-                basis_index = (statement_hash[byte_index] >> bit_shift) & 0b11
-                
-                # Map to bases: 0=Z, 1=X, 2=Y, 3=Z (fallback)
-                basis_map = {0: 'Z', 1: 'X', 2: 'Y', 3: 'Z'}
-                bases.append(basis_map[basis_index])
+            # Measurement i uses bits 2*(i % 4) of hash byte i % 32, so the
+            # bases repeat every 32 measurements: build one period and tile it
+            period = [
+                _BASIS_MAP[(byte >> (2 * (i % 4))) & 0b11]
+                for i, byte in enumerate(statement_hash)
+            ]
+            repeats = -(-num_measurements // len(period))
+            bases = (period * repeats)[:num_measurements]
             
             if len(bases) != num_measurements:
                 raise WitnessEncodingError(f"Generated {len(bases)} bases, expected {num_measurements}")
@@ -130,9 +134,46 @@ class WitnessEncoder:
         
         for gate_name in gate_sequence:
             if gate_name in self.gate_library:
-                gate = self.gate_library[gate_name]
                 # Apply to first qubit (prover's qubit)
-                current_state = self.quantum_prep.apply_gate(current_state, gate, qubit=0)
+                if gate_name in self._named_gates:
+                    current_state = self.quantum_prep.apply_named_gate(current_state, gate_name, qubit=0)
+                else:
+                    gate = self.gate_library[gate_name]
+                    current_state = self.quantum_prep.apply_gate(current_state, gate, qubit=0)
         
         return current_state
-
+    
+    def compose_circuit(self, gate_sequence: List[str]) -> np.ndarray:
+        """
+        Compose a gate sequence into a single single-qubit unitary
+        
+        Args:
+            gate_sequence: List of gate names to apply, in order
+            
+        Returns:
+            2x2 unitary U = G_k ... G_1 equivalent to applying the sequence
+        """
+        unitary = self.quantum_prep.I.copy()
+        
+        for gate_name in gate_sequence:
+            if gate_name in self.gate_library:
+                unitary = self.gate_library[gate_name] @ unitary
+        
+        return unitary
+    
+    def apply_circuit_batch(self, states: np.ndarray, gate_sequence: List[str]) -> np.ndarray:
+        """
+        Apply gate sequence to many quantum states at once
+        
+        The sequence is composed into one unitary and applied to the first
+        qubit (prover's qubit) of every state with a single matrix product.
+        
+        Args:
+            states: (N, 4) array of 2-qubit states
+            gate_sequence: List of gate names to apply
+            
+        Returns:
+            (N, 4) array of transformed quantum states
+        """
+        gate_full = np.kron(self.compose_circuit(gate_sequence), self.quantum_prep.I)
+        return states @ gate_full.T
@@ -39,6 +39,7 @@ setup(
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
+            "msgpack>=1.0",  # Binary proof message tests
         ],
     },
 )
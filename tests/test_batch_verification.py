@@ -149,6 +149,23 @@ class TestBatchVerification(unittest.TestCase):
         self.assertEqual(len(result.results), 3)
         self.assertTrue(result.performance['vectorized'])
     
+    def test_packed_proofs(self):
+        """Test that bit-packed proofs verify like their unpacked counterparts"""
+        packed_qezk = QuantumEntanglementZK(num_epr_pairs=100, pack_results=True)
+        proofs = [self.qezk.prove("Statement", "11010110", seed=42)]
+        packed_proofs = [packed_qezk.prove("Statement", "11010110", seed=42)]
+        
+        expected = self.verifier.verify_batch(proofs, verify_all=False).results
+        packed = BatchVerifier(packed_qezk, use_cache=False).verify_batch(
+            packed_proofs, verify_all=False
+        ).results
+        vectorized = OptimizedBatchVerifier(packed_qezk).verify_batch_vectorized(
+            packed_proofs, verify_all=False
+        ).results
+        
+        for results in (packed, vectorized):
+            self.assertEqual(results[0][1:], expected[0][1:])
+    
     def test_cache_clear(self):
         """Test cache clearing"""
         proof = self.qezk.prove("I know the secret", "11010110", seed=42)
@@ -29,6 +29,15 @@ class TestEntanglementSource(unittest.TestCase):
             norm = np.sqrt(np.sum(np.abs(pair)**2))
             self.assertAlmostEqual(norm, 1.0, places=10)
     
+    def test_generate_epr_pairs_bulk(self):
+        """Test contiguous EPR pair generation"""
+        epr_pairs = self.entanglement.generate_epr_pairs_bulk(10, 'psi_minus')
+        
+        self.assertEqual(epr_pairs.shape, (10, 4))
+        self.assertTrue(epr_pairs.flags['C_CONTIGUOUS'])
+        for pair, expected in zip(epr_pairs, self.entanglement.generate_epr_pairs(10, 'psi_minus')):
+            np.testing.assert_array_almost_equal(pair, expected)
+    
     def test_split_epr_pairs(self):
         """Test splitting EPR pairs"""
         epr_pairs = self.entanglement.generate_epr_pairs(5)
@@ -37,6 +37,17 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(ConfigurationError):
             QuantumEntanglementZK(chsh_threshold=5.0)  # Too large
     
+    def test_invalid_backend(self):
+        """Test invalid array backend"""
+        with self.assertRaises(ConfigurationError):
+            QuantumEntanglementZK(backend='torch')
+        
+        try:
+            import cupy  # noqa: F401
+        except ImportError:
+            with self.assertRaises(ConfigurationError):
+                QuantumEntanglementZK(backend='cupy')
+    
     def test_invalid_statement(self):
         """Test invalid statement"""
         qezk = QuantumEntanglementZK(num_epr_pairs=100)
@@ -73,6 +84,17 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(VerificationError):
             qezk.verify([0, 1], [0, 1], ['Z', 'W'])  # Invalid basis: W
     
+    def test_measurement_error_index(self):
+        """Test that measurement errors report the failing particle index"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=5)
+        prover_particles, _ = qezk.setup(seed=42)
+        prover_particles = list(prover_particles)
+        prover_particles[3] = prover_particles[3][:3]
+        
+        with self.assertRaises(MeasurementError) as context:
+            qezk.prover_phase("statement", "101", prover_particles)
+        self.assertIn("index 3", str(context.exception))
+    
     def test_error_messages(self):
         """Test that error messages are informative"""
         try:
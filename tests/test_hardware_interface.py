@@ -8,12 +8,14 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import asyncio
 import unittest
 import numpy as np
 from qezk import (
     SimulationBackend, HardwareInterface, HardwareQEZK
 )
 from qezk.exceptions import MeasurementError, QuantumStateError
+from qezk.hardware_interface import QuantumHardwareBackend
 
 
 class TestHardwareInterface(unittest.TestCase):
@@ -29,6 +31,27 @@ class TestHardwareInterface(unittest.TestCase):
             self.assertEqual(state.shape, (4,))
             self.assertAlmostEqual(np.linalg.norm(state), 1.0, places=5)
     
+    def test_simulation_backend_bell_state_is_copy(self):
+        """Test that modifying a returned Bell state does not affect later ones"""
+        backend = SimulationBackend()
+        
+        state = backend.create_bell_state('phi_minus')
+        state[:] = 0
+        
+        np.testing.assert_allclose(
+            backend.create_bell_state('phi_minus'), np.array([1, 0, 0, -1]) / np.sqrt(2)
+        )
+    
+    def test_simulation_backend_bell_states(self):
+        """Test batched Bell state creation against the per-state default"""
+        backend = SimulationBackend()
+        
+        for state_type in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']:
+            states = backend.create_bell_states(5, state_type)
+            self.assertEqual(states.shape, (5, 4))
+            np.testing.assert_allclose(states, QuantumHardwareBackend.create_bell_states(backend, 5, state_type))
+            np.testing.assert_allclose(backend.get_state(), states[0])
+    
     def test_simulation_backend_measurement(self):
         """Test measurement on simulation backend"""
         backend = SimulationBackend()
@@ -43,6 +66,40 @@ class TestHardwareInterface(unittest.TestCase):
         with self.assertRaises(MeasurementError):
             backend.measure(0, 'W')
     
+    def test_simulation_backend_measure_batch(self):
+        """Test that batched shots match repeated single measurements"""
+        backend = SimulationBackend()
+        backend.create_bell_state('psi_plus')
+        
+        for qubit in [0, 1]:
+            for basis in ['Z', 'X', 'Y']:
+                np.random.seed(3)
+                expected = [backend.measure(qubit, basis) for _ in range(50)]
+                np.random.seed(3)
+                results = backend.measure_batch(qubit, basis, 50)
+                self.assertEqual(results.dtype, np.uint8)
+                self.assertEqual(results.tolist(), expected)
+        
+        with self.assertRaises(MeasurementError):
+            backend.measure_batch(0, 'W', 10)
+    
+    def test_measure_batch_async(self):
+        """Test asynchronous shots, including the per-shot default"""
+        backend = SimulationBackend()
+        backend.create_bell_state('psi_plus')
+        
+        np.random.seed(3)
+        expected = backend.measure_batch(1, 'X', 50)
+        np.random.seed(3)
+        results = asyncio.run(backend.measure_batch_async(1, 'X', 50))
+        np.testing.assert_array_equal(results, expected)
+        
+        # |00⟩ measures 0 in Z on every shot, whichever thread draws it
+        backend.reset()
+        results = asyncio.run(QuantumHardwareBackend.measure_batch_async(backend, 0, 'Z', 20))
+        self.assertEqual(results.dtype, np.uint8)
+        self.assertEqual(results.tolist(), [0] * 20)
+    
     def test_simulation_backend_gates(self):
         """Test gate application on simulation backend"""
         backend = SimulationBackend()
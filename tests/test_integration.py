@@ -47,6 +47,12 @@ class TestIntegration(unittest.TestCase):
         self.assertGreaterEqual(results['success_rate'], 0.0)
         self.assertLessEqual(results['success_rate'], 1.0)
         self.assertGreater(results['avg_chsh'], 0.0)
+        self.assertEqual(results['chsh_values'].shape, (5,))
+        self.assertAlmostEqual(results['avg_chsh'], results['chsh_values'].mean())
+        
+        # Trials are seeded individually, so they match single proofs
+        proof = simulator.qezk.prove(statement, witness, seed=43)
+        self.assertEqual(results['chsh_values'][1], proof.chsh_value)
     
     def test_performance_analysis(self):
         """Test performance analysis across multiple statements"""
@@ -60,6 +66,20 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(len(results['individual_results']), 2)
         self.assertGreaterEqual(results['overall_success_rate'], 0.0)
         self.assertLessEqual(results['overall_success_rate'], 1.0)
+    
+    def test_performance_analysis_parallel(self):
+        """Test performance analysis with one worker process per pair"""
+        simulator = QEZKSimulation(num_epr_pairs=100)
+        
+        results = simulator.performance_analysis(
+            ["Statement 1", "Statement 2"], ["11010110", "10101010"],
+            parallel=True, max_workers=2
+        )
+        
+        self.assertEqual(len(results['individual_results']), 2)
+        for result in results['individual_results']:
+            self.assertEqual(result['total_trials'], 10)
+            self.assertEqual(result['chsh_values'].shape, (10,))
 
 
 if __name__ == '__main__':
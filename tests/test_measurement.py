@@ -26,6 +26,22 @@ class TestBellMeasurement(unittest.TestCase):
             result = self.measurement.measure(state, basis)
             self.assertIn(result, [0, 1])
     
+    def test_measure_batch_matches_measure(self):
+        """Test that batched measurement matches per-state measurement"""
+        states = np.array([
+            self.quantum_prep.create_bell_state(state_type)
+            for state_type in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']
+        ] * 25)
+        bases = ['Z', 'X', 'Y', 'X', 'Z'] * 20
+        
+        np.random.seed(7)
+        expected = [self.measurement.measure(state, basis) for state, basis in zip(states, bases)]
+        np.random.seed(7)
+        results = self.measurement.measure_batch(states, bases)
+        
+        self.assertEqual(results.dtype, np.uint8)
+        self.assertEqual(results.tolist(), expected)
+    
     def test_bell_state_measurement(self):
         """Test Bell state identification"""
         # Test with |Φ⁺⟩
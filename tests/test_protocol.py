@@ -3,7 +3,9 @@ Tests for QE-ZK protocol
 """
 
 import unittest
+import numpy as np
 from qezk.protocol import QuantumEntanglementZK, QEZKProof
+from qezk.exceptions import ProtocolError
 
 
 class TestQuantumEntanglementZK(unittest.TestCase):
@@ -59,6 +61,120 @@ class TestQuantumEntanglementZK(unittest.TestCase):
         self.assertEqual(len(proof.prover_results), 100)
         self.assertEqual(len(proof.verifier_results), 100)
         self.assertEqual(len(proof.measurement_bases), 100)
+    
+    def test_prove_matches_phases(self):
+        """Test that fused proving matches the explicit protocol phases"""
+        statement = "I know the secret password"
+        witness = "1101011010110101"
+        
+        proof = self.qezk.prove(statement, witness, seed=42)
+        
+        prover_particles, verifier_particles = self.qezk.setup(seed=42)
+        results, bases = self.qezk.prover_phase(statement, witness, prover_particles)
+        verifier_results = self.qezk.verifier_phase(statement, verifier_particles, bases)
+        
+        self.assertEqual(proof.prover_results.tolist(), results.tolist())
+        self.assertEqual(proof.verifier_results.tolist(), verifier_results.tolist())
+        self.assertEqual(proof.measurement_bases, bases)
+    
+    def test_small_tiles(self):
+        """Test proving with tiles smaller than the number of EPR pairs"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100, tile_size=7)
+        
+        proof1 = qezk.prove("I know the secret", "11010110", seed=42)
+        proof2 = qezk.prove("I know the secret", "11010110", seed=42)
+        
+        self.assertEqual(len(proof1.prover_results), 100)
+        self.assertEqual(len(proof1.verifier_results), 100)
+        self.assertEqual(proof1.prover_results.tolist(), proof2.prover_results.tolist())
+    
+    def test_tiled_prove_matches_phases(self):
+        """Test that seeded proving matches the phases when N exceeds the tile size"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=200, tile_size=50)
+        statement = "I know the secret password"
+        witness = "1101011010110101"
+        
+        proof = qezk.prove(statement, witness, seed=42)
+        
+        prover_particles, verifier_particles = qezk.setup(seed=42)
+        results, bases = qezk.prover_phase(statement, witness, prover_particles)
+        verifier_results = qezk.verifier_phase(statement, verifier_particles, bases)
+        
+        self.assertEqual(proof.prover_results.tolist(), results.tolist())
+        self.assertEqual(proof.verifier_results.tolist(), verifier_results.tolist())
+    
+    def test_verify_chsh_matches_measurement(self):
+        """Test that verify() reports the same CHSH value as BellMeasurement"""
+        proof = self.qezk.prove("I know the secret password", "1101011010110101", seed=7)
+        
+        chsh_value, _ = self.qezk.measurement.chsh_inequality_test(
+            proof.prover_results, proof.verifier_results,
+            proof.measurement_bases, proof.measurement_bases
+        )
+        
+        self.assertAlmostEqual(proof.chsh_value, chsh_value)
+    
+    def test_fast_reject(self):
+        """Test rejecting uncorrelated results from a sample"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100, fast_reject=True)
+        bases = ['Z', 'X'] * 10000
+        prover_results = np.zeros(20000, dtype=np.uint8)
+        
+        is_valid, chsh_value = qezk.verify(prover_results, 1 - prover_results, bases)
+        self.assertFalse(is_valid)
+        self.assertTrue(np.isnan(chsh_value))
+        
+        is_valid, chsh_value = qezk.verify(prover_results, prover_results, bases)
+        self.assertAlmostEqual(chsh_value, 2.0)
+    
+    def test_compile_for(self):
+        """Test statement-specialized proof generation"""
+        statement = "I know the secret password"
+        witness = "1101011010110101"
+        
+        specialized_prove = self.qezk.compile_for(statement)
+        proof = specialized_prove(witness, seed=42)
+        expected = self.qezk.prove(statement, witness, seed=42)
+        
+        self.assertIs(self.qezk.compile_for(statement), specialized_prove)
+        self.assertEqual(proof.statement, statement)
+        self.assertEqual(proof.measurement_bases, expected.measurement_bases)
+        self.assertEqual(proof.prover_results.tolist(), expected.prover_results.tolist())
+        self.assertEqual(proof.verifier_results.tolist(), expected.verifier_results.tolist())
+    
+    def test_compile_for_cache_bounded(self):
+        """Test that compiled provers are evicted least recently used first"""
+        first = self.qezk.compile_for("Statement 0")
+        for i in range(1, 40):
+            self.qezk.compile_for(f"Statement {i}")
+            self.qezk.compile_for("Statement 0")
+        
+        self.assertEqual(len(self.qezk._compiled_provers), 32)
+        self.assertIs(self.qezk.compile_for("Statement 0"), first)
+        self.assertNotIn((self.qezk.num_epr_pairs, "Statement 1"), self.qezk._compiled_provers)
+        with self.assertRaises(ProtocolError):
+            first(1101)
+    
+    def test_packed_results(self):
+        """Test bit-packed proof results"""
+        statement = "I know the secret password"
+        witness = "1101011010110101"
+        packed_qezk = QuantumEntanglementZK(num_epr_pairs=100, pack_results=True)
+        
+        proof = packed_qezk.prove(statement, witness, seed=42)
+        unpacked = self.qezk.prove(statement, witness, seed=42)
+        
+        self.assertTrue(proof.packed)
+        self.assertEqual(len(proof.prover_results), 13)
+        self.assertEqual(np.unpackbits(proof.prover_results, count=100).tolist(),
+                         unpacked.prover_results.tolist())
+        
+        is_valid, chsh_value = packed_qezk.verify(
+            proof.prover_results, proof.verifier_results,
+            proof.measurement_bases, packed=True
+        )
+        self.assertEqual(is_valid, unpacked.is_valid)
+        self.assertAlmostEqual(chsh_value, unpacked.chsh_value)
 
 
 if __name__ == '__main__':
@@ -8,11 +8,19 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import importlib.util
+import io
+import pickle
 import unittest
+from unittest import mock
+import numpy as np
 from qezk import (
     QuantumEntanglementZK, StandardMessageFormat, ProtocolCompliance,
-    ProtocolVersionManager, StandardProtocolImplementation, ProtocolVersion
+    ProtocolVersionManager, StandardProtocolImplementation, ProtocolVersion,
+    ProtocolSpecification
 )
+from qezk.exceptions import ConfigurationError, ProtocolError
+from qezk.protocol_standard import _cached_specification, _version_key
 
 
 class TestProtocolStandard(unittest.TestCase):
@@ -40,6 +48,14 @@ class TestProtocolStandard(unittest.TestCase):
         self.assertIn('data', message)
         self.assertEqual(message['data']['statement'], 'I know the secret')
     
+    def test_setup_request_message_id(self):
+        """Test that setup requests carry a 16 hex character message id"""
+        message = StandardMessageFormat.create_setup_request("I know the secret", seed=42)
+        message_id = message['metadata']['message_id']
+        
+        self.assertEqual(len(message_id), 16)
+        int(message_id, 16)
+    
     def test_standard_message_format_prover_results(self):
         """Test standard prover results message"""
         message = StandardMessageFormat.create_prover_results(
@@ -51,6 +67,168 @@ class TestProtocolStandard(unittest.TestCase):
         self.assertEqual(message['message_type'], 'prover_results')
         self.assertEqual(message['data']['prover_results'], [0, 1, 0])
         self.assertEqual(message['metadata']['num_measurements'], 3)
+        self.assertEqual(
+            message['metadata']['bases_distribution'], {'Z': 2, 'X': 1, 'Y': 0}
+        )
+    
+    def test_prover_results_batch(self):
+        """Test batched prover results message"""
+        items = [
+            ([0, 1, 0], ['Z', 'X', 'Z'], "statement A"),
+            (np.array([1, 1], dtype=np.uint8), ['X', 'X'], "statement B")
+        ]
+        message = StandardMessageFormat.create_prover_results_batch(items)
+        
+        self.assertEqual(message['message_type'], 'prover_results_batch')
+        self.assertEqual(message['metadata']['num_items'], 2)
+        self.assertEqual(message['data']['items'][1]['prover_results'], [1, 1])
+        self.assertEqual(message['data']['items'][1]['statement'], "statement B")
+        self.assertEqual(StandardMessageFormat.validate_message(message), (True, None))
+    
+    def test_messages_without_metadata(self):
+        """Test that include_metadata=False omits the metadata block"""
+        messages = [
+            StandardMessageFormat.create_setup_request("I know the secret", include_metadata=False),
+            StandardMessageFormat.create_prover_results(
+                [0, 1], ['Z', 'X'], "I know the secret", include_metadata=False
+            ),
+            StandardMessageFormat.create_verification_request(
+                [0, 1], [0, 0], ['Z', 'X'], include_metadata=False
+            ),
+            StandardMessageFormat.create_verification_response(
+                True, 2.5, "I know the secret", include_metadata=False
+            )
+        ]
+        
+        compliance = ProtocolCompliance()
+        for message in messages:
+            self.assertNotIn('metadata', message)
+            self.assertTrue(compliance.check_message_compliance(message)['compliant'])
+    
+    def test_packed_prover_results(self):
+        """Test bit-packed prover results round-trip"""
+        results = np.array([0, 1, 1, 0, 1, 0, 0, 1, 1, 1], dtype=np.uint8)
+        message = StandardMessageFormat.create_prover_results(
+            prover_results=results,
+            measurement_bases=['Z', 'X'] * 5,
+            statement="I know the secret",
+            packed=True
+        )
+        data = message['data']
+        
+        self.assertNotIn('prover_results', data)
+        np.testing.assert_array_equal(
+            StandardMessageFormat.unpack_results(data['prover_results_packed'], data['num_results']),
+            results
+        )
+        self.assertTrue(ProtocolCompliance().check_message_compliance(message)['compliant'])
+    
+    def test_packed_by_version(self):
+        """Test that results are packed by default for versions after 1.0"""
+        legacy = StandardMessageFormat.create_verification_request(
+            [0, 1, 1], [0, 0, 1], ['Z', 'X', 'Z'], version="1.0"
+        )
+        packed = StandardMessageFormat.create_verification_request(
+            [0, 1, 1], [0, 0, 1], ['Z', 'X', 'Z'], version="1.1"
+        )
+        
+        self.assertEqual(legacy['data']['verifier_results'], [0, 0, 1])
+        self.assertNotIn('verifier_results', packed['data'])
+        np.testing.assert_array_equal(
+            StandardMessageFormat.unpack_results(
+                packed['data']['verifier_results_packed'], packed['data']['num_results']
+            ),
+            [0, 0, 1]
+        )
+        self.assertEqual(packed['metadata']['results_match'], 2)
+    
+    @unittest.skipUnless(importlib.util.find_spec('msgpack'), "msgpack not installed")
+    def test_msgpack_proof_message_round_trip(self):
+        """Test writing and reading a MessagePack proof message"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100)
+        proof = qezk.prove("I know the secret", "11010110", seed=42)
+        std_impl = StandardProtocolImplementation()
+        
+        buffer = io.BytesIO()
+        std_impl.write_standard_proof_message(proof, buffer)
+        buffer.seek(0)
+        message = std_impl.read_standard_proof_message(buffer)
+        
+        np.testing.assert_array_equal(message['data']['prover_results'], proof.prover_results)
+        np.testing.assert_array_equal(message['data']['verifier_results'], proof.verifier_results)
+        self.assertEqual(message['data']['chsh_value'], proof.chsh_value)
+    
+    def test_msgpack_proof_message_requires_msgpack(self):
+        """Test that binary proof messages report a missing msgpack"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100)
+        proof = qezk.prove("I know the secret", "11010110", seed=42)
+        std_impl = StandardProtocolImplementation()
+        
+        # A None entry in sys.modules makes ``import msgpack`` raise ImportError
+        with mock.patch.dict(sys.modules, {'msgpack': None}):
+            with self.assertRaisesRegex(ConfigurationError, "msgpack not installed"):
+                std_impl.write_standard_proof_message(proof, io.BytesIO())
+            with self.assertRaisesRegex(ConfigurationError, "msgpack not installed"):
+                std_impl.read_standard_proof_message(io.BytesIO())
+    
+    def test_standard_proof_message_packed(self):
+        """Test packed standard proof messages from packed and unpacked proofs"""
+        std_impl = StandardProtocolImplementation()
+        for pack_results in (False, True):
+            qezk = QuantumEntanglementZK(num_epr_pairs=100, pack_results=pack_results)
+            proof = qezk.prove("I know the secret", "11010110", seed=42)
+            
+            proof_msg = std_impl.create_standard_proof_message(proof, packed=True)
+            legacy_msg = std_impl.create_standard_proof_message(proof)
+            data = proof_msg['data']
+            
+            self.assertEqual(data['num_results'], 100)
+            self.assertEqual(len(legacy_msg['data']['prover_results']), 100)
+            np.testing.assert_array_equal(
+                StandardMessageFormat.unpack_results(data['prover_results_packed'], 100),
+                legacy_msg['data']['prover_results']
+            )
+    
+    def test_unpack_results_invalid(self):
+        """Test that malformed packed results raise ProtocolError"""
+        with self.assertRaises(ProtocolError):
+            StandardMessageFormat.unpack_results('not base64!', 8)
+        with self.assertRaises(ProtocolError):
+            StandardMessageFormat.unpack_results(StandardMessageFormat.pack_results([1, 0]), 16)
+    
+    def test_verification_response_timestamps(self):
+        """Test that the response uses one timestamp for message and metadata"""
+        message = StandardMessageFormat.create_verification_response(
+            is_valid=True,
+            chsh_value=2.5,
+            statement="I know the secret"
+        )
+        
+        self.assertEqual(message['timestamp'], message['metadata']['verification_timestamp'])
+        
+        # Metadata built from the shared template must not leak between messages
+        message['metadata']['chsh_threshold'] = 0.0
+        again = StandardMessageFormat.create_verification_response(True, 2.5, "I know the secret")
+        self.assertEqual(again['metadata']['chsh_threshold'], 2.2)
+    
+    def test_verification_request_results_match(self):
+        """Test counting of matching prover and verifier results"""
+        message = StandardMessageFormat.create_verification_request(
+            prover_results=[0, 1, 1, 0],
+            verifier_results=[0, 0, 1, 0],
+            measurement_bases=['Z', 'X', 'Z', 'X']
+        )
+        
+        self.assertEqual(message['metadata']['results_match'], 3)
+        self.assertIsInstance(message['metadata']['results_match'], int)
+    
+    def test_verification_request_results_match_out_of_range(self):
+        """Test that out-of-range and fractional results are not coerced into matches"""
+        message = StandardMessageFormat.create_verification_request(
+            [-1, 0.6, 1], [255, 0, 1], ['Z', 'X', 'Z']
+        )
+        
+        self.assertEqual(message['metadata']['results_match'], 1)
     
     def test_message_validation_valid(self):
         """Test message validation with valid message"""
@@ -68,14 +246,70 @@ class TestProtocolStandard(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIsNotNone(error)
     
+    def test_message_validation_errors(self):
+        """Test the error reported for each kind of invalid message"""
+        message = StandardMessageFormat.create_setup_request("I know the secret")
+        
+        missing = {k: v for k, v in message.items() if k != 'timestamp'}
+        self.assertEqual(
+            StandardMessageFormat.validate_message(missing),
+            (False, "Missing required field: timestamp")
+        )
+        
+        bad_version = dict(message, version='9.9')
+        self.assertEqual(
+            StandardMessageFormat.validate_message(bad_version),
+            (False, "Unsupported version: 9.9")
+        )
+        
+        bad_type = dict(message, message_type='unknown')
+        self.assertEqual(
+            StandardMessageFormat.validate_message(bad_type),
+            (False, "Invalid message type: unknown")
+        )
+    
     def test_protocol_compliance(self):
         """Test protocol compliance checker"""
         compliance = ProtocolCompliance(version="1.0")
         spec = compliance.get_specification()
         
         self.assertEqual(spec.version, "1.0")
-        self.assertIn('message_formats', spec.__dict__)
-        self.assertIn('security_parameters', spec.__dict__)
+        self.assertIn('message_formats', spec.to_dict())
+        self.assertIn('security_parameters', spec.to_dict())
+        self.assertEqual(ProtocolSpecification.from_json(spec.to_json()), spec)
+    
+    def test_specification_cached(self):
+        """Test that compliance checkers share a cached specification"""
+        first = ProtocolCompliance("1.0").get_specification()
+        second = ProtocolCompliance("1.0").get_specification()
+        
+        self.assertIs(first, second)
+        with self.assertRaises(AttributeError):
+            first.version = "2.0"
+        with self.assertRaises(AttributeError):
+            first.message_formats['setup_request']['required_fields'].append('extra')
+        with self.assertRaises(TypeError):
+            first.security_parameters['chsh_threshold'] = 0.0
+        self.assertEqual(
+            ProtocolCompliance("1.0").get_specification().message_formats['setup_request']['required_fields'],
+            ('statement',)
+        )
+    
+    def test_specification_unknown_version_not_cached(self):
+        """Test that unsupported versions are not kept in the specification cache"""
+        ProtocolCompliance("1.0")
+        size = _cached_specification.cache_info().currsize
+        
+        spec = ProtocolCompliance("garbage").get_specification()
+        
+        self.assertEqual(spec.version, "garbage")
+        self.assertEqual(_cached_specification.cache_info().currsize, size)
+    
+    def test_specification_pickle_round_trip(self):
+        """Test that the slotted specification survives pickling"""
+        spec = ProtocolCompliance("1.0").get_specification()
+        
+        self.assertEqual(pickle.loads(pickle.dumps(spec)), spec)
     
     def test_message_compliance_check(self):
         """Test message compliance checking"""
@@ -100,6 +334,84 @@ class TestProtocolStandard(unittest.TestCase):
         self.assertIn('errors', report)
         self.assertTrue(report['compliant'])  # Should be compliant
     
+    def test_proof_compliance_invalid_results(self):
+        """Test that invalid results and bases are reported"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100)
+        proof = qezk.prove("I know the secret", "11010110", seed=42)
+        proof.prover_results = proof.prover_results.copy()
+        proof.prover_results[7] = 2
+        proof.measurement_bases = list(proof.measurement_bases)
+        proof.measurement_bases[3] = 'W'
+        
+        report = ProtocolCompliance().check_proof_compliance(proof)
+        
+        self.assertFalse(report['compliant'])
+        self.assertIn("Invalid prover result at index 7: 2", report['errors'])
+        self.assertIn("Invalid measurement basis: W", report['errors'])
+    
+    def test_proof_compliance_list_results(self):
+        """Test result validation for plain list results"""
+        class ListProof:
+            prover_results = [0, 1, -1]
+            verifier_results = [0, 1, 1]
+            measurement_bases = ['Z', 'X', 'Z']
+            chsh_value = 2.5
+            is_valid = True
+            statement = "I know the secret"
+        
+        report = ProtocolCompliance().check_proof_compliance(ListProof())
+        
+        self.assertEqual(report['errors'], ["Invalid prover result at index 2: -1"])
+    
+    def test_proof_compliance_malformed_results(self):
+        """Test result and basis validation for None, string and ragged input"""
+        class MalformedProof:
+            verifier_results = [0, 1, 1]
+            chsh_value = 2.5
+            is_valid = True
+            statement = "I know the secret"
+        
+        cases = [
+            ([0, 1, None], "Invalid prover result at index 2: None"),
+            ([0, 1, 'a'], "Invalid prover result at index 2: a"),
+            ([[0, 1], [1], 0], "Invalid prover result at index 0: [0, 1]"),
+        ]
+        for prover_results, error in cases:
+            proof = MalformedProof()
+            proof.prover_results = prover_results
+            proof.measurement_bases = ['Z', 1, ['W'], 'W']
+            
+            report = ProtocolCompliance().check_proof_compliance(proof)
+            
+            self.assertFalse(report['compliant'])
+            self.assertEqual(report['errors'], [
+                error,
+                "Invalid measurement basis: W",
+                "Invalid measurement basis: 1",
+                "Invalid measurement basis: ['W']",
+            ])
+    
+    def test_proof_compliance_missing_fields(self):
+        """Test that missing proof fields are reported"""
+        class PartialProof:
+            prover_results = [0, 1]
+            measurement_bases = ['Z', 'X']
+        
+        report = ProtocolCompliance().check_proof_compliance(PartialProof())
+        
+        self.assertFalse(report['compliant'])
+        self.assertIn("Missing proof field: verifier_results", report['errors'])
+        self.assertIn("Missing proof field: chsh_value", report['errors'])
+    
+    def test_proof_compliance_packed(self):
+        """Test proof compliance for bit-packed results"""
+        qezk = QuantumEntanglementZK(num_epr_pairs=100, pack_results=True)
+        proof = qezk.prove("I know the secret", "11010110", seed=42)
+        
+        report = ProtocolCompliance().check_proof_compliance(proof)
+        
+        self.assertTrue(report['compliant'])
+    
     def test_version_manager(self):
         """Test protocol version manager"""
         manager = ProtocolVersionManager()
@@ -108,6 +420,22 @@ class TestProtocolStandard(unittest.TestCase):
         self.assertTrue(manager.is_version_supported('1.0'))
         self.assertFalse(manager.is_version_supported('3.0'))
     
+    def test_latest_version_numeric(self):
+        """Test that the latest version is chosen numerically"""
+        manager = ProtocolVersionManager()
+        
+        self.assertEqual(manager.get_latest_version(), '2.0')
+    
+    def test_register_supported_version(self):
+        """Test that versions appended to supported_versions are honoured"""
+        manager = ProtocolVersionManager()
+        manager.supported_versions.append('10.0')
+        
+        self.assertTrue(manager.is_version_supported('10.0'))
+        self.assertEqual(manager.get_latest_version(), '10.0')
+        self.assertFalse(ProtocolVersionManager().is_version_supported('10.0'))
+        self.assertEqual(max(['1.2', '1.10'], key=_version_key), '1.10')
+    
     def test_version_compatibility(self):
         """Test version compatibility checking"""
         manager = ProtocolVersionManager()
@@ -120,6 +448,22 @@ class TestProtocolStandard(unittest.TestCase):
         compatible = manager.check_compatibility('1.0', '2.0')
         # This depends on implementation, but for now v1.x are compatible
     
+    def test_upgrade_message(self):
+        """Test copying and in-place message upgrades"""
+        manager = ProtocolVersionManager()
+        message = StandardMessageFormat.create_setup_request("I know the secret")
+        
+        upgraded = manager.upgrade_message(message, '1.1')
+        self.assertEqual(upgraded['version'], '1.1')
+        self.assertEqual(message['version'], '1.0')
+        
+        upgraded = manager.upgrade_message_inplace(message, '1.1')
+        self.assertIs(upgraded, message)
+        self.assertEqual(message['version'], '1.1')
+        
+        with self.assertRaises(ConfigurationError):
+            manager.upgrade_message_inplace(message, '3.0')
+    
     def test_standard_implementation(self):
         """Test standard protocol implementation"""
         std_impl = StandardProtocolImplementation(version="1.0")
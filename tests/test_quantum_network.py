@@ -8,8 +8,12 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import pickle
 import unittest
+from unittest import mock
+import threading
 import time
+import numpy as np
 from qezk import (
     QuantumEntanglementZK, NodeType, ChannelState, QuantumNode, QuantumChannel,
     QuantumNetwork, QuantumNetworkProtocol, QuantumNetworkMonitor
@@ -56,6 +60,23 @@ class TestQuantumNetwork(unittest.TestCase):
         
         self.assertNotIn("node1", self.network.topology.nodes)
     
+    def test_remove_node_cleans_up_neighbors(self):
+        """Test that removing a node removes its channels from the other nodes"""
+        for node_id in ("hub", "a", "b"):
+            self.network.add_node(QuantumNode(node_id=node_id, node_type=NodeType.HUB))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="hub", node_b="a"))
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="hub", node_b="a"))
+        self.network.add_channel(QuantumChannel(channel_id="ch3", node_a="b", node_b="hub"))
+        
+        self.network.remove_node("hub")
+        
+        self.assertEqual(self.network.topology.channels, {})
+        for node_id in ("a", "b"):
+            node = self.network.get_node(node_id)
+            self.assertEqual(node.neighbors, [])
+            self.assertEqual(node.channels, {})
+        self.assertIsNone(self.network.find_path("a", "b"))
+    
     def test_add_channel(self):
         """Test adding channel to network"""
         node1 = QuantumNode(node_id="node1", node_type=NodeType.PROVER)
@@ -95,6 +116,77 @@ class TestQuantumNetwork(unittest.TestCase):
         self.assertEqual(path[0], "node1")
         self.assertEqual(path[-1], "node3")
     
+    def test_find_path_after_topology_change(self):
+        """Test that paths reflect node and channel changes made after a lookup"""
+        for i in range(3):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="node1", node_b="node2"))
+        
+        self.assertIsNone(self.network.find_path("node1", "node3"))
+        
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="node2", node_b="node3"))
+        self.assertEqual(self.network.find_path("node1", "node3"), ["node1", "node2", "node3"])
+        
+        self.network.remove_node("node2")
+        self.assertIsNone(self.network.find_path("node1", "node3"))
+    
+    def test_routing_table(self):
+        """Test that the topology's routing table follows topology changes"""
+        for i in range(3):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="node1", node_b="node2"))
+        routing_table = self.network.topology.routing_table
+        
+        self.assertEqual(routing_table["node1"], {"node2": ["node1", "node2"]})
+        self.assertEqual(routing_table["node3"], {})
+        
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="node2", node_b="node3"))
+        self.assertEqual(routing_table["node1"]["node3"], ["node1", "node2", "node3"])
+        self.assertEqual(sorted(routing_table), ["node1", "node2", "node3"])
+        self.assertIsNone(routing_table.get("node4"))
+    
+    def test_find_path_reverse_lookup(self):
+        """Test that a reverse lookup reuses the tree built for the forward one"""
+        for i in range(3):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="node1", node_b="node2"))
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="node2", node_b="node3"))
+        
+        forward = self.network.find_path("node1", "node3")
+        backward = self.network.find_path("node3", "node1")
+        
+        self.assertEqual(backward, forward[::-1])
+        self.assertNotIn("node3", self.network._parent_trees)
+    
+    def test_frozen_routing(self):
+        """Test find_path on a frozen topology and topology changes after thaw"""
+        for i in range(5):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        for ch_id, a, b in [("ch1", "node1", "node2"), ("ch2", "node2", "node3"),
+                            ("ch3", "node1", "node4"), ("ch4", "node4", "node3")]:
+            self.network.add_channel(QuantumChannel(channel_id=ch_id, node_a=a, node_b=b))
+        
+        self.network.freeze()
+        for source in ["node1", "node2", "node3", "node4"]:
+            for destination in ["node1", "node2", "node3", "node4"]:
+                if source == destination:
+                    continue
+                path = self.network.find_path(source, destination)
+                self.assertEqual(path[0], source)
+                self.assertEqual(path[-1], destination)
+                self.assertEqual(len(path), len(self.network._shortest_paths(source)[destination]))
+        self.assertIsNone(self.network.find_path("node1", "node5"))
+        self.assertIsNone(self.network.find_path("node1", "missing"))
+        
+        with self.assertRaises(ConfigurationError):
+            self.network.add_channel(QuantumChannel(channel_id="ch5", node_a="node3", node_b="node5"))
+        with self.assertRaises(ConfigurationError):
+            self.network.remove_node("node4")
+        
+        self.network.thaw()
+        self.network.add_channel(QuantumChannel(channel_id="ch5", node_a="node3", node_b="node5"))
+        self.assertEqual(len(self.network.find_path("node1", "node5")), 4)
+    
     def test_distribute_epr_pairs(self):
         """Test EPR pair distribution"""
         prover_node = QuantumNode(
@@ -125,6 +217,65 @@ class TestQuantumNetwork(unittest.TestCase):
         self.assertEqual(len(source_pairs), 10)
         self.assertEqual(len(dest_pairs), 10)
     
+    def test_distribute_epr_pairs_routing(self):
+        """Test that only non-neighbor destinations need a path lookup"""
+        for node_id in ("prover1", "verifier1", "verifier2"):
+            self.network.add_node(QuantumNode(
+                node_id=node_id, node_type=NodeType.PROVER, qezk_instance=self.prover_qezk
+            ))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="prover1", node_b="verifier1"))
+        
+        with mock.patch.object(self.network, 'find_path', side_effect=AssertionError):
+            self.network.distribute_epr_pairs("prover1", "verifier1", 2)
+            self.network.distribute_epr_pairs("prover1", "prover1", 2)
+        
+        with self.assertRaises(ProtocolError):
+            self.network.distribute_epr_pairs("prover1", "verifier2", 2)
+    
+    def test_epr_distribution_accumulates(self):
+        """Test that repeated distributions append to each node's EPR array"""
+        for node_id, qezk in (("prover1", self.prover_qezk), ("verifier1", self.verifier_qezk)):
+            self.network.add_node(QuantumNode(
+                node_id=node_id, node_type=NodeType.PROVER, qezk_instance=qezk
+            ))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="prover1", node_b="verifier1"))
+        
+        self.network.distribute_epr_pairs("prover1", "verifier1", 3, 'phi_plus')
+        self.network.distribute_epr_pairs("prover1", "verifier1", 5, 'psi_minus')
+        
+        stored = self.network.epr_distribution["verifier1"]
+        self.assertEqual(stored.shape, (8, 4))
+        bell = self.prover_qezk.quantum_prep.create_bell_state
+        np.testing.assert_array_equal(stored[0], bell('phi_plus'))
+        np.testing.assert_array_equal(stored[7], bell('psi_minus'))
+    
+    def test_concurrent_epr_distribution(self):
+        """Test concurrent distributions between disjoint node pairs"""
+        for i in range(4):
+            self.network.add_node(QuantumNode(
+                node_id=f"node{i}", node_type=NodeType.PROVER, qezk_instance=self.prover_qezk
+            ))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="node0", node_b="node1"))
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="node2", node_b="node3"))
+        
+        def distribute(source, destination):
+            for _ in range(20):
+                self.network.distribute_epr_pairs(source, destination, 5)
+        
+        threads = [
+            threading.Thread(target=distribute, args=("node0", "node1")),
+            threading.Thread(target=distribute, args=("node3", "node2")),
+            threading.Thread(target=distribute, args=("node1", "node0"))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(self.network.epr_distribution["node0"]), 200)
+        self.assertEqual(len(self.network.epr_distribution["node2"]), 100)
+        self.assertEqual(self.network.get_network_stats()['total_epr_pairs'], 600)
+    
     def test_network_protocol(self):
         """Test network protocol execution"""
         prover_node = QuantumNode(
@@ -158,6 +309,29 @@ class TestQuantumNetwork(unittest.TestCase):
         self.assertIsNotNone(proof)
         self.assertEqual(proof.statement, "I know the secret")
     
+    def test_network_protocol_seed(self):
+        """Test that a seed makes network protocol runs reproducible"""
+        self.network.add_node(QuantumNode(
+            node_id="prover1", node_type=NodeType.PROVER, qezk_instance=self.prover_qezk
+        ))
+        self.network.add_node(QuantumNode(
+            node_id="verifier1", node_type=NodeType.VERIFIER, qezk_instance=self.verifier_qezk
+        ))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="prover1", node_b="verifier1"))
+        protocol = QuantumNetworkProtocol(self.network)
+        
+        for execute in (protocol.execute_protocol, protocol.execute_multi_hop_protocol):
+            first = execute("prover1", "verifier1", "I know the secret", "11010110",
+                            num_epr_pairs=200, seed=7)
+            second = execute("prover1", "verifier1", "I know the secret", "11010110",
+                             num_epr_pairs=200, seed=7)
+            np.testing.assert_array_equal(first.prover_results, second.prover_results)
+            np.testing.assert_array_equal(first.verifier_results, second.verifier_results)
+        
+        with self.assertRaises(ConfigurationError):
+            protocol.execute_protocol("prover1", "verifier1", "I know the secret", "11010110",
+                                      num_epr_pairs=10, seed="7")
+    
     def test_network_monitor(self):
         """Test network monitoring"""
         node = QuantumNode(node_id="node1", node_type=NodeType.PROVER)
@@ -206,6 +380,84 @@ class TestQuantumNetwork(unittest.TestCase):
         self.assertIn('num_nodes', stats)
         self.assertIn('num_channels', stats)
         self.assertEqual(stats['num_nodes'], 1)
+    
+    def test_network_stats_running_totals(self):
+        """Test EPR pair and node type totals across distribution and removal"""
+        self.network.add_node(QuantumNode(
+            node_id="prover1", node_type=NodeType.PROVER, qezk_instance=self.prover_qezk
+        ))
+        self.network.add_node(QuantumNode(
+            node_id="verifier1", node_type=NodeType.VERIFIER, qezk_instance=self.verifier_qezk
+        ))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="prover1", node_b="verifier1"))
+        
+        self.network.distribute_epr_pairs("prover1", "verifier1", 10)
+        stats = self.network.get_network_stats()
+        self.assertEqual(stats['total_epr_pairs'], 20)
+        self.assertEqual(stats['node_types']['prover'], 1)
+        
+        self.network.remove_node("prover1")
+        stats = self.network.get_network_stats()
+        self.assertEqual(stats['total_epr_pairs'], 10)
+        self.assertEqual(stats['node_types']['prover'], 0)
+        self.assertEqual(stats['node_types']['verifier'], 1)
+    
+    def test_channel_state_counts(self):
+        """Test channel state counts across state changes and node removal"""
+        for i in range(3):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        self.network.add_channel(QuantumChannel(channel_id="ch1", node_a="node1", node_b="node2"))
+        self.network.add_channel(QuantumChannel(channel_id="ch2", node_a="node2", node_b="node3"))
+        
+        self.network.set_channel_state("ch2", ChannelState.OFFLINE)
+        self.assertEqual(self.network.get_channel("ch2").state, ChannelState.OFFLINE)
+        stats = self.network.get_network_stats()
+        self.assertEqual(stats['channel_states']['idle'], 1)
+        self.assertEqual(stats['channel_states']['offline'], 1)
+        
+        monitor = QuantumNetworkMonitor(self.network)
+        self.assertEqual(monitor.get_network_health()['online_channels'], 1)
+        self.assertEqual(monitor._collect_metrics()['channel_states'], {'idle': 1, 'offline': 1})
+        
+        self.network.remove_node("node3")
+        stats = self.network.get_network_stats()
+        self.assertEqual(stats['channel_states']['offline'], 0)
+        self.assertEqual(stats['channel_states']['idle'], 1)
+        
+        with self.assertRaises(ConfigurationError):
+            self.network.set_channel_state("ch2", ChannelState.IDLE)
+    
+    def test_remove_node_with_self_loop(self):
+        """Test removing a node that has a self-loop and a normal channel"""
+        for node_id in ("a", "b"):
+            self.network.add_node(QuantumNode(node_id=node_id, node_type=NodeType.REPEATER))
+        self.network.add_channel(QuantumChannel(channel_id="c0", node_a="a", node_b="a"))
+        self.network.add_channel(QuantumChannel(channel_id="c1", node_a="a", node_b="b"))
+        
+        self.network.remove_node("a")
+        
+        self.assertIsNone(self.network.get_node("a"))
+        self.assertEqual(self.network.topology.channels, {})
+        self.assertEqual(self.network.get_node("b").channels, {})
+        self.assertEqual(self.network.get_network_stats()['channel_states']['idle'], 0)
+    
+    def test_channel_state_assignment(self):
+        """Test that assigning channel.state directly keeps the counts current"""
+        for i in range(2):
+            self.network.add_node(QuantumNode(node_id=f"node{i+1}", node_type=NodeType.REPEATER))
+        channel = QuantumChannel(channel_id="ch1", node_a="node1", node_b="node2")
+        self.network.add_channel(channel)
+        
+        channel.state = ChannelState.OFFLINE
+        
+        health = QuantumNetworkMonitor(self.network).get_network_health()
+        self.assertEqual(health['online_channels'], 0)
+        self.assertEqual(health['health_score'], 0.0)
+        self.assertEqual(pickle.loads(pickle.dumps(channel)), channel)
+        
+        self.network.remove_node("node2")
+        channel.state = ChannelState.IDLE
+        self.assertEqual(self.network.get_network_stats()['channel_states']['idle'], 0)
 
 
 if __name__ == '__main__':
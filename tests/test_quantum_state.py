@@ -5,6 +5,7 @@ Tests for quantum state preparation
 import unittest
 import numpy as np
 from qezk.quantum_state import QuantumStatePreparation
+from qezk.exceptions import QuantumStateError
 
 
 class TestQuantumStatePreparation(unittest.TestCase):
@@ -30,6 +31,32 @@ class TestQuantumStatePreparation(unittest.TestCase):
             norm = np.sqrt(np.sum(np.abs(state)**2))
             self.assertAlmostEqual(norm, 1.0, places=10)
     
+    def test_bell_states_match_circuit(self):
+        """Test precomputed Bell states against CNOT(H ⊗ I)|00⟩ plus a Pauli"""
+        prep = self.quantum_prep
+        phi_plus = prep.CNOT @ np.kron(prep.H, prep.I) @ np.array([1, 0, 0, 0], dtype=complex)
+        paulis = {'phi_plus': prep.I, 'phi_minus': prep.Z, 'psi_plus': prep.X, 'psi_minus': prep.Y}
+        
+        for state_type, pauli in paulis.items():
+            expected = np.kron(pauli, prep.I) @ phi_plus
+            np.testing.assert_allclose(prep.create_bell_state(state_type), expected, atol=1e-15)
+    
+    def test_bell_state_returns_copy(self):
+        """Test that callers can modify returned Bell states safely"""
+        state = self.quantum_prep.create_bell_state('phi_plus')
+        state[0] = 0
+        
+        self.assertNotEqual(self.quantum_prep.create_bell_state('phi_plus')[0], 0)
+    
+    def test_create_bell_states(self):
+        """Test batched Bell state creation"""
+        states = self.quantum_prep.create_bell_states(5, 'phi_minus')
+        
+        self.assertEqual(states.shape, (5, 4))
+        self.assertTrue(states.flags.writeable)
+        for state in states:
+            np.testing.assert_array_equal(state, self.quantum_prep.create_bell_state('phi_minus'))
+    
     def test_apply_gate(self):
         """Test applying gates to quantum states"""
         state = self.quantum_prep.create_bell_state('phi_plus')
@@ -41,6 +68,49 @@ class TestQuantumStatePreparation(unittest.TestCase):
         norm = np.sqrt(np.sum(np.abs(transformed)**2))
         self.assertAlmostEqual(norm, 1.0, places=10)
     
+    def test_apply_gate_matches_kron(self):
+        """Test gate application against the full tensor-product matrix"""
+        prep = self.quantum_prep
+        state = prep.normalize_state(np.array([0.1, 0.2 + 0.3j, -0.4, 0.5j], dtype=complex))
+        gate = prep.H @ prep.Y
+        
+        np.testing.assert_allclose(
+            prep.apply_gate(state, gate, qubit=0), np.kron(gate, prep.I) @ state, atol=1e-15
+        )
+        np.testing.assert_allclose(
+            prep.apply_gate(state, gate, qubit=1), np.kron(prep.I, gate) @ state, atol=1e-15
+        )
+    
+    def test_gates_are_shared_constants(self):
+        """Test that gates are allocated once and cannot be modified"""
+        other = QuantumStatePreparation()
+        
+        for name in ('H', 'X', 'Y', 'Z', 'I', 'CNOT'):
+            gate = getattr(self.quantum_prep, name)
+            self.assertIs(gate, getattr(other, name))
+            self.assertFalse(gate.flags.writeable)
+        np.testing.assert_allclose(
+            self.quantum_prep.H, np.array([[1, 1], [1, -1]]) / np.sqrt(2), atol=1e-15
+        )
+    
+    def test_apply_named_gate(self):
+        """Test the precomputed fixed gates against apply_gate"""
+        prep = self.quantum_prep
+        state = prep.normalize_state(np.array([0.1, 0.2 + 0.3j, -0.4, 0.5j], dtype=complex))
+        
+        for name in ('H', 'X', 'Y', 'Z', 'I'):
+            for qubit in (0, 1):
+                np.testing.assert_allclose(
+                    prep.apply_named_gate(state, name, qubit),
+                    prep.apply_gate(state, getattr(prep, name), qubit),
+                    atol=1e-15
+                )
+        
+        with self.assertRaises(QuantumStateError):
+            prep.apply_named_gate(state, 'S', 0)
+        with self.assertRaises(QuantumStateError):
+            prep.apply_named_gate(state, 'H', 2)
+    
     def test_normalize_state(self):
         """Test state normalization"""
         unnormalized = np.array([2, 0, 0, 2], dtype=complex)
@@ -49,6 +119,20 @@ class TestQuantumStatePreparation(unittest.TestCase):
         norm = np.sqrt(np.sum(np.abs(normalized)**2))
         self.assertAlmostEqual(norm, 1.0, places=10)
 
+    
+    def test_normalize_state_batch(self):
+        """Test normalizing many states at once"""
+        states = np.array([
+            [2, 0, 0, 2],
+            [0, 1j, 1, 0],
+            [0, 0, 0, 0],
+        ], dtype=complex)
+        normalized = self.quantum_prep.normalize_state(states)
+        
+        np.testing.assert_allclose(normalized[0], self.quantum_prep.normalize_state(states[0]))
+        np.testing.assert_allclose(np.linalg.norm(normalized[:2], axis=1), 1.0)
+        np.testing.assert_array_equal(normalized[2], states[2])
+
 
 if __name__ == '__main__':
     unittest.main()
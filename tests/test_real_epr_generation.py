@@ -8,7 +8,9 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import asyncio
 import unittest
+from unittest import mock
 import numpy as np
 from qezk import (
     RealEPRGenerator, PhysicalEPRSource, SimulationBackend
@@ -55,6 +57,33 @@ class TestRealEPRGeneration(unittest.TestCase):
         self.assertLessEqual(batch_metadata['verified_count'], 10)
         self.assertGreaterEqual(batch_metadata['verified_count'], 0)
     
+    def test_batch_epr_generation_array(self):
+        """Test that a batch is one (N, 4) array of the requested Bell state"""
+        epr_pairs, batch_metadata = self.generator.generate_epr_pairs(
+            num_pairs=6, state_type='psi_minus', verify_sample=2
+        )
+        
+        expected, _ = self.generator.generate_epr_pair('psi_minus', verify=False)
+        self.assertEqual(epr_pairs.shape, (6, 4))
+        np.testing.assert_allclose(epr_pairs, np.tile(expected, (6, 1)))
+        self.assertEqual(batch_metadata['verified_count'], 2)
+    
+    def test_iter_epr_pairs(self):
+        """Test streaming generation with periodic verification"""
+        pairs = list(self.generator.iter_epr_pairs(5, 'psi_plus', verify_every=2))
+        
+        self.assertEqual(len(pairs), 5)
+        for i, (state, metadata) in enumerate(pairs):
+            np.testing.assert_array_equal(state, self.backend.create_bell_state('psi_plus'))
+            self.assertEqual(metadata['verification'] is not None, i % 2 == 0)
+        
+        self.assertTrue(all(
+            metadata['verification'] is None
+            for _, metadata in self.generator.iter_epr_pairs(3)
+        ))
+        with self.assertRaises(EntanglementError):
+            next(self.generator.iter_epr_pairs(0))
+    
     def test_all_bell_states(self):
         """Test generation of all Bell state types"""
         for state_type in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']:
@@ -69,6 +98,10 @@ class TestRealEPRGeneration(unittest.TestCase):
         
         self.assertEqual(len(prover_particles), 5)
         self.assertEqual(len(verifier_particles), 5)
+        self.assertTrue(np.shares_memory(prover_particles, epr_pairs))
+        self.assertTrue(np.shares_memory(verifier_particles, epr_pairs))
+        self.assertFalse(prover_particles.flags.writeable)
+        self.assertFalse(verifier_particles.flags.writeable)
     
     def test_entanglement_monitoring(self):
         """Test entanglement quality monitoring"""
@@ -79,6 +112,32 @@ class TestRealEPRGeneration(unittest.TestCase):
         self.assertIn('total_pairs', quality_report)
         self.assertLessEqual(quality_report['sample_size'], 10)
     
+    def test_entanglement_monitoring_parallel(self):
+        """Test that parallel monitoring reports the same metrics"""
+        epr_pairs, _ = self.generator.generate_epr_pairs(num_pairs=10, verify_sample=0)
+        quality_report = self.generator.monitor_entanglement_quality(
+            epr_pairs, sample_size=6, parallel=True
+        )
+        
+        self.assertEqual(quality_report['sample_size'], 6)
+        self.assertAlmostEqual(quality_report['average_fidelity'], 1.0)
+        self.assertIsNotNone(quality_report['entanglement_rate'])
+    
+    def test_entanglement_monitoring_list_input(self):
+        """Test that a list of pairs is monitored like the equivalent array"""
+        source = PhysicalEPRSource(self.backend, seed=2)
+        epr_pairs = source._apply_noise_batch(self.backend.create_bell_states(8, 'phi_plus'))
+        
+        reports = []
+        for pairs in (epr_pairs, list(epr_pairs)):
+            np.random.seed(4)
+            generator = RealEPRGenerator(self.backend, seed=9)
+            reports.append(generator.monitor_entanglement_quality(pairs, sample_size=5))
+        
+        self.assertEqual(reports[0], reports[1])
+        self.assertLess(reports[0]['min_fidelity'], reports[0]['max_fidelity'])
+        self.assertLessEqual(reports[0]['entanglement_rate'], 1.0)
+    
     def test_physical_epr_source(self):
         """Test physical EPR source with noise"""
         source = PhysicalEPRSource(self.backend)
@@ -102,6 +161,115 @@ class TestRealEPRGeneration(unittest.TestCase):
         self.assertIn('accepted', quality_metrics)
         self.assertIn('average_fidelity', quality_metrics)
     
+    def test_quality_control_regeneration_counts(self):
+        """Test regeneration bookkeeping when pairs always or never pass"""
+        source = PhysicalEPRSource(self.backend)
+        
+        epr_pairs, metrics = source.generate_batch_with_quality_control(
+            num_pairs=4, min_fidelity=0.0, max_attempts=3
+        )
+        self.assertEqual(epr_pairs.shape, (4, 4))
+        self.assertEqual(metrics['total_generated'], 4)
+        self.assertEqual(metrics['rejected'], 0)
+        
+        epr_pairs, metrics = source.generate_batch_with_quality_control(
+            num_pairs=4, min_fidelity=1.5, max_attempts=3
+        )
+        np.testing.assert_allclose(np.linalg.norm(epr_pairs, axis=1), 1.0)
+        self.assertEqual(metrics['total_generated'], 12)
+        self.assertEqual(metrics['rejected'], 12)
+        self.assertEqual(metrics['accepted'], 4)
+        
+        with self.assertRaises(EntanglementError):
+            source.generate_batch_with_quality_control(num_pairs=4, max_attempts=0)
+    
+    def test_quality_control_parallel(self):
+        """Test that threaded quality control is seeded and keeps the bookkeeping"""
+        runs = [
+            PhysicalEPRSource(SimulationBackend(), seed=13).generate_batch_with_quality_control(
+                num_pairs=10, min_fidelity=0.9999, max_attempts=3, parallel=True
+            )
+            for _ in range(2)
+        ]
+        
+        (pairs_a, metrics_a), (pairs_b, metrics_b) = runs
+        np.testing.assert_array_equal(pairs_a, pairs_b)
+        self.assertEqual(metrics_a, metrics_b)
+        self.assertEqual(metrics_a['accepted'], 10)
+        self.assertEqual(metrics_a['regeneration_count'], metrics_a['rejected'])
+        self.assertGreaterEqual(metrics_a['total_generated'], 10)
+        self.assertLessEqual(metrics_a['rejected'], metrics_a['total_generated'])
+        np.testing.assert_allclose(np.linalg.norm(pairs_a, axis=1), 1.0)
+    
+    def test_quality_control_parallel_backend_once(self):
+        """Test that threaded quality control prepares the backend states once"""
+        backend = SimulationBackend()
+        source = PhysicalEPRSource(backend, seed=13)
+        
+        with mock.patch.object(backend, 'reset', wraps=backend.reset) as reset, \
+                mock.patch.object(backend, 'create_bell_states',
+                                  wraps=backend.create_bell_states) as create:
+            _, metrics = source.generate_batch_with_quality_control(
+                num_pairs=10, min_fidelity=0.9999, max_attempts=3, parallel=True
+            )
+        
+        self.assertGreater(metrics['rejected'], 0)
+        reset.assert_called_once_with()
+        create.assert_called_once_with(10, 'phi_plus')
+    
+    def test_quality_control_state_type(self):
+        """Test quality control scores pairs against the requested Bell state"""
+        source = PhysicalEPRSource(self.backend)
+        ideal, _ = self.generator.generate_epr_pair('psi_minus', verify=False)
+        
+        epr_pairs, metrics = source.generate_batch_with_quality_control(
+            num_pairs=8, min_fidelity=0.9, state_type='psi_minus'
+        )
+        
+        self.assertGreater(metrics['average_fidelity'], 0.9)
+        self.assertTrue(np.all(np.abs(epr_pairs @ ideal.conj())**2 > 0.9))
+    
+    def test_seeded_noise_is_reproducible(self):
+        """Test that a seeded source produces the same noisy batch"""
+        first = PhysicalEPRSource(SimulationBackend(), seed=11)
+        second = PhysicalEPRSource(SimulationBackend(), seed=11)
+        
+        pairs_a, metrics_a = first.generate_batch_with_quality_control(num_pairs=6)
+        pairs_b, metrics_b = second.generate_batch_with_quality_control(num_pairs=6)
+        
+        np.testing.assert_array_equal(pairs_a, pairs_b)
+        self.assertEqual(metrics_a, metrics_b)
+    
+    def test_noise_single_and_batch_agree(self):
+        """Test that per-state and batched noise draw the same complex samples"""
+        ideal, _ = self.generator.generate_epr_pair('psi_plus', verify=False)
+        single = PhysicalEPRSource(SimulationBackend(), seed=5)
+        batch = PhysicalEPRSource(SimulationBackend(), seed=5)
+        
+        expected = np.array([single._apply_noise(ideal) for _ in range(3)])
+        noisy = batch._apply_noise_batch(np.tile(ideal, (3, 1)))
+        
+        np.testing.assert_allclose(noisy, expected, atol=1e-15)
+        # Zero amplitudes stay zero and every state is renormalized
+        np.testing.assert_array_equal(noisy[:, [0, 3]], 0)
+        np.testing.assert_allclose(np.linalg.norm(noisy, axis=1), 1.0)
+        
+        typed = np.array([single._apply_noise(ideal, 'psi_plus') for _ in range(3)])
+        noisy = batch._apply_noise_batch(np.tile(ideal, (3, 1)), 'psi_plus')
+        np.testing.assert_allclose(noisy, typed, atol=1e-15)
+        np.testing.assert_array_equal(noisy[:, [0, 3]], 0)
+    
+    def test_typed_noise_draws_only_support(self):
+        """Test that typed noise draws two complex samples per Bell state"""
+        ideal, _ = self.generator.generate_epr_pair('phi_minus', verify=False)
+        source = PhysicalEPRSource(SimulationBackend(), seed=8)
+        reference = np.random.default_rng(8)
+        
+        source._apply_noise(ideal, 'phi_minus')
+        reference.standard_normal(4)
+        
+        self.assertEqual(source._rng.standard_normal(), reference.standard_normal())
+    
     def test_invalid_num_pairs(self):
         """Test error handling for invalid parameters"""
         with self.assertRaises(EntanglementError):
@@ -110,6 +278,36 @@ class TestRealEPRGeneration(unittest.TestCase):
         with self.assertRaises(EntanglementError):
             self.generator.generate_epr_pairs(num_pairs=-1)
     
+    def test_async_matches_sync(self):
+        """Test that async generation and verification give the sync results"""
+        results = []
+        for use_async in (False, True):
+            np.random.seed(11)
+            generator = RealEPRGenerator(SimulationBackend(), seed=5)
+            if use_async:
+                pairs, metadata = asyncio.run(generator.generate_epr_pairs_async(6, verify_sample=3))
+                verification = asyncio.run(generator.verify_entanglement_async(pairs[0]))
+            else:
+                pairs, metadata = generator.generate_epr_pairs(6, verify_sample=3)
+                verification = generator.verify_entanglement(pairs[0])
+            results.append((pairs, metadata, verification))
+        
+        (pairs, metadata, verification), (async_pairs, async_metadata, async_verification) = results
+        np.testing.assert_array_equal(async_pairs, pairs)
+        self.assertEqual(async_metadata, metadata)
+        self.assertEqual(async_verification, verification)
+    
+    def test_errors_wrapped_once(self):
+        """Test that backend failures surface as a single EntanglementError"""
+        with mock.patch.object(self.backend, 'measure_batch', side_effect=RuntimeError('offline')):
+            with self.assertRaises(EntanglementError) as ctx:
+                self.generator.generate_epr_pairs(num_pairs=3, verify_sample=1)
+            self.assertIsInstance(ctx.exception.__cause__, RuntimeError)
+            
+            with self.assertRaises(EntanglementError) as ctx:
+                self.generator.generate_epr_pair('phi_plus', verify=True)
+            self.assertIsInstance(ctx.exception.__cause__, RuntimeError)
+    
     def test_fidelity_calculation(self):
         """Test fidelity calculation"""
         state, metadata = self.generator.generate_epr_pair('phi_plus', verify=True)
@@ -118,6 +316,28 @@ class TestRealEPRGeneration(unittest.TestCase):
         fidelity = verification['fidelity']
         self.assertGreaterEqual(fidelity, 0)
         self.assertLessEqual(fidelity, 1)
+    
+    def test_fidelity_reference_cached(self):
+        """Test that reference Bell states are prepared once per type"""
+        phi_plus, _ = self.generator.generate_epr_pair('phi_plus', verify=False)
+        psi_minus, _ = self.generator.generate_epr_pair('psi_minus', verify=False)
+        
+        with mock.patch.object(self.backend, 'create_bell_state', wraps=self.backend.create_bell_state) as create:
+            for _ in range(3):
+                self.assertAlmostEqual(self.generator._calculate_fidelity(phi_plus, 'phi_plus'), 1.0)
+                self.assertAlmostEqual(self.generator._calculate_fidelity(psi_minus, 'phi_plus'), 0.0)
+            self.assertEqual(create.call_count, 1)
+    
+    def test_fidelity_batch_matches_single(self):
+        """Test batched fidelities against one call per state"""
+        source = PhysicalEPRSource(self.backend, seed=3)
+        states = source._apply_noise_batch(self.backend.create_bell_states(6, 'phi_plus'))
+        
+        for expected_type in ('phi_plus', 'psi_minus'):
+            np.testing.assert_allclose(
+                self.generator._calculate_fidelity_batch(states, expected_type),
+                [self.generator._calculate_fidelity(state, expected_type) for state in states]
+            )
 
 
 if __name__ == '__main__':
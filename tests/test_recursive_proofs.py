@@ -8,10 +8,15 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import hashlib
+import pickle
 import unittest
+from unittest import mock
+from dataclasses import replace
+import numpy as np
 from qezk import (
     QuantumEntanglementZK, RecursiveProver, ProofComposer,
-    NestedProofBuilder, ProofAggregator, RecursiveQEZK
+    NestedProofBuilder, ProofAggregator, RecursiveQEZK, RecursiveProof
 )
 from qezk.exceptions import ProtocolError, VerificationError
 
@@ -37,6 +42,32 @@ class TestRecursiveProofs(unittest.TestCase):
         self.assertGreaterEqual(proof_of_proof.chsh_value, 0.0)
         self.assertLessEqual(proof_of_proof.chsh_value, 3.0)
     
+    def test_proof_to_witness_layout(self):
+        """Test the witness bits: validity, 8 CHSH bits, 32 hash bits"""
+        recursive_prover = RecursiveProver(self.qezk)
+        proof = self.qezk.prove("I know the secret", "11010110", seed=42)
+        
+        witness = recursive_prover._proof_to_witness(proof)
+        
+        digest = hashlib.sha256(bytes(proof.prover_results[:16].tolist())).digest()
+        self.assertEqual(len(witness), 41)
+        self.assertEqual(witness[0], '1' if proof.is_valid else '0')
+        self.assertEqual(witness[1:9], recursive_prover._float_to_bits(proof.chsh_value, 8))
+        self.assertEqual(witness[9:], ''.join(format(b, '08b') for b in digest[:4]))
+        
+        edge = recursive_prover._proof_to_witness(replace(proof, is_valid=False, chsh_value=3.5))
+        self.assertEqual(edge[:9], '011111111')
+        self.assertEqual(edge[9:], witness[9:])
+    
+    def test_float_to_bits(self):
+        """Test CHSH bit strings for the table widths and others"""
+        prover = RecursiveProver(self.qezk)
+        
+        self.assertEqual(prover._float_to_bits(3.0, 8), '11111111')
+        self.assertEqual(prover._float_to_bits(-1.0, 8), '00000000')
+        self.assertEqual(prover._float_to_bits(1.5, 4), format(int(0.5 * 15), '04b'))
+        self.assertEqual(prover._float_to_bits(2.0, 6), format(int(2.0 / 3.0 * 63), '06b'))
+    
     def test_proof_composer(self):
         """Test proof composer"""
         composer = ProofComposer(self.qezk)
@@ -53,6 +84,20 @@ class TestRecursiveProofs(unittest.TestCase):
         self.assertIsNotNone(composite)
         self.assertEqual(composite.statement, "Composite")
     
+    def test_aggregate_proofs_to_witness(self):
+        """Test the composite witness layout, including a proof with fewer than 8 results"""
+        composer = ProofComposer(self.qezk)
+        proof = self.qezk.prove("Statement", "11010110", seed=42)
+        short = replace(proof, is_valid=False, prover_results=np.array([1, 0, 1], dtype=np.uint8))
+        proofs = [proof, short]
+        
+        witness = composer._aggregate_proofs_to_witness(proofs)
+        
+        digest = hashlib.sha256(bytes(proof.prover_results[:8].tolist() + [1, 0, 1])).digest()
+        self.assertEqual(len(witness), 2 + 2 * 4 + 32)
+        self.assertEqual(witness[:2], ('1' if proof.is_valid else '0') + '0')
+        self.assertEqual(witness[10:], ''.join(format(b, '08b') for b in digest[:4]))
+    
     def test_proof_composer_empty(self):
         """Test proof composer with empty list"""
         composer = ProofComposer(self.qezk)
@@ -72,6 +117,35 @@ class TestRecursiveProofs(unittest.TestCase):
         self.assertEqual(nested_proof.recursion_depth, 2)
         self.assertEqual(len(nested_proof.inner_proofs), 2)
         self.assertIsNotNone(nested_proof.outer_proof)
+        
+        proofs = nested_proof.inner_proofs + [nested_proof.outer_proof]
+        self.assertEqual(nested_proof.is_valid, all(p.is_valid for p in proofs))
+    
+    def test_nested_proof_witness_once_per_proof(self):
+        """Test that each inner proof is encoded into a witness exactly once"""
+        builder = NestedProofBuilder(self.qezk)
+        prover = builder.recursive_prover
+        
+        with mock.patch.object(prover, '_proof_to_witness', wraps=prover._proof_to_witness) as encode:
+            nested_proof = builder.build_nested_proof("test", "11010110", depth=3, seed=42)
+        
+        encoded = [call.args[0] for call in encode.call_args_list]
+        self.assertEqual(len(encoded), 3)
+        for proof, inner_proof in zip(encoded, nested_proof.inner_proofs):
+            self.assertIs(proof, inner_proof)
+    
+    def test_recursive_proof_slots(self):
+        """Test that recursive proofs are slotted and keep their defaults"""
+        proof = self.qezk.prove("Statement", "11010110", seed=42)
+        recursive_proof = RecursiveProof([proof], proof, 1, proof.is_valid)
+        
+        self.assertFalse(hasattr(recursive_proof, '__dict__'))
+        self.assertEqual(recursive_proof.metadata, {})
+        self.assertIsNot(recursive_proof.metadata, RecursiveProof([], proof, 0, True).metadata)
+        
+        restored = pickle.loads(pickle.dumps(recursive_proof))
+        self.assertEqual(restored.recursion_depth, 1)
+        self.assertEqual(restored.outer_proof.chsh_value, proof.chsh_value)
     
     def test_nested_proof_invalid_depth(self):
         """Test nested proof with invalid depth"""
@@ -97,6 +171,45 @@ class TestRecursiveProofs(unittest.TestCase):
         self.assertIn('num_proofs', metadata)
         self.assertEqual(metadata['num_proofs'], 3)
     
+    def test_packed_proofs(self):
+        """Test that witnesses are built from outcomes, not the packed storage"""
+        aggregator = ProofAggregator(self.qezk)
+        packed_qezk = QuantumEntanglementZK(num_epr_pairs=self.qezk.num_epr_pairs,
+                                            pack_results=True)
+        proofs = [self.qezk.prove(f"Statement {i}", "11010110", seed=42 + i) for i in range(2)]
+        packed_proofs = [packed_qezk.prove(f"Statement {i}", "11010110", seed=42 + i) for i in range(2)]
+        
+        self.assertEqual(
+            aggregator.composer._aggregate_proofs_to_witness(packed_proofs),
+            aggregator.composer._aggregate_proofs_to_witness(proofs)
+        )
+        self.assertEqual(
+            RecursiveProver(self.qezk)._proof_to_witness(packed_proofs[0]),
+            RecursiveProver(self.qezk)._proof_to_witness(proofs[0])
+        )
+        
+        aggregated, _ = aggregator.aggregate_proofs(packed_proofs, verify_all=False, seed=50)
+        expected, _ = aggregator.aggregate_proofs(proofs, verify_all=False, seed=50)
+        self.assertEqual(aggregated.chsh_value, expected.chsh_value)
+    
+    def test_proof_aggregator_metadata(self):
+        """Test aggregation metadata for a mix of valid and invalid proofs"""
+        aggregator = ProofAggregator(self.qezk)
+        proof = self.qezk.prove("Statement", "11010110", seed=42)
+        proofs = [
+            replace(proof, is_valid=True, chsh_value=2.5),
+            replace(proof, is_valid=False, chsh_value=1.0),
+            replace(proof, is_valid=True, chsh_value=2.1),
+        ]
+        
+        _, metadata = aggregator.aggregate_proofs(proofs, verify_all=False, seed=50)
+        
+        self.assertEqual(metadata['valid_count'], 2)
+        self.assertIs(metadata['all_valid'], False)
+        self.assertAlmostEqual(metadata['avg_chsh'], 5.6 / 3)
+        with self.assertRaisesRegex(VerificationError, r"2/3 \(first invalid: proof 1\)"):
+            aggregator.aggregate_proofs(proofs, verify_all=True)
+    
     def test_proof_aggregator_empty(self):
         """Test proof aggregator with empty list"""
         aggregator = ProofAggregator(self.qezk)
@@ -122,6 +235,23 @@ class TestRecursiveProofs(unittest.TestCase):
         
         self.assertEqual(len(aggregated), 2)
     
+    def test_batch_aggregate_parallel(self):
+        """Test that process-pool aggregation matches the sequential result"""
+        aggregator = ProofAggregator(self.qezk)
+        batches = [
+            [self.qezk.prove("Statement 1", "11010110", seed=42)],
+            [self.qezk.prove("Statement 2", "10101010", seed=43),
+             self.qezk.prove("Statement 3", "11111111", seed=44)],
+        ]
+        
+        sequential = aggregator.batch_aggregate(batches, seed=50)
+        parallel = aggregator.batch_aggregate(batches, seed=50, parallel=True, max_workers=2)
+        
+        self.assertEqual([p.statement for p in parallel], ["Batch 1", "Batch 2"])
+        for expected, proof in zip(sequential, parallel):
+            np.testing.assert_array_equal(proof.prover_results, expected.prover_results)
+            self.assertEqual(proof.chsh_value, expected.chsh_value)
+    
     def test_recursive_qezk(self):
         """Test recursive QE-ZK"""
         recursive_qezk = RecursiveQEZK(self.qezk)
@@ -0,0 +1,63 @@
+"""
+Tests for JSON serialization
+"""
+
+import unittest
+from unittest import mock
+import numpy as np
+from qezk import serialization
+
+
+class TestSerialization(unittest.TestCase):
+    """Test cases for serialization helpers"""
+    
+    def test_round_trip(self):
+        """Test that plain objects round-trip unchanged"""
+        obj = {'statement': 'test', 'count': 3, 'values': [0, 1, 1], 'ok': True}
+        self.assertEqual(serialization.loads(serialization.dumps(obj)), obj)
+    
+    def test_numpy_values(self):
+        """Test that NumPy arrays and scalars serialize as lists and numbers"""
+        obj = {'results': np.array([0, 1, 1], dtype=np.uint8), 'chsh': np.float64(2.5)}
+        self.assertEqual(
+            serialization.loads(serialization.dumps(obj)),
+            {'results': [0, 1, 1], 'chsh': 2.5}
+        )
+    
+    def test_indent(self):
+        """Test pretty-printed output"""
+        self.assertIn('\n', serialization.dumps({'a': 1}, indent=True))
+    
+    def test_backends_agree(self):
+        """Test that the orjson and standard library backends encode alike"""
+        obj = {'chsh': float('nan'), 'inf': np.float64('inf'),
+               'values': np.array([1.5, np.nan]), 'big': 2**70}
+        expected = {'chsh': None, 'inf': None, 'values': [1.5, None], 'big': 2**70}
+        
+        self.assertEqual(serialization.loads(serialization.dumps(obj)), expected)
+        with mock.patch.object(serialization, 'orjson', None):
+            self.assertEqual(serialization.loads(serialization.dumps(obj)), expected)
+            self.assertEqual(serialization.loads(serialization.dumps(obj, indent=True)), expected)
+    
+    def test_standard_library_fallback(self):
+        """Test the standard library backend used when orjson is not installed"""
+        obj = {'results': np.array([0, 1], dtype=np.uint8), 'chsh': np.float64(2.5), 1: 'a'}
+        
+        with mock.patch.object(serialization, 'orjson', None):
+            self.assertEqual(
+                serialization.loads(serialization.dumps(obj)),
+                {'results': [0, 1], 'chsh': 2.5, '1': 'a'}
+            )
+            with self.assertRaises(serialization.JSONDecodeError):
+                serialization.loads('{not json')
+            with self.assertRaises(TypeError):
+                serialization.dumps({'obj': object()})
+    
+    def test_invalid_json(self):
+        """Test that malformed input raises JSONDecodeError"""
+        with self.assertRaises(serialization.JSONDecodeError):
+            serialization.loads('{not json')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for witness encoder
+"""
+
+import hashlib
+import unittest
+import numpy as np
+from qezk.quantum_state import QuantumStatePreparation
+from qezk.witness_encoder import WitnessEncoder
+
+
+class TestWitnessEncoder(unittest.TestCase):
+    """Test cases for WitnessEncoder"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.quantum_prep = QuantumStatePreparation()
+        self.encoder = WitnessEncoder(self.quantum_prep)
+    
+    def test_compose_circuit_is_unitary(self):
+        """Test that the composed circuit is a 2x2 unitary"""
+        gate_sequence = self.encoder.witness_to_quantum_circuit("1101011010110101")
+        unitary = self.encoder.compose_circuit(gate_sequence)
+        
+        self.assertEqual(unitary.shape, (2, 2))
+        np.testing.assert_allclose(unitary @ unitary.conj().T, np.eye(2), atol=1e-12)
+    
+    def test_apply_circuit_batch_matches_apply_circuit(self):
+        """Test that batched circuit application matches per-state application"""
+        gate_sequence = self.encoder.witness_to_quantum_circuit("1101011010110101")
+        states = np.array([
+            self.quantum_prep.create_bell_state(state_type)
+            for state_type in ['phi_plus', 'phi_minus', 'psi_plus', 'psi_minus']
+        ])
+        
+        batch = self.encoder.apply_circuit_batch(states, gate_sequence)
+        
+        for state, transformed in zip(states, batch):
+            np.testing.assert_allclose(
+                transformed, self.encoder.apply_circuit(state, gate_sequence), atol=1e-12
+            )
+
+    
+    def test_statement_to_bases_follows_hash_bits(self):
+        """Test that each basis comes from bits 2*(i % 4) of hash byte i % 32"""
+        statement = "I know the secret"
+        statement_hash = hashlib.sha256(statement.encode()).digest()
+        basis_map = {0: 'Z', 1: 'X', 2: 'Y', 3: 'Z'}
+        
+        for num_measurements in (1, 31, 32, 33, 100):
+            expected = [
+                basis_map[(statement_hash[i % 32] >> (2 * (i % 4))) & 0b11]
+                for i in range(num_measurements)
+            ]
+            self.assertEqual(self.encoder.statement_to_bases(statement, num_measurements), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()